@@ -0,0 +1,83 @@
+"""
+Compare JSON codecs on ticket-shaped payloads.
+
+Reports CPU seconds per MB for decoding and encoding a search-sized response
+with every codec installed, plus Ticket.from_dict throughput on raw bytes.
+
+Usage:
+    python benchmarks/bench_codec.py [--tickets 5000] [--repeat 5]
+"""
+import argparse
+import random
+import time
+
+from teamdynamix.tdnext.tickets import Ticket
+from teamdynamix.utils.codec import available_codecs, get_codec
+
+
+def make_tickets(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    statuses = ["New", "Open", "In Process", "Resolved", "Closed"]
+    return [
+        {
+            "ID": 1_000_000 + i,
+            "AppID": 122,
+            "TypeID": 4713,
+            "Title": f"Ticket {i}: printer on floor {rng.randint(1, 5)} is jammed",
+            "Description": "Lorem ipsum dolor sit amet " * rng.randint(5, 40),
+            "StatusID": rng.randint(28549, 28555),
+            "StatusName": rng.choice(statuses),
+            "PriorityID": 864,
+            "AccountID": 8811,
+            "RequestorUid": "5f0b1c1e-1d2b-4a51-9d5c-3f0c5b8d8f%02d" % (i % 100),
+            "CreatedDate": "2024-07-01T15:04:05.123Z",
+            "ModifiedDate": "2024-07-02T09:10:11.456Z",
+            "RespondByDate": "2024-07-01T19:04:05Z",
+            "IsSlaViolated": rng.random() < 0.1,
+            "Attributes": [
+                {"ID": 501 + a, "Name": f"Attribute {a}", "Value": str(rng.randint(1, 9999)),
+                 "ValueText": f"Choice {a}"}
+                for a in range(rng.randint(0, 6))
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+def cpu_seconds(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.process_time()
+        func()
+        best = min(best, time.process_time() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tickets", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payload = make_tickets(args.tickets)
+    print(f"{'codec':<10}{'MB':>8}{'decode s/MB':>14}{'encode s/MB':>14}{'from_dict/s':>14}")
+    for name, installed in available_codecs().items():
+        if not installed:
+            print(f"{name:<10}{'not installed':>22}")
+            continue
+        codec = get_codec(name)
+        raw = codec.dumps(payload)
+        megabytes = len(raw) / 1_000_000
+
+        decode = cpu_seconds(lambda: codec.loads(raw), args.repeat)
+        encode = cpu_seconds(lambda: codec.dumps(payload), args.repeat)
+        rows = [codec.dumps(t) for t in payload]
+        client = type("Client", (), {"codec": codec})()
+        build = cpu_seconds(lambda: [Ticket.from_dict(client, r) for r in rows], args.repeat)
+
+        print(f"{name:<10}{megabytes:>8.2f}{decode / megabytes:>14.4f}"
+              f"{encode / megabytes:>14.4f}{len(rows) / build:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Compare HTTP transports on latency, throughput and open sockets.
+
+Runs the same burst of concurrent ticket GETs through each transport and
+samples how many sockets the process holds while it runs. By default the
+calls go to the local stub server (HTTP/1.1 only, so httpx cannot multiplex
+there); pass --base-url with BASE_URL/TDX_* credentials in the environment
+to measure HTTP/2 against a real instance.
+
+Usage:
+    python benchmarks/bench_transports.py [--calls 400] [--concurrency 32] [--latency-ms 30]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+import requests  # noqa: E402
+from requests.adapters import HTTPAdapter  # noqa: E402
+
+from scripts import stub_server  # noqa: E402
+from teamdynamix.http_client import TeamDynamix  # noqa: E402
+from teamdynamix.transport import HttpxTransport, RequestsTransport  # noqa: E402
+from teamdynamix.utils.concurrency import map_concurrently  # noqa: E402
+
+
+def open_sockets() -> int:
+    """Sockets held by this process (Linux /proc; -1 elsewhere)."""
+    try:
+        fds = os.listdir("/proc/self/fd")
+    except OSError:
+        return -1
+    count = 0
+    for fd in fds:
+        try:
+            count += os.readlink(f"/proc/self/fd/{fd}").startswith("socket:")
+        except OSError:
+            pass
+    return count
+
+
+class SocketSampler(threading.Thread):
+    def __init__(self, interval: float = 0.005):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = 0
+        self._done = threading.Event()
+
+    def run(self) -> None:
+        while not self._done.is_set():
+            self.peak = max(self.peak, open_sockets())
+            time.sleep(self.interval)
+
+    def stop(self) -> int:
+        self._done.set()
+        self.join()
+        return self.peak
+
+
+def transports(concurrency: int):
+    yield "requests", lambda: RequestsTransport()
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=concurrency)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    yield "requests.Session", lambda: RequestsTransport(session)
+    for name, http2 in (("httpx http/1.1", False), ("httpx http/2", True)):
+        # Build one up front: a missing httpx or h2 only surfaces on construction
+        try:
+            HttpxTransport(http2=http2).close()
+        except ImportError as e:
+            print(f"{name:<18}skipped: {e}")
+            continue
+        yield name, lambda http2=http2: HttpxTransport(http2=http2, max_connections=concurrency)
+
+
+def run(name, make_transport, base_url, credentials, ticket_path, calls, concurrency):
+    transport = make_transport()
+    client = TeamDynamix(base_url=base_url, transport=transport, use_environment=False,
+                         **credentials)
+    client.get(ticket_path)  # authenticate and warm up outside the measurement
+    baseline = open_sockets()
+
+    latencies = []
+
+    def call(_):
+        started = time.perf_counter()
+        client.get(ticket_path)
+        return time.perf_counter() - started
+
+    sampler = SocketSampler()
+    sampler.start()
+    started = time.perf_counter()
+    errors = 0
+    for _, latency, error in map_concurrently(call, range(calls), concurrency):
+        if error is None:
+            latencies.append(latency)
+        else:
+            errors += 1
+    elapsed = time.perf_counter() - started
+    peak = sampler.stop()
+    transport.close()
+
+    latencies.sort()
+    pick = lambda p: latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000 if latencies else 0
+    print(f"{name:<18}{calls / elapsed:>10.1f}{pick(0.5):>10.1f}{pick(0.95):>10.1f}"
+          f"{max(peak - baseline, 0):>10}{errors:>8}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare HTTP transports")
+    parser.add_argument("--calls", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--latency-ms", type=float, default=30, help="Stub server latency")
+    parser.add_argument("--base-url", default=None, help="Real instance instead of the stub")
+    parser.add_argument("--ticket", default=None, help="Ticket path to GET, e.g. api/122/tickets/555")
+    args = parser.parse_args()
+
+    if args.base_url:
+        base_url = args.base_url
+        credentials = {"username": os.getenv("TDX_USERNAME"), "password": os.getenv("TDX_PASSWORD"),
+                       "beid": os.getenv("BEID"), "web_services_key": os.getenv("WEB_SERVICES_KEY")}
+        ticket_path = args.ticket or "api/applications"
+    else:
+        server = stub_server.serve(latency_ms=args.latency_ms)
+        base_url = stub_server.base_url(server)
+        credentials = {"username": "bench", "password": "bench"}
+        seed = TeamDynamix(base_url=base_url, use_environment=False, **credentials)
+        ticket = seed.tickets.create(AppID=122, TypeID=4713, Title="Benchmark", AccountID=1,
+                                     StatusID=28549, PriorityID=864, RequestorUid="u",
+                                     Description="d", validate=False)
+        ticket_path = f"api/122/tickets/{ticket.ID}"
+
+    print(f"{args.calls} GETs, {args.concurrency} in flight, against {base_url}")
+    print(f"{'transport':<18}{'calls/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'sockets':>10}{'errors':>8}")
+    for name, make_transport in transports(args.concurrency):
+        run(name, make_transport, base_url, credentials, ticket_path, args.calls, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
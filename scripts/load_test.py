@@ -0,0 +1,273 @@
+"""
+Non-interactive load generator for ticket creation.
+
+Pre-generates N ticket payloads, then drives ``TicketManager.create`` at a
+target rate or concurrency and reports throughput and latency percentiles.
+Payloads come from a deterministic offline template (the default) or from
+OpenAI, several tickets per completion call.
+
+Usage:
+    python scripts/stub_server.py &
+    python scripts/load_test.py --base-url http://127.0.0.1:8000/TDWebApi \\
+        --tickets 500 --concurrency 16 --no-client-rate-limit
+
+    # Sandbox instance, credentials from .env, 1 ticket/second:
+    python scripts/load_test.py --tickets 60 --rate 1 --generator openai
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from teamdynamix.http_client import TeamDynamix  # noqa: E402
+from teamdynamix.tdnext.tickets import TicketManager  # noqa: E402
+from teamdynamix.utils.concurrency import map_concurrently  # noqa: E402
+
+# Status IDs used by create_ticket.py; weights favour new tickets.
+DEFAULT_STATUS_MIX = "28549:70,28550:15,28551:10,28555:5"
+DEFAULT_TYPE_MIX = "4713:1"
+
+CATEGORIES = {
+    "Hardware Issues": [("Laptop will not power on", "The laptop in {room} shows no lights when the charger is connected.")],
+    "Software Problems": [("{app} crashes on launch", "{app} closes immediately after the splash screen since this morning's update.")],
+    "Network Connectivity": [("No wifi in {room}", "Devices in {room} can see the network but fail to get an address.")],
+    "Account Access": [("Locked out of account", "I was locked out after resetting my password and cannot sign in to {app}.")],
+    "Email Issues": [("Emails stuck in outbox", "Messages sent from {app} stay in the outbox with no error.")],
+    "Printer Problems": [("Printer in {room} is jammed", "The printer in {room} reports a paper jam on tray {tray}.")],
+}
+ROOMS = ["STC 101", "MC 250", "SMI 330", "ROM 120", "HIN 201"]
+APPS = ["Outlook", "Canvas", "Teams", "Excel", "Zoom"]
+
+
+@dataclass
+class LoadReport:
+    """Outcome of a load run."""
+    latencies: List[float] = field(default_factory=list)
+    errors: Counter = field(default_factory=Counter)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def failed(self) -> int:
+        return sum(self.errors.values())
+
+    def percentile(self, p: float) -> float:
+        """Nearest-rank percentile of successful call latencies, in seconds."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, max(0, int(round(p / 100 * len(ordered))) - 1))]
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals suitable for logging or metrics."""
+        return {
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "elapsed": round(self.elapsed, 3),
+            "throughput_per_second": round(self.succeeded / self.elapsed, 2) if self.elapsed else 0.0,
+            "latency_ms": {
+                f"p{p}": round(self.percentile(p) * 1000, 1) for p in (50, 90, 95, 99)
+            } | {"max": round(max(self.latencies, default=0) * 1000, 1)},
+            "errors": dict(self.errors),
+        }
+
+
+def parse_mix(spec: str) -> List[Tuple[int, float]]:
+    """Parse ``"28549:70,28550:30"`` into (ID, weight) pairs."""
+    mix = []
+    for part in spec.split(","):
+        value, _, weight = part.strip().partition(":")
+        mix.append((int(value), float(weight or 1)))
+    if not mix or sum(w for _, w in mix) <= 0:
+        raise ValueError(f"Invalid mix: {spec}")
+    return mix
+
+
+def _pick(rng: random.Random, mix: List[Tuple[int, float]]) -> int:
+    return rng.choices([v for v, _ in mix], weights=[w for _, w in mix])[0]
+
+
+def _base_payload(rng: random.Random, args: argparse.Namespace, status_mix, type_mix) -> Dict[str, Any]:
+    return {
+        "AppID": args.app_id,
+        "TypeID": _pick(rng, type_mix),
+        "StatusID": _pick(rng, status_mix),
+        "AccountID": args.account_id,
+        "PriorityID": args.priority_id,
+        "RequestorUid": args.requestor_uid,
+        "SourceID": args.source_id,
+    }
+
+
+def template_payloads(args: argparse.Namespace, status_mix, type_mix) -> List[Dict[str, Any]]:
+    """Deterministic payloads from local templates; the same seed gives the same tickets."""
+    rng = random.Random(args.seed)
+    payloads = []
+    for i in range(args.tickets):
+        category = rng.choice(list(CATEGORIES))
+        title, description = rng.choice(CATEGORIES[category])
+        values = {"room": rng.choice(ROOMS), "app": rng.choice(APPS), "tray": rng.randint(1, 4)}
+        payloads.append({
+            **_base_payload(rng, args, status_mix, type_mix),
+            "Title": f"[load {i}] " + title.format(**values),
+            "Description": description.format(**values),
+        })
+    return payloads
+
+
+def _openai_batch(count: int, seed: int) -> List[Tuple[str, str]]:
+    from openai import OpenAI
+
+    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    response = client.chat.completions.create(
+        model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+        messages=[{"role": "user", "content": (
+            f"Generate {count} distinct, realistic IT support tickets as a JSON object "
+            '{"tickets": [{"title": "...", "description": "..."}]}. Plain text only.'
+        )}],
+        response_format={"type": "json_object"},
+        temperature=0.7,
+        seed=seed,
+    )
+    tickets = json.loads(response.choices[0].message.content)["tickets"]
+    return [(t["title"], t["description"]) for t in tickets if t.get("title")]
+
+
+def openai_payloads(args: argparse.Namespace, status_mix, type_mix) -> List[Dict[str, Any]]:
+    """
+    Payloads with OpenAI-written titles and descriptions.
+
+    Generates ``--batch-size`` tickets per completion call and runs several
+    calls at once; any shortfall is filled from the offline templates.
+    """
+    batches = [min(args.batch_size, args.tickets - start)
+               for start in range(0, args.tickets, args.batch_size)]
+    content: List[Tuple[str, str]] = []
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(_openai_batch, size, args.seed + i) for i, size in enumerate(batches)]
+        for future in futures:
+            try:
+                content.extend(future.result())
+            except Exception as e:
+                print(f"Content generation batch failed: {e}", file=sys.stderr)
+
+    payloads = template_payloads(args, status_mix, type_mix)
+    for payload, (title, description) in zip(payloads, content):
+        payload["Title"], payload["Description"] = title, description
+    return payloads
+
+
+def paced(payloads: Iterable[Dict[str, Any]], rate: Optional[float]) -> Iterator[Dict[str, Any]]:
+    """Release payloads on a fixed schedule of ``rate`` per second (unpaced when None)."""
+    started = time.perf_counter()
+    for i, payload in enumerate(payloads):
+        if rate:
+            delay = started + i / rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        yield payload
+
+
+def run(manager: TicketManager, payloads: List[Dict[str, Any]], concurrency: int = 8,
+        rate: Optional[float] = None) -> LoadReport:
+    """
+    Create every payload and time each call.
+
+    Args:
+        manager: TicketManager to drive
+        payloads: Keyword arguments for ``TicketManager.create``
+        concurrency: Maximum calls in flight
+        rate: Target calls per second; None sends as fast as ``concurrency`` allows
+
+    Against a stand-in server, give the manager's client ``rate_limit=False``
+    or the client's own rate limiter is what gets measured.
+    """
+    def timed(payload: Dict[str, Any]) -> float:
+        started = time.perf_counter()
+        manager.create(**payload)
+        return time.perf_counter() - started
+
+    report = LoadReport()
+    started = time.perf_counter()
+    for _, latency, error in map_concurrently(timed, paced(payloads, rate), concurrency):
+        if error is None:
+            report.latencies.append(latency)
+        else:
+            report.errors[f"{type(error).__name__}: {str(error)[:80]}"] += 1
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Create tickets under load and report latency")
+    parser.add_argument("--base-url", default=os.getenv("BASE_URL"))
+    parser.add_argument("--username", default=os.getenv("TDX_USERNAME") or "load-test")
+    parser.add_argument("--password", default=os.getenv("TDX_PASSWORD") or "load-test")
+    parser.add_argument("--app-id", type=int, default=int(os.getenv("TDX_APP_ID") or 122))
+    parser.add_argument("--requestor-uid", default=os.getenv("REQUESTOR_UID") or "00000000-0000-0000-0000-000000000001")
+    parser.add_argument("--account-id", type=int, default=8811)
+    parser.add_argument("--priority-id", type=int, default=864)
+    parser.add_argument("--source-id", type=int, default=1648)
+    parser.add_argument("--tickets", type=int, default=100, help="Number of tickets to create")
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum calls in flight")
+    parser.add_argument("--rate", type=float, default=None, help="Target tickets per second")
+    parser.add_argument("--status-mix", default=DEFAULT_STATUS_MIX, help="StatusID:weight,...")
+    parser.add_argument("--type-mix", default=DEFAULT_TYPE_MIX, help="TypeID:weight,...")
+    parser.add_argument("--generator", choices=["template", "openai"], default="template")
+    parser.add_argument("--batch-size", type=int, default=20, help="Tickets per OpenAI call")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--no-client-rate-limit", dest="client_rate_limit", action="store_false",
+                        help="Bypass the client's rate limiter (stand-in server only)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+    args = build_parser().parse_args(argv)
+    if not args.base_url:
+        raise SystemExit("--base-url (or BASE_URL) is required")
+
+    status_mix, type_mix = parse_mix(args.status_mix), parse_mix(args.type_mix)
+    generate = openai_payloads if args.generator == "openai" else template_payloads
+    generated = time.perf_counter()
+    payloads = generate(args, status_mix, type_mix)
+    generated = time.perf_counter() - generated
+
+    client = TeamDynamix(base_url=args.base_url, username=args.username,
+                         password=args.password, use_environment=False,
+                         rate_limit=args.client_rate_limit)
+    report = run(client.tickets, payloads, concurrency=args.concurrency, rate=args.rate)
+
+    summary = {"generation_seconds": round(generated, 3), **report.summary(),
+               "status_mix": dict(Counter(p["StatusID"] for p in payloads)),
+               "type_mix": dict(Counter(p["TypeID"] for p in payloads))}
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        latency = summary["latency_ms"]
+        print(f"Created {report.succeeded}/{len(payloads)} tickets in {summary['elapsed']}s "
+              f"({summary['throughput_per_second']}/s), {report.failed} failed")
+        print("Latency ms: " + ", ".join(f"{k}={v}" for k, v in latency.items()))
+        for error, count in report.errors.most_common(5):
+            print(f"  {count} x {error}")
+    return summary
+
+
+if __name__ == "__main__":
+    main()
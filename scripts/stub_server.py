@@ -0,0 +1,260 @@
+"""
+Local stand-in for the TeamDynamix Web API.
+
+Serves enough of the API to exercise the client without a real instance:
+authentication, ticket create/get/edit/search, feed, contacts, assets and
+tasks. Tickets live in memory. Latency, jitter and an error rate can be
+injected to see how the client behaves under load.
+
+Usage:
+    python scripts/stub_server.py --port 8000 --latency-ms 40
+    # then point the client at http://127.0.0.1:8000/TDWebApi
+"""
+import argparse
+import gzip
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import jwt
+
+STATUS_NAMES = {
+    28549: "New", 28550: "Open", 28551: "In Process", 28552: "Resolved",
+    28553: "Closed", 28554: "Cancelled", 28555: "On Hold",
+}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class StubState:
+    """In-memory tickets shared by every request handler."""
+
+    def __init__(self, latency_ms: float = 0, jitter_ms: float = 0,
+                 error_rate: float = 0.0, seed: Optional[int] = None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.tickets: Dict[int, Dict[str, Any]] = {}
+        self.feeds: Dict[int, List[Dict[str, Any]]] = {}
+        self.ids = itertools.count(100000)
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def token(self) -> str:
+        expires = datetime.now(timezone.utc) + timedelta(hours=24)
+        return jwt.encode({"exp": int(expires.timestamp()), "sub": "stub"},
+                          "teamdynamix-stub-server-signing-key", algorithm="HS256")
+
+
+Route = Tuple[str, "re.Pattern[str]", Callable[..., Tuple[int, Any]]]
+ROUTES: List[Route] = []
+
+
+def route(method: str, pattern: str):
+    def register(handler):
+        ROUTES.append((method, re.compile(f"^{pattern}$"), handler))
+        return handler
+    return register
+
+
+@route("POST", r"api/auth(/login)?")
+@route("POST", r"api/auth/loginadmin")
+def login(state: StubState, body: Any, query: Dict[str, str]):
+    return 200, state.token()
+
+
+@route("POST", r"api/(?P<app>\d+)/tickets")
+def create_ticket(state: StubState, body: Any, query: Dict[str, str], app: str):
+    missing = [f for f in ("TypeID", "Title", "AccountID", "StatusID", "PriorityID", "RequestorUid")
+               if body.get(f) in (None, "")]
+    if missing:
+        return 400, {"Message": f"Missing required fields: {', '.join(missing)}"}
+    with state.lock:
+        ticket_id = next(state.ids)
+        ticket = {
+            **body, "ID": ticket_id, "AppID": int(app),
+            "StatusName": STATUS_NAMES.get(body["StatusID"], "Unknown"),
+            "CreatedDate": _now(), "ModifiedDate": _now(),
+            "Uri": f"api/{app}/tickets/{ticket_id}",
+        }
+        state.tickets[ticket_id] = ticket
+    return 200, ticket
+
+
+@route("GET", r"api/(?P<app>\d+)/tickets/(?P<ticket>\d+)")
+def get_ticket(state: StubState, body: Any, query: Dict[str, str], app: str, ticket: str):
+    found = state.tickets.get(int(ticket))
+    return (200, found) if found else (404, {"Message": "Ticket not found"})
+
+
+@route("POST", r"api/(?P<app>\d+)/tickets/(?P<ticket>\d+)")
+def edit_ticket(state: StubState, body: Any, query: Dict[str, str], app: str, ticket: str):
+    with state.lock:
+        found = state.tickets.get(int(ticket))
+        if found is None:
+            return 404, {"Message": "Ticket not found"}
+        found.update(body, ID=found["ID"], AppID=found["AppID"], ModifiedDate=_now())
+    return 200, found
+
+
+@route("POST", r"api/(?P<app>\d+)/tickets/search")
+def search_tickets(state: StubState, body: Any, query: Dict[str, str], app: str):
+    body = body or {}
+    statuses = set(body.get("StatusIDs") or [])
+    limit = body.get("MaxResults") or 1000
+    matches = [t for t in state.tickets.values()
+               if t["AppID"] == int(app) and (not statuses or t["StatusID"] in statuses)]
+    return 200, matches[:limit]
+
+
+@route("GET", r"api/(?P<app>\d+)/tickets/(?P<ticket>\d+)/feed")
+def get_feed(state: StubState, body: Any, query: Dict[str, str], app: str, ticket: str):
+    return 200, state.feeds.get(int(ticket), [])
+
+
+@route("POST", r"api/(?P<app>\d+)/tickets/(?P<ticket>\d+)/feed")
+def update_ticket(state: StubState, body: Any, query: Dict[str, str], app: str, ticket: str):
+    with state.lock:
+        if int(ticket) not in state.tickets:
+            return 404, {"Message": "Ticket not found"}
+        entry = {"ID": next(state.ids), "Body": (body or {}).get("Comments"),
+                 "CreatedDate": _now()}
+        state.feeds.setdefault(int(ticket), []).append(entry)
+        if (body or {}).get("NewStatusID"):
+            state.tickets[int(ticket)]["StatusID"] = body["NewStatusID"]
+    return 200, entry
+
+
+@route("GET", r"api/(?P<app>\d+)/tickets/(?P<ticket>\d+)/(?P<part>contacts|assets|tasks)")
+def ticket_children(state: StubState, body: Any, query: Dict[str, str], app: str,
+                    ticket: str, part: str):
+    return 200, []
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server_version = "TDWebApiStub/1.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def state(self) -> StubState:
+        return self.server.state  # type: ignore[attr-defined]
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _dispatch(self, method: str) -> None:
+        path, _, raw_query = self.path.partition("?")
+        query = dict(p.partition("=")[::2] for p in raw_query.split("&") if p)
+        # Accept any prefix before api/, e.g. /TDWebApi/api/...
+        index = path.find("api/")
+        path = path[index:].rstrip("/") if index >= 0 else path.strip("/")
+
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if self.headers.get("Content-Encoding") == "gzip" and raw:
+            raw = gzip.decompress(raw)
+        body = json.loads(raw) if raw else None
+
+        state = self.state
+        with state.lock:
+            state.requests += 1
+            delay = state.latency_ms + state.random.uniform(0, state.jitter_ms)
+            fail = state.random.random() < state.error_rate
+        if delay:
+            time.sleep(delay / 1000)
+
+        if fail and not path.startswith("api/auth"):
+            status, payload = 503, {"Message": "Injected failure"}
+        else:
+            status, payload = 404, {"Message": f"No stub for {method} {path}"}
+            for route_method, pattern, handler in ROUTES:
+                match = pattern.match(path)
+                if route_method == method and match:
+                    status, payload = handler(state, body, query, **match.groupdict())
+                    break
+
+        if isinstance(payload, str):
+            data, content_type = payload.encode("utf-8"), "text/plain; charset=utf-8"
+        else:
+            data, content_type = json.dumps(payload).encode("utf-8"), "application/json; charset=utf-8"
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PUT(self) -> None:
+        self._dispatch("PUT")
+
+    def do_PATCH(self) -> None:
+        self._dispatch("PATCH")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+
+def serve(host: str = "127.0.0.1", port: int = 0, background: bool = True,
+          **state_options) -> ThreadingHTTPServer:
+    """
+    Start the stub server.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind; 0 picks a free one (see ``server.server_port``)
+        background: Serve on a daemon thread and return immediately
+        **state_options: latency_ms, jitter_ms, error_rate, seed
+
+    Returns:
+        The running server; call ``shutdown()`` to stop it
+    """
+    server = ThreadingHTTPServer((host, port), StubHandler)
+    server.daemon_threads = True
+    server.state = StubState(**state_options)  # type: ignore[attr-defined]
+    if background:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    else:
+        server.serve_forever()
+    return server
+
+
+def base_url(server: ThreadingHTTPServer) -> str:
+    """Base URL to give TeamDynamix for a running stub."""
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}/TDWebApi"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in for the TeamDynamix Web API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Random extra delay, up to this much")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of calls answered with 503")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    print(f"Serving TeamDynamix stub on http://{args.host}:{args.port}/TDWebApi")
+    try:
+        serve(args.host, args.port, background=False, latency_ms=args.latency_ms,
+              jitter_ms=args.jitter_ms, error_rate=args.error_rate, seed=args.seed)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -23,7 +23,12 @@ setup(
         ],
         'optional': [
             "requests-cache>=1.1.0",
-            "tenacity>=8.2.3"
+            "tenacity>=8.2.3",
+            "numpy>=1.24",
+            "orjson>=3.9",
+            "brotli>=1.1",
+            "pyarrow>=14",
+            "httpx[http2]>=0.27"
         ]
     },
     python_requires=">=3.10",
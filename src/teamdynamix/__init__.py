@@ -3,5 +3,6 @@
 __version__ = "0.1.0"
 
 from .http_client import TeamDynamix
+from .pool import TeamDynamixPool
 
-__all__ = ['TeamDynamix']
\ No newline at end of file
+__all__ = ['TeamDynamix', 'TeamDynamixPool']
@@ -0,0 +1,307 @@
+"""Record TeamDynamix API traffic to cassette files and replay it offline."""
+
+import base64
+import gzip
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+
+from teamdynamix.exceptions import CassetteError
+from teamdynamix.transport import RequestsTransport, Response, Timeout, Transport
+from teamdynamix.utils.codec import DEFAULT_CODEC
+
+__all__ = ['RecordingTransport', 'ReplayTransport', 'load_cassette', 'save_cassette']
+
+CASSETTE_VERSION = 1
+SCRUBBED = "<scrubbed>"
+# Body fields replaced before an interaction is written (compared case-insensitively)
+SENSITIVE_FIELDS = frozenset({"beid", "webserviceskey", "password"})
+# Response headers worth keeping; everything else (cookies, dates, ...) is dropped
+RECORDED_HEADERS = frozenset({"content-type", "etag", "last-modified", "cache-control",
+                              "retry-after", "location"})
+AUTH_PATHS = ("/api/auth", "/api/auth/login", "/api/auth/loginadmin")
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+# Unsigned stand-in for recorded auth tokens. It expires in 2100 so replayed
+# clients authenticate once, like they did while recording.
+PLACEHOLDER_TOKEN = ".".join([
+    _b64url(b'{"alg":"none","typ":"JWT"}'),
+    _b64url(b'{"exp":4102444800,"sub":"cassette"}'),
+    "",
+])
+
+
+def _scrub(value: Any, fields: frozenset) -> Any:
+    if isinstance(value, dict):
+        return {k: SCRUBBED if str(k).casefold() in fields else _scrub(v, fields)
+                for k, v in value.items()}
+    if isinstance(value, list):
+        return [_scrub(v, fields) for v in value]
+    return value
+
+
+def _request_key(method: str, url: str, params: Optional[Dict]) -> str:
+    """METHOD path?query, with query parameters sorted and the host left out."""
+    split = urlsplit(url)
+    query = parse_qsl(split.query, keep_blank_values=True)
+    query.extend((str(k), str(v)) for k, v in (params or {}).items() if v is not None)
+    path = split.path + (f"?{urlencode(sorted(query))}" if query else "")
+    return f"{method.upper()} {path}"
+
+
+def _request_body(data: Any, json: Any, files: Optional[Dict], fields: frozenset) -> Any:
+    """Request body as stored in the cassette: decoded JSON when possible, scrubbed."""
+    if files:
+        return {"files": sorted(files)}
+    if json is not None:
+        return _scrub(json, fields)
+    if data is None:
+        return None
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if isinstance(data, (bytes, bytearray)):
+        if data[:2] == b"\x1f\x8b":
+            data = gzip.decompress(data)
+        try:
+            return _scrub(DEFAULT_CODEC.loads(data), fields)
+        except ValueError:
+            return data.decode("utf-8", errors="replace")
+    return _scrub(dict(data), fields)
+
+
+def _body_key(body: Any) -> str:
+    return DEFAULT_CODEC.dumps(body).decode("utf-8") if body is not None else ""
+
+
+def save_cassette(path: Union[str, Path], interactions: Iterable[Dict[str, Any]]) -> None:
+    """
+    Atomically write interactions to a cassette.
+
+    Cassettes are newline-delimited JSON, a version header followed by one
+    interaction per line; a path ending in ``.gz`` is gzip-compressed.
+    """
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    lines = [DEFAULT_CODEC.dumps({"version": CASSETTE_VERSION})]
+    lines.extend(DEFAULT_CODEC.dumps(interaction) for interaction in interactions)
+    payload = b"\n".join(lines) + b"\n"
+    if target.suffix == ".gz":
+        payload = gzip.compress(payload, compresslevel=9, mtime=0)
+    tmp = target.with_suffix(target.suffix + ".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, target)
+
+
+def load_cassette(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """
+    Read the interactions of a cassette written by :func:`save_cassette`.
+
+    Raises:
+        CassetteError: If the file is missing or not a compatible cassette
+    """
+    try:
+        payload = Path(path).read_bytes()
+        if payload[:2] == b"\x1f\x8b":
+            payload = gzip.decompress(payload)
+        header, *lines = [DEFAULT_CODEC.loads(line) for line in payload.splitlines() if line.strip()]
+    except (OSError, ValueError) as e:
+        raise CassetteError(f"Cannot read cassette {path}: {e}")
+    if not isinstance(header, dict) or header.get("version") != CASSETTE_VERSION:
+        raise CassetteError(f"{path} is not a version {CASSETTE_VERSION} cassette")
+    return lines
+
+
+class RecordingTransport(Transport):
+    """
+    Passes requests through to another transport and records each exchange.
+
+    Credentials never reach the cassette: request headers (including the
+    Authorization bearer token) are not recorded, BEID, WebServicesKey and
+    password fields in request and response bodies are replaced, and the
+    token returned by the auth endpoints is swapped for a placeholder JWT.
+    Hosts are dropped from URLs, so a cassette recorded against the sandbox
+    replays under any base URL.
+
+    Example:
+        recorder = RecordingTransport("tests/cassettes/tickets.jsonl.gz")
+        client = TeamDynamix(base_url="https://sandbox.teamdynamix.com/SBTDWebApi",
+                             username="u", password="p", transport=recorder)
+        ...  # exercise the API
+        recorder.close()  # writes the cassette
+    """
+    name = "recording"
+
+    def __init__(self, path: Union[str, Path], inner: Optional[Transport] = None,
+                 scrub_fields: Iterable[str] = ()):
+        """
+        Initialize RecordingTransport.
+
+        Args:
+            path: Cassette file written by :meth:`save` and :meth:`close`
+            inner: Transport that sends the requests; defaults to RequestsTransport
+            scrub_fields: Body fields to scrub in addition to SENSITIVE_FIELDS
+        """
+        self.path = Path(path)
+        self.inner = inner or RequestsTransport()
+        self.fields = SENSITIVE_FIELDS | {f.casefold() for f in scrub_fields}
+        self.interactions: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def _response(self, url: str, response: Any) -> Dict[str, Any]:
+        headers = {k.lower(): v for k, v in response.headers.items()
+                   if k.lower() in RECORDED_HEADERS}
+        recorded = {"status": response.status_code, "headers": headers}
+        if not response.content:
+            return recorded
+        path = urlsplit(url).path.rstrip("/").lower()
+        if path.endswith(AUTH_PATHS) and response.status_code < 400:
+            recorded["text"] = PLACEHOLDER_TOKEN
+            return recorded
+        if "json" in headers.get("content-type", ""):
+            try:
+                recorded["json"] = _scrub(DEFAULT_CODEC.loads(response.content), self.fields)
+                return recorded
+            except ValueError:
+                pass  # labelled JSON but is not; keep the body as it came
+        try:
+            recorded["text"] = response.content.decode("utf-8")
+        except UnicodeDecodeError:
+            recorded["base64"] = base64.b64encode(response.content).decode("ascii")
+        return recorded
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                params: Optional[Dict] = None, data: Any = None, json: Any = None,
+                files: Optional[Dict] = None, timeout: Timeout = None) -> Any:
+        interaction: Dict[str, Any] = {
+            "request": _request_key(method, url, params),
+            "body": _request_body(data, json, files, self.fields),
+        }
+        started = time.perf_counter()
+        try:
+            response = self.inner.request(method, url, headers=headers, params=params, data=data,
+                                          json=json, files=files, timeout=timeout)
+        except requests.exceptions.Timeout as e:
+            interaction["error"] = {"kind": "timeout", "message": str(e)}
+            raise
+        except requests.exceptions.RequestException as e:
+            interaction["error"] = {"kind": "connection", "message": str(e)}
+            raise
+        else:
+            interaction["response"] = self._response(url, response)
+            return response
+        finally:
+            interaction["elapsed"] = round(time.perf_counter() - started, 4)
+            with self._lock:
+                self.interactions.append(interaction)
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> None:
+        """Write everything recorded so far to the cassette."""
+        with self._lock:
+            interactions = list(self.interactions)
+        save_cassette(path or self.path, interactions)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {"transport": self.name, "recorded": len(self.interactions),
+                "inner": self.inner.metrics()}
+
+    def close(self) -> None:
+        self.save()
+        self.inner.close()
+
+
+class ReplayTransport(Transport):
+    """
+    Answers requests from a cassette without touching the network.
+
+    Requests are matched on method, path, query parameters and (scrubbed)
+    body. Identical requests are answered with their recorded responses in
+    order, e.g. a ticket fetched before and after an edit; once those run
+    out the last one is repeated. Recorded timeouts and connection errors
+    are raised again.
+
+    Example:
+        client = TeamDynamix(base_url="https://replay.invalid/TDWebApi", username="u",
+                             password="p", transport=ReplayTransport("tests/cassettes/tickets.jsonl.gz"))
+    """
+    name = "replay"
+
+    def __init__(self, cassette: Union[str, Path, Iterable[Dict[str, Any]]],
+                 latency: Optional[Union[float, str]] = None, match_body: bool = True,
+                 repeat: bool = True, scrub_fields: Iterable[str] = ()):
+        """
+        Initialize ReplayTransport.
+
+        Args:
+            cassette: Cassette file, or interactions already loaded
+            latency: Simulated latency per call: seconds, "recorded" to replay
+                the recorded timings, or None to answer immediately
+            match_body: Take request bodies into account when matching
+            repeat: Keep answering with the last response once a request's
+                recorded responses are used up; if False, raise CassetteError
+            scrub_fields: Extra fields that were scrubbed while recording
+        """
+        if isinstance(latency, str) and latency != "recorded":
+            raise ValueError("latency must be a number of seconds, 'recorded' or None")
+        interactions = load_cassette(cassette) if isinstance(cassette, (str, Path)) else list(cassette)
+        self.latency = latency
+        self.match_body = match_body
+        self.repeat = repeat
+        self.fields = SENSITIVE_FIELDS | {f.casefold() for f in scrub_fields}
+        self._recorded: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for interaction in interactions:
+            self._recorded.setdefault(self._key(interaction["request"], interaction.get("body")),
+                                      []).append(interaction)
+        self._served: Dict[Tuple[str, str], int] = {}
+        self.unmatched = 0
+        self._lock = threading.Lock()
+
+    def _key(self, request: str, body: Any) -> Tuple[str, str]:
+        return request, _body_key(body) if self.match_body else ""
+
+    def _next(self, key: Tuple[str, str]) -> Dict[str, Any]:
+        with self._lock:
+            recorded = self._recorded.get(key)
+            served = self._served.get(key, 0)
+            if not recorded or (served >= len(recorded) and not self.repeat):
+                self.unmatched += 1
+                reason = "No recorded interaction" if not recorded else "Recorded responses used up"
+                raise CassetteError(f"{reason} for {key[0]}")
+            self._served[key] = served + 1
+            return recorded[min(served, len(recorded) - 1)]
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                params: Optional[Dict] = None, data: Any = None, json: Any = None,
+                files: Optional[Dict] = None, timeout: Timeout = None) -> Response:
+        interaction = self._next(self._key(_request_key(method, url, params),
+                                           _request_body(data, json, files, self.fields)))
+        delay = interaction.get("elapsed", 0) if self.latency == "recorded" else self.latency
+        if delay:
+            time.sleep(delay)
+
+        error = interaction.get("error")
+        if error is not None:
+            if error["kind"] == "timeout":
+                raise requests.exceptions.Timeout(error["message"])
+            raise requests.exceptions.ConnectionError(error["message"])
+
+        recorded = interaction["response"]
+        if "json" in recorded:
+            content = DEFAULT_CODEC.dumps(recorded["json"])
+        elif "base64" in recorded:
+            content = base64.b64decode(recorded["base64"])
+        else:
+            content = recorded.get("text", "").encode("utf-8")
+        return Response(recorded["status"], content, recorded.get("headers"), url)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {"transport": self.name, "served": sum(self._served.values()),
+                "unmatched": self.unmatched}
@@ -0,0 +1,34 @@
+"""Exceptions raised by the TeamDynamix client and its managers."""
+
+from typing import Optional
+
+
+class AuthenticationError(Exception):
+    """Raised when authentication fails"""
+    pass
+
+class RequestError(Exception):
+    """Raised when an API request fails"""
+
+    def __init__(self, message: str = "", status_code: Optional[int] = None):
+        super().__init__(message)
+        # HTTP status of the failed response; None for network errors and timeouts
+        self.status_code = status_code
+
+class TokenError(Exception):
+    """Raised when token handling fails"""
+    pass
+
+class CircuitOpenError(RequestError):
+    """Raised without calling the API when an endpoint's circuit breaker is open"""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(
+            f"Circuit open for {endpoint}; retry in {retry_after:.1f}s"
+        )
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+class CassetteError(Exception):
+    """Raised when a cassette cannot be read or has no recording for a request"""
+    pass
@@ -1,29 +1,49 @@
 import os
+import gzip
+import threading
 import jwt
 import requests
+from concurrent.futures import Executor
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Tuple, Union
+from teamdynamix.exceptions import AuthenticationError, CircuitOpenError, RequestError, TokenError
+from teamdynamix.utils.circuit_breaker import (
+    CircuitBreakerConfig, CircuitBreakerRegistry, endpoint_key
+)
+from teamdynamix.utils.codec import JSONCodec, get_codec
+from teamdynamix.utils.rate_limiter import reserve_deferred
+from teamdynamix.utils.response_cache import CachedResponse, ResponseCache, resource_path
+from teamdynamix.transport import RequestsTransport, Transport
 from teamdynamix.tdnext.core import TDNext
+from teamdynamix.tdnext.scope import AppScope
+from teamdynamix.tdnext.tickets.tickets import ticket_prefix
+from teamdynamix.tdadmin.core import TDAdmin
 
+try:
+    import brotli  # noqa: F401 - lets urllib3 decode br responses
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
 
-class AuthenticationError(Exception):
-    """Raised when authentication fails"""
-    pass
 
-class RequestError(Exception):
-    """Raised when an API request fails"""
-    pass
-
-class TokenError(Exception):
-    """Raised when token handling fails"""
-    pass
 class TeamDynamix:
 
     def __init__(self, base_url: Any, 
                  username: Optional[Any] = None, 
                  password: Optional[Any] = None,
                  beid: Optional[str] = None,
-                 web_services_key: Optional[str] = None):
+                 web_services_key: Optional[str] = None,
+                 session: Optional[requests.Session] = None,
+                 executor: Optional[Executor] = None,
+                 use_environment: bool = True,
+                 timeout: Optional[Union[float, Tuple[float, float]]] = 30,
+                 circuit_breaker: Optional[CircuitBreakerConfig] = None,
+                 fallback: Optional[Callable[[str, str, Optional[Dict]], Any]] = None,
+                 json_codec: Optional[Union[str, JSONCodec]] = None,
+                 compress_requests: Optional[int] = None,
+                 transport: Optional[Transport] = None,
+                 cache: Optional[ResponseCache] = None,
+                 rate_limit: bool = True):
         """
         TeamDynamix API Client for interacting with TeamDynamix services.
 
@@ -33,6 +53,27 @@ class TeamDynamix:
             password: Password for API authentication (will be converted to string)
             beid: BEID for admin authentication (optional)
             web_services_key: Web Services Key for admin authentication (optional)
+            session: requests Session to send requests through, e.g. to share
+                a connection pool between clients (optional)
+            executor: Executor that managers run concurrent work on (optional)
+            use_environment: Fall back to the BEID/WEB_SERVICES_KEY environment
+                variables when admin credentials are not given
+            timeout: Seconds to wait for a response, or a (connect, read)
+                tuple; None waits indefinitely
+            circuit_breaker: Enables per-endpoint circuit breakers with these
+                thresholds (optional)
+            fallback: Called as ``fallback(method, endpoint, params)`` when a
+                call fails fast or the backend fails; a non-None result is
+                returned in place of the error, e.g. data from a cache (optional)
+            json_codec: JSON library for request and response bodies: "json"
+                (default), "orjson", "msgspec", "auto" or a JSONCodec
+            compress_requests: Gzip JSON request bodies of at least this many
+                bytes; None sends them uncompressed
+            transport: How requests are sent, e.g. ``HttpxTransport(http2=True)``;
+                defaults to ``requests`` (through ``session`` if given)
+            cache: Caches GET responses; may be shared between clients (optional)
+            rate_limit: Throttle manager calls to the published API limits;
+                turn off only against a stand-in server
 
         Raises:
             ValueError: If no valid credentials are provided
@@ -43,8 +84,21 @@ class TeamDynamix:
         self.password = str(password) if password else ""
         
         # Admin credentials
-        self._beid = beid or os.environ.get('BEID')
-        self._web_services_key = web_services_key or os.environ.get('WEB_SERVICES_KEY')
+        self._beid = beid or (os.environ.get('BEID') if use_environment else None)
+        self._web_services_key = web_services_key or (
+            os.environ.get('WEB_SERVICES_KEY') if use_environment else None
+        )
+
+        # Module-level requests functions unless a Session or transport is supplied
+        self._http = transport if transport is not None else RequestsTransport(session)
+        self.executor = executor
+        self.timeout = timeout
+        self._breakers = CircuitBreakerRegistry(circuit_breaker) if circuit_breaker else None
+        self.fallback = fallback
+        self.codec = get_codec(json_codec)
+        self.compress_requests = compress_requests
+        self.cache = cache
+        self.rate_limit = rate_limit
 
         # Validate that we have at least one set of credentials
         if not self.base_url:
@@ -62,18 +116,32 @@ class TeamDynamix:
         self._token_refresh_buffer = timedelta(minutes=5)
         self.tdnext = TDNext(self)
         self.tickets = self.tdnext.tickets
+        self.tdadmin = TDAdmin(self)
+        self._apps: Dict[int, AppScope] = {}
+        self._apps_lock = threading.Lock()
+
+    @property
+    def rate_limit_key(self) -> str:
+        """
+        Key the rate limiters track this client's calls under.
+        TeamDynamix limits calls per instance, so clients for the same
+        instance share a budget and clients for different instances do not.
+        """
+        return self.base_url
 
     @classmethod
-    def login_admin(cls, beid: str, web_services_key: str, base_url: str) -> str:
+    def login_admin(cls, beid: str, web_services_key: str, base_url: str,
+                    http: Any = None, timeout: Any = None) -> str:
         """Admin authentication implementation..."""
         try:
-            response = requests.post(
+            response = (http or requests).post(
                 f"{base_url}/api/auth/loginadmin",
                 json={
                     "BEID": beid,
                     "WebServicesKey": web_services_key
                 },
-                headers={"Content-Type": "application/json; charset=utf-8"}
+                headers={"Content-Type": "application/json; charset=utf-8"},
+                timeout=timeout
             )
             response.raise_for_status()
             
@@ -100,13 +168,18 @@ class TeamDynamix:
         """
         try:
             if self._beid and self._web_services_key:
-                self.token = self.login_admin(self._beid, self._web_services_key, self.base_url)
+                self.token = self.login_admin(
+                    self._beid, self._web_services_key, self.base_url,
+                    http=self._http, timeout=self.timeout
+                )
             else:
                 auth_endpoint = f"{self.base_url}/api/auth"
                 headers = {"Content-Type": "application/json; charset=utf-8"}
                 payload = {"username": self.username, "password": self.password}
 
-                response = requests.post(auth_endpoint, json=payload, headers=headers)
+                response = self._http.post(
+                    auth_endpoint, json=payload, headers=headers, timeout=self.timeout
+                )
                 response.raise_for_status()
                 
                 if not response.text:
@@ -185,7 +258,8 @@ class TeamDynamix:
             
         return {
             "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json; charset=utf-8"
+            "Content-Type": "application/json; charset=utf-8",
+            "Accept-Encoding": ACCEPT_ENCODING
         }
 
     def request(self, method: str, endpoint: str, 
@@ -195,19 +269,121 @@ class TeamDynamix:
                 files: Optional[Dict] = None) -> Any:
         """
         Make an HTTP request to the TeamDynamix API.
+
+        With circuit breakers enabled, a call to an endpoint whose breaker is
+        open fails fast with CircuitOpenError instead of waiting on a degraded
+        backend. Timeouts, connection errors, 429s and 5xx responses count as
+        failures; if a fallback is configured it is consulted before raising.
+
+        With a response cache, GETs with a fresh cached response never reach
+        the network and every other method invalidates the resource it wrote.
         """
+        cache_key = None
+        if self.cache is not None:
+            if method.upper() == "GET":
+                cache_key = self.cache.key(self.username or self._beid or "",
+                                           f"{self.base_url}/{endpoint.lstrip('/')}", params)
+                entry = self.cache.fresh(cache_key)
+                if entry is not None:
+                    return self._decode_cached(entry)
+            elif not resource_path(endpoint).endswith("/search"):
+                # Searches are POSTs that change nothing; everything else invalidates
+                try:
+                    return self._call(method, endpoint, params, data, json, files)
+                finally:
+                    self.cache.invalidate(endpoint)
+        return self._call(method, endpoint, params, data, json, files, cache_key)
+
+    def _call(self, method: str, endpoint: str, params: Optional[Dict], data: Optional[Dict],
+              json: Optional[Dict], files: Optional[Dict], cache_key: Optional[str] = None) -> Any:
+        """Send a request through its endpoint's circuit breaker."""
+        breaker = self._breakers.get(endpoint_key(method, endpoint)) if self._breakers else None
+        if breaker is not None and not breaker.allow():
+            error = CircuitOpenError(endpoint_key(method, endpoint), breaker.retry_after())
+            return self._fall_back(method, endpoint, params, error, cache_key)
+
+        try:
+            result = self._send(method, endpoint, params, data, json, files, cache_key)
+        except RequestError as e:
+            backend_failure = e.status_code is None or e.status_code == 429 or e.status_code >= 500
+            if breaker is not None:
+                breaker.record(not backend_failure)
+            if backend_failure:
+                return self._fall_back(method, endpoint, params, e, cache_key)
+            raise
+        except AuthenticationError:
+            if breaker is not None:
+                breaker.record(True)
+            raise
+        except Exception:
+            # Anything else (undecodable body, token error...) says nothing
+            # about the backend; just free a half-open trial slot
+            if breaker is not None:
+                breaker.release()
+            raise
+        if breaker is not None:
+            breaker.record(True)
+        return result
+
+    def _fall_back(self, method: str, endpoint: str, params: Optional[Dict],
+                   error: RequestError, cache_key: Optional[str] = None) -> Any:
+        """Answer a failed call from a stale cache entry or the fallback, or re-raise ``error``."""
+        if cache_key is not None:
+            entry = self.cache.stale(cache_key)
+            if entry is not None:
+                return self._decode_cached(entry)
+        if self.fallback is not None:
+            result = self.fallback(method, endpoint, params)
+            if result is not None:
+                return result
+        raise error
+
+    def _send(self, method: str, endpoint: str,
+              params: Optional[Dict] = None,
+              data: Optional[Dict] = None,
+              json: Optional[Dict] = None,
+              files: Optional[Dict] = None,
+              cache_key: Optional[str] = None) -> Any:
+        """Send a request, re-authenticating once on a 401."""
+        # Rate-limited manager calls take their slot now that a request goes out
+        reserve_deferred()
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        headers = self._get_headers()
+        extra_headers = {}
+        # Multipart and form bodies carry their own Content-Type (with the
+        # boundary); only JSON bodies keep the default JSON one
+        json_body = json is not None or (data is None and not files)
+
+        # Expired cache entries are revalidated rather than downloaded again
+        entry = self.cache.get(cache_key) if cache_key is not None else None
+        if entry is not None and self.cache.revalidate:
+            extra_headers.update(entry.validators())
+
+        # Encode JSON bodies with the configured codec rather than requests'
+        if json is not None:
+            data = self.codec.dumps(json)
+            json = None
+            if self.compress_requests is not None and len(data) >= self.compress_requests:
+                data = gzip.compress(data, compresslevel=5)
+                extra_headers["Content-Encoding"] = "gzip"
+
+        def request_headers() -> Dict[str, str]:
+            headers = {**self._get_headers(), **extra_headers}
+            if not json_body:
+                headers.pop("Content-Type", None)
+            return headers
+
+        headers = request_headers()
 
         try:
-            response = requests.request(
+            response = self._http.request(
                 method=method,
                 url=url,
                 headers=headers,
                 params=params,
                 data=data,
                 json=json,
-                files=files
+                files=files,
+                timeout=self.timeout
             )
 
             # Only log errors
@@ -218,27 +394,70 @@ class TeamDynamix:
                 
             if response.status_code == 401:
                 self.token = None
-                headers = self._get_headers()
-                response = requests.request(
+                headers = request_headers()
+                response = self._http.request(
                     method=method,
                     url=url,
                     headers=headers,
                     params=params,
                     data=data,
                     json=json,
-                    files=files
+                    files=files,
+                    timeout=self.timeout
                 )
                 
             response.raise_for_status()
-            return response.json() if response.text else None
+            if cache_key is not None:
+                if response.status_code == 304 and entry is not None:
+                    self.cache.renew(entry, endpoint, response.headers)
+                    return self._decode_cached(entry)
+                self.cache.store(cache_key, endpoint, response.content, response.headers)
+            return self.codec.decode_response(response)
             
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 401:
                 raise AuthenticationError("Token expired and refresh failed")
-            raise RequestError(f"HTTP request failed: {e}")
+            raise RequestError(f"HTTP request failed: {e}", status_code=e.response.status_code)
+        except requests.exceptions.Timeout as e:
+            raise RequestError(f"Request timed out: {e}")
         except requests.exceptions.RequestException as e:
             raise RequestError(f"Request failed: {e}")
 
+    def _decode_cached(self, entry: CachedResponse) -> Any:
+        return self.codec.loads(entry.content) if entry.content else None
+
+    def app(self, app_id: int, prefetch: bool = True) -> AppScope:
+        """
+        A view of this client bound to one application, e.g. ``client.app(122).tickets``.
+
+        Scopes are created once per application. The first call starts
+        loading the application's reference data in the background.
+
+        Args:
+            app_id: ID of the application
+            prefetch: Load the application's reference data in the background
+
+        Raises:
+            ValueError: If the app ID is not an integer
+        """
+        app_id, _ = ticket_prefix(app_id)
+        scope = self._apps.get(app_id)
+        if scope is None:
+            with self._apps_lock:
+                scope = self._apps.get(app_id)
+                if scope is None:
+                    scope = AppScope(self, app_id, prefetch=prefetch)
+                    self._apps[app_id] = scope
+        return scope
+
+    def metrics(self) -> Dict[str, Any]:
+        """Client health for logging or monitoring, including circuit breaker states."""
+        return {
+            "transport": self._http.metrics(),
+            "cache": self.cache.metrics() if self.cache is not None else {},
+            "circuit_breakers": self._breakers.snapshot() if self._breakers else {},
+        }
+
     def get(self, endpoint: str, **kwargs) -> Any:
         """Convenience method for GET requests"""
         return self.request("GET", endpoint, **kwargs)
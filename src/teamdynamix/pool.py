@@ -0,0 +1,181 @@
+"""Shared-resource pool of TeamDynamix clients for multi-tenant processes."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from teamdynamix.http_client import TeamDynamix
+from teamdynamix.transport import Transport
+
+__all__ = ['TeamDynamixPool']
+
+
+@dataclass(frozen=True)
+class _TenantConfig:
+    base_url: str
+    username: Optional[str] = None
+    password: Optional[str] = None
+    beid: Optional[str] = None
+    web_services_key: Optional[str] = None
+
+
+class TeamDynamixPool:
+    """
+    Manages TeamDynamix clients for many tenants in one process.
+
+    Every client shares one ``requests.Session`` (and so one connection pool)
+    and one worker thread pool, so adding tenants does not multiply sockets
+    or threads. Authentication state stays per client, and the rate limiters
+    track each tenant's instance separately. Clients are created on first use
+    and dropped after ``idle_timeout`` seconds without use; an evicted tenant
+    is rebuilt (and re-authenticates) the next time it is requested.
+
+    Example:
+        pool = TeamDynamixPool(max_workers=8)
+        pool.register("byui", base_url="https://byui.teamdynamix.com/TDWebApi",
+                      beid="...", web_services_key="...")
+        pool["byui"].tickets.create(...)
+    """
+
+    def __init__(self, max_workers: int = 8, max_connections: int = 32,
+                 idle_timeout: Optional[float] = 900,
+                 session: Optional[requests.Session] = None,
+                 transport: Optional[Transport] = None):
+        """
+        Initialize the pool.
+
+        Args:
+            max_workers: Threads shared by all tenants' concurrent operations
+            max_connections: Connections kept alive per host in the shared session
+            idle_timeout: Seconds a client may go unused before it is evicted;
+                None keeps clients until they are removed
+            session: Session to share instead of creating one (optional)
+            transport: Transport shared by every client instead of the session,
+                e.g. one ``HttpxTransport`` multiplexing all tenants (optional)
+        """
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max_connections)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        self.transport = transport
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix="teamdynamix")
+        self.idle_timeout = idle_timeout
+        self._tenants: Dict[str, _TenantConfig] = {}
+        self._clients: Dict[str, TeamDynamix] = {}
+        self._last_used: Dict[str, float] = {}
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def register(self, tenant: str, base_url: str,
+                 username: Optional[str] = None, password: Optional[str] = None,
+                 beid: Optional[str] = None, web_services_key: Optional[str] = None) -> None:
+        """
+        Add (or replace) a tenant's connection details.
+
+        Environment credentials are never used for pooled clients, so one
+        tenant can not pick up another's BEID/Web Services Key.
+
+        Raises:
+            ValueError: If no valid credentials are provided
+        """
+        if not ((username and password) or (beid and web_services_key)):
+            raise ValueError("Either username/password or BEID/WebServicesKey must be provided")
+        with self._lock:
+            self._tenants[tenant] = _TenantConfig(base_url, username, password,
+                                                  beid, web_services_key)
+            self._clients.pop(tenant, None)
+
+    def get(self, tenant: str) -> TeamDynamix:
+        """
+        The client for a tenant, created on first use.
+
+        Raises:
+            KeyError: If the tenant was never registered
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            client = self._clients.get(tenant)
+            if client is None:
+                config = self._tenants[tenant]
+                client = TeamDynamix(
+                    base_url=config.base_url,
+                    username=config.username,
+                    password=config.password,
+                    beid=config.beid,
+                    web_services_key=config.web_services_key,
+                    session=self.session,
+                    transport=self.transport,
+                    executor=self.executor,
+                    use_environment=False
+                )
+                self._clients[tenant] = client
+            self._last_used[tenant] = now
+            return client
+
+    __getitem__ = get
+
+    def __contains__(self, tenant: object) -> bool:
+        return tenant in self._tenants
+
+    @property
+    def tenants(self) -> List[str]:
+        return list(self._tenants)
+
+    def _evict_idle(self, now: float) -> List[str]:
+        if self.idle_timeout is None:
+            return []
+        idle = [t for t in self._clients
+                if now - self._last_used.get(t, now) >= self.idle_timeout]
+        for tenant in idle:
+            del self._clients[tenant]
+            self._last_used.pop(tenant, None)
+        self._evictions += len(idle)
+        return idle
+
+    def evict_idle(self) -> List[str]:
+        """Drop clients idle longer than ``idle_timeout``; returns the evicted tenants."""
+        with self._lock:
+            return self._evict_idle(time.monotonic())
+
+    def remove(self, tenant: str) -> None:
+        """Forget a tenant and its client."""
+        with self._lock:
+            self._tenants.pop(tenant, None)
+            self._clients.pop(tenant, None)
+            self._last_used.pop(tenant, None)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Pool occupancy for logging or monitoring."""
+        with self._lock:
+            return {
+                "tenants": len(self._tenants),
+                "active_clients": len(self._clients),
+                "evictions": self._evictions,
+                "max_workers": self.max_workers,
+            }
+
+    def close(self) -> None:
+        """Shut down the shared worker threads and connections."""
+        with self._lock:
+            self._clients.clear()
+            self._last_used.clear()
+        self.executor.shutdown(wait=True)
+        self.session.close()
+        if self.transport is not None:
+            self.transport.close()
+
+    def __enter__(self) -> 'TeamDynamixPool':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
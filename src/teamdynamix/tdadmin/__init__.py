@@ -0,0 +1,14 @@
+from .core import TDAdmin
+from .accounts import AccountHierarchy, AccountManager
+from .applications import ApplicationManager
+from .attributes import AttributeComponent, AttributeManager
+from .daysoff import BusinessCalendar, DaysOffManager
+from .groups import GroupManager
+from .locations import LocationManager
+from .time import TimeManager
+from .type_categories import TicketCatalog, TypeCategoryManager
+from .user_management import UserManager
+
+__all__ = ['TDAdmin', 'AccountHierarchy', 'AccountManager', 'ApplicationManager', 'AttributeComponent',
+           'AttributeManager', 'BusinessCalendar', 'DaysOffManager', 'GroupManager', 'LocationManager',
+           'TicketCatalog', 'TimeManager', 'TypeCategoryManager', 'UserManager']
\ No newline at end of file
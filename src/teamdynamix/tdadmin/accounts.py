@@ -0,0 +1,279 @@
+__all__ = ['AccountManager', 'AccountHierarchy', 'Rollup']
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from teamdynamix.exceptions import RequestError
+from teamdynamix.utils.rate_limiter import RateLimiter
+from teamdynamix.utils.snapshot import read_snapshot, write_snapshot
+
+SNAPSHOT_VERSION = 1
+
+
+class Rollup:
+    """
+    Subtree totals of per-account values, answered in O(1) per account.
+
+    Values are laid out in Euler-tour order and prefix-summed, so the total
+    of any subtree is the difference of two prefix sums.
+    """
+
+    def __init__(self, hierarchy: 'AccountHierarchy', values: Mapping[int, float]):
+        self._hierarchy = hierarchy
+        prefix = [0.0] * (len(hierarchy.order) + 1)
+        for position, account_id in enumerate(hierarchy.order):
+            prefix[position + 1] = prefix[position] + float(values.get(account_id, 0) or 0)
+        self._prefix = prefix
+
+    def total(self, account_id: int) -> float:
+        """Sum of the values of ``account_id`` and all of its descendants."""
+        start, end = self._hierarchy.interval(account_id)
+        return self._prefix[end] - self._prefix[start]
+
+
+class AccountHierarchy:
+    """
+    Immutable account tree with precomputed Euler-tour intervals.
+
+    Each account gets an interval ``[enter, exit)`` over a depth-first
+    ordering of the tree; an account lies in another's subtree exactly when
+    its ``enter`` falls inside that interval. Subtree membership, subtree
+    listing and rollups therefore need no tree walking after construction.
+    Accounts whose parent is missing (or that form a cycle) are treated as
+    roots.
+    """
+
+    def __init__(self, accounts: Iterable[Dict[str, Any]]):
+        self.accounts: Dict[int, Dict[str, Any]] = {a["ID"]: a for a in accounts}
+        self.children: Dict[int, List[int]] = {account_id: [] for account_id in self.accounts}
+        self._by_name: Dict[str, int] = {}
+        self._by_code: Dict[str, int] = {}
+        roots: List[int] = []
+
+        for account_id, account in sorted(self.accounts.items()):
+            parent_id = account.get("ParentID")
+            if parent_id and parent_id in self.accounts and parent_id != account_id:
+                self.children[parent_id].append(account_id)
+            else:
+                roots.append(account_id)
+            self._by_name.setdefault(str(account.get("Name") or "").strip().casefold(), account_id)
+            if account.get("Code"):
+                self._by_code[str(account["Code"])] = account_id
+
+        self.order: List[int] = []
+        self._enter: Dict[int, int] = {}
+        self._exit: Dict[int, int] = {}
+        self._depth: Dict[int, int] = {}
+        self._path: Dict[int, Tuple[int, ...]] = {}
+
+        for root in roots:
+            self._walk(root)
+        # Anything unvisited sits on a parent cycle; break it at the lowest ID
+        for account_id in sorted(self.accounts):
+            if account_id not in self._enter:
+                roots.append(account_id)
+                self._walk(account_id)
+        self.roots = roots
+
+    def _walk(self, root: int) -> None:
+        """Iterative DFS assigning enter/exit positions, depths and ancestor paths."""
+        self._path[root] = ()
+        self._depth[root] = 0
+        stack: List[Tuple[int, bool]] = [(root, False)]
+        while stack:
+            account_id, done = stack.pop()
+            if done:
+                self._exit[account_id] = len(self.order)
+                continue
+            self._enter[account_id] = len(self.order)
+            self.order.append(account_id)
+            stack.append((account_id, True))
+            path = self._path[account_id] + (account_id,)
+            for child in reversed(self.children[account_id]):
+                if child in self._enter:
+                    continue
+                self._path[child] = path
+                self._depth[child] = len(path)
+                stack.append((child, False))
+
+    def __len__(self) -> int:
+        return len(self.accounts)
+
+    def __contains__(self, account_id: object) -> bool:
+        return account_id in self.accounts
+
+    def get(self, account_id: int) -> Optional[Dict[str, Any]]:
+        return self.accounts.get(account_id)
+
+    def by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """Case-insensitive lookup by account name."""
+        account_id = self._by_name.get(name.strip().casefold())
+        return self.accounts[account_id] if account_id is not None else None
+
+    def by_code(self, code: str) -> Optional[Dict[str, Any]]:
+        account_id = self._by_code.get(str(code))
+        return self.accounts[account_id] if account_id is not None else None
+
+    def interval(self, account_id: int) -> Tuple[int, int]:
+        """The ``[enter, exit)`` Euler-tour interval of an account's subtree."""
+        return self._enter[account_id], self._exit[account_id]
+
+    def is_within(self, account_id: int, ancestor_id: int) -> bool:
+        """
+        True if ``account_id`` is ``ancestor_id`` or one of its descendants.
+        Unknown accounts are never within anything.
+        """
+        enter = self._enter.get(account_id)
+        if enter is None or ancestor_id not in self._enter:
+            return False
+        return self._enter[ancestor_id] <= enter < self._exit[ancestor_id]
+
+    def depth(self, account_id: int) -> int:
+        return self._depth[account_id]
+
+    def ancestors(self, account_id: int) -> Tuple[int, ...]:
+        """Ancestor IDs from the root down to the account's parent."""
+        return self._path[account_id]
+
+    def path_names(self, account_id: int, separator: str = " > ") -> str:
+        """Display path such as ``University > College X > Department``."""
+        ids = self._path[account_id] + (account_id,)
+        return separator.join(str(self.accounts[i].get("Name")) for i in ids)
+
+    def subtree(self, account_id: int) -> List[int]:
+        """IDs of the account and all of its descendants, in tree order."""
+        start, end = self.interval(account_id)
+        return self.order[start:end]
+
+    def rollup(self, values: Mapping[int, float]) -> Rollup:
+        """Precompute subtree totals of ``values`` (e.g. open tickets per account)."""
+        return Rollup(self, values)
+
+
+class AccountManager:
+    """Manages accounts/departments for TeamDynamix, backed by a cached hierarchy"""
+
+    def __init__(self, client, ttl: Optional[float] = 3600,
+                 snapshot_path: Optional[Union[str, Path]] = None,
+                 retry_after: float = 60.0):
+        """
+        Initialize AccountManager.
+
+        Args:
+            client: TeamDynamix API client instance
+            ttl: Seconds before the hierarchy is refetched; None never expires
+            snapshot_path: File used to warm-start and persist the hierarchy (optional)
+            retry_after: Seconds to keep serving the expired hierarchy after
+                a failed refetch before trying again
+        """
+        self._client = client
+        self.ttl = ttl
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.retry_after = retry_after
+        self._hierarchy: Optional[AccountHierarchy] = None
+        self._loaded_at: float = 0.0
+        self._retry_at: float = 0.0
+        self._lock = threading.Lock()
+
+    @RateLimiter()
+    def get(self, account_id: int) -> Dict:
+        """
+        Gets an account.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            account_id: ID of the account
+
+        Returns:
+            Account information
+        """
+        return self._client.get(f"api/accounts/{account_id}")
+
+    @RateLimiter()
+    def search(self, **criteria) -> List[Dict]:
+        """
+        Gets a list of accounts.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            **criteria: AccountSearch fields (e.g. SearchText, IsActive, ParentAccountID)
+
+        Returns:
+            List of accounts matching the criteria
+        """
+        return self._client.post("api/accounts/search", json=criteria) or []
+
+    def _expired(self) -> bool:
+        now = time.time()
+        return self.ttl is not None and now - self._loaded_at >= self.ttl and now >= self._retry_at
+
+    @property
+    def hierarchy(self) -> AccountHierarchy:
+        """
+        The cached account hierarchy.
+
+        Loaded from the snapshot (if it is still within the TTL) or the API on
+        first use, and refetched once the TTL has passed. If a refetch fails
+        the expired hierarchy keeps being served, and the refetch is retried
+        ``retry_after`` seconds later.
+        """
+        if self._hierarchy is None or self._expired():
+            with self._lock:
+                if self._hierarchy is None and self.snapshot_path:
+                    self.load_snapshot()
+                if self._hierarchy is None or self._expired():
+                    try:
+                        self._load()
+                    except RequestError:
+                        if self._hierarchy is None:
+                            raise
+                        self._retry_at = time.time() + self.retry_after
+        assert self._hierarchy is not None
+        return self._hierarchy
+
+    def _load(self) -> None:
+        """Fetch active and inactive accounts in one call and rebuild the hierarchy."""
+        loaded_at = time.time()
+        self._hierarchy = AccountHierarchy(self.search())
+        self._loaded_at = loaded_at
+        if self.snapshot_path:
+            self.save_snapshot()
+
+    def refresh(self) -> AccountHierarchy:
+        """Refetch the hierarchy regardless of the TTL."""
+        with self._lock:
+            self._load()
+        return self.hierarchy
+
+    def save_snapshot(self, path: Optional[Union[str, Path]] = None) -> None:
+        """Write the current hierarchy to disk for the next process to warm-start from."""
+        if self._hierarchy is None:
+            raise ValueError("No accounts loaded")
+        write_snapshot(
+            path or self.snapshot_path,
+            SNAPSHOT_VERSION,
+            loaded_at=self._loaded_at,
+            accounts=list(self._hierarchy.accounts.values())
+        )
+
+    def load_snapshot(self, path: Optional[Union[str, Path]] = None) -> bool:
+        """
+        Load the hierarchy from a snapshot file.
+
+        Returns:
+            True if a compatible snapshot was loaded, False otherwise
+        """
+        state = read_snapshot(path or self.snapshot_path, SNAPSHOT_VERSION)
+        if state is None:
+            return False
+        self._hierarchy = AccountHierarchy(state.get("accounts") or [])
+        self._loaded_at = float(state.get("loaded_at") or 0)
+        return True
+
+    def is_within(self, account_id: Optional[int], ancestor_id: int) -> bool:
+        """
+        True if ``account_id`` is ``ancestor_id`` or one of its descendants,
+        e.g. whether a ticket's AccountID falls under a college.
+        """
+        return account_id is not None and self.hierarchy.is_within(account_id, ancestor_id)
@@ -0,0 +1,72 @@
+__all__ = ['ApplicationManager']
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from teamdynamix.utils.rate_limiter import RateLimiter
+
+# AppClass of ticketing applications
+TICKETING_APP_CLASS = "TDTickets"
+
+
+class ApplicationManager:
+    """Manages the applications of a TeamDynamix organization, discovered once and cached"""
+
+    def __init__(self, client, ttl: Optional[float] = 3600):
+        """
+        Initialize ApplicationManager.
+
+        Args:
+            client: TeamDynamix API client instance
+            ttl: Seconds the application list stays valid; None caches until invalidated
+        """
+        self._client = client
+        self.ttl = ttl
+        self._apps: Optional[Dict[int, Dict[str, Any]]] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    @RateLimiter()
+    def get_all(self) -> List[Dict]:
+        """
+        Gets the active applications of the organization.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Returns:
+            List of applications
+        """
+        return self._client.get("api/applications") or []
+
+    def _cached(self) -> Dict[int, Dict[str, Any]]:
+        apps = self._apps
+        if apps is not None and (self.ttl is None or time.monotonic() - self._loaded_at < self.ttl):
+            return apps
+        with self._lock:
+            if self._apps is None or (self.ttl is not None and
+                                      time.monotonic() - self._loaded_at >= self.ttl):
+                self._apps = {app["AppID"]: app for app in self.get_all()}
+                self._loaded_at = time.monotonic()
+            return self._apps
+
+    def applications(self) -> List[Dict[str, Any]]:
+        """All applications, fetched on first use."""
+        return list(self._cached().values())
+
+    def get(self, app_id: int) -> Optional[Dict[str, Any]]:
+        """An application by ID, or None if the organization has no such app."""
+        return self._cached().get(int(app_id))
+
+    def by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """An application by (case-insensitive) name."""
+        wanted = name.strip().casefold()
+        return next((app for app in self._cached().values()
+                     if str(app.get("Name") or "").strip().casefold() == wanted), None)
+
+    def ticketing(self) -> List[Dict[str, Any]]:
+        """The ticketing applications."""
+        return [app for app in self._cached().values() if app.get("AppClass") == TICKETING_APP_CLASS]
+
+    def invalidate(self) -> None:
+        """Drop the cached application list."""
+        with self._lock:
+            self._apps = None
@@ -0,0 +1,196 @@
+__all__ = ['AttributeManager', 'AttributeSchema', 'AttributeComponent']
+
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from teamdynamix.utils.rate_limiter import RateLimiter
+
+
+class AttributeComponent:
+    """Component IDs used when requesting custom attributes."""
+    PROJECT = 1
+    TICKET = 9
+    ACCOUNT = 14
+    KNOWLEDGE_BASE_ARTICLE = 26
+    ASSET = 27
+    VENDOR = 28
+    CONTRACT = 29
+    PERSON = 31
+    SERVICE = 47
+    CONFIGURATION_ITEM = 63
+    LOCATION = 71
+    LOCATION_ROOM = 80
+
+
+def _key(name: Any) -> str:
+    return str(name or "").strip().casefold()
+
+
+class AttributeSchema:
+    """
+    Attribute definitions and choices for one component, indexed for lookups.
+
+    Names and choice names are matched case-insensitively.
+    """
+
+    def __init__(self, attributes: List[Dict[str, Any]]):
+        self.attributes = attributes
+        self._by_id: Dict[int, Dict[str, Any]] = {}
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        self._choices: Dict[int, Tuple[Dict[str, int], Dict[int, str]]] = {}
+        for attribute in attributes:
+            self._by_id[attribute["ID"]] = attribute
+            self._by_name.setdefault(_key(attribute.get("Name")), attribute)
+            choices = attribute.get("Choices") or []
+            self._choices[attribute["ID"]] = (
+                {_key(c.get("Name")): c["ID"] for c in choices},
+                {c["ID"]: c.get("Name") for c in choices}
+            )
+
+    def __len__(self) -> int:
+        return len(self.attributes)
+
+    def get(self, attribute: Union[int, str]) -> Dict[str, Any]:
+        """
+        Look up an attribute definition by ID or name.
+
+        Raises:
+            KeyError: If the attribute is not defined for the component
+        """
+        found = self._by_id.get(attribute) if isinstance(attribute, int) \
+            else self._by_name.get(_key(attribute))
+        if found is None:
+            raise KeyError(attribute)
+        return found
+
+    def choice_id(self, attribute: Union[int, str], choice: str) -> int:
+        """
+        Resolve a choice name to its ID.
+
+        Raises:
+            KeyError: If the attribute or choice does not exist
+        """
+        names, _ = self._choices[self.get(attribute)["ID"]]
+        try:
+            return names[_key(choice)]
+        except KeyError:
+            raise KeyError(f"{choice!r} is not a choice of attribute {attribute!r}")
+
+    def choice_name(self, attribute: Union[int, str], choice_id: int) -> Optional[str]:
+        _, ids = self._choices[self.get(attribute)["ID"]]
+        return ids.get(int(choice_id))
+
+    def build(self, values: Mapping[Union[int, str], Any]) -> List[Dict[str, Any]]:
+        """
+        Build an ``Attributes`` payload from names (or IDs) and values.
+
+        Values of choice attributes may be given as choice names and are
+        translated to choice IDs; anything else is sent as given.
+
+        Args:
+            values: Mapping of attribute name or ID to value
+
+        Returns:
+            List of ``{"ID": ..., "Value": ...}`` dicts for create/edit calls
+        """
+        payload = []
+        for key, value in values.items():
+            attribute = self.get(key)
+            if attribute.get("Choices") and isinstance(value, str) and not value.isdigit():
+                value = self.choice_id(attribute["ID"], value)
+            payload.append({"ID": attribute["ID"], "Value": str(value)})
+        return payload
+
+
+class AttributeManager:
+    """Manages custom attribute definitions for TeamDynamix, cached per component"""
+
+    def __init__(self, client, ttl: Optional[float] = 3600):
+        """
+        Initialize AttributeManager.
+
+        Args:
+            client: TeamDynamix API client instance
+            ttl: Seconds a cached schema stays valid; None caches until invalidated
+        """
+        self._client = client
+        self.ttl = ttl
+        self._cache: Dict[Tuple[int, int, int], Tuple[float, AttributeSchema]] = {}
+        self._lock = threading.Lock()
+
+    @RateLimiter()
+    def get_custom(self, component_id: int, app_id: int = 0,
+                   associated_type_id: int = 0) -> List[Dict]:
+        """
+        Gets the custom attributes for the specified component.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            component_id: Component ID (see AttributeComponent)
+            app_id: Associated application ID, or 0 for none
+            associated_type_id: Associated type ID, or 0 for all types
+
+        Returns:
+            List of custom attributes, including their choices
+        """
+        return self._client.get("api/attributes/custom", params={
+            "componentId": component_id,
+            "appId": app_id,
+            "associatedTypeId": associated_type_id
+        }) or []
+
+    @RateLimiter()
+    def get_choices(self, attribute_id: int) -> List[Dict]:
+        """
+        Gets the choices for the specified custom attribute.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            attribute_id: ID of the custom attribute
+
+        Returns:
+            List of choices
+        """
+        return self._client.get(f"api/attributes/{attribute_id}/choices") or []
+
+    def schema(self, component_id: int = AttributeComponent.TICKET, app_id: int = 0,
+               associated_type_id: int = 0) -> AttributeSchema:
+        """
+        Cached attribute definitions for a component.
+
+        The first call for a component/app/type fetches the definitions (one
+        call; choices are included); later calls are served from memory
+        until the TTL expires.
+
+        Args:
+            component_id: Component ID (see AttributeComponent)
+            app_id: Associated application ID, or 0 for none
+            associated_type_id: Associated type ID, or 0 for all types
+
+        Returns:
+            AttributeSchema for the component
+        """
+        key = (component_id, app_id, associated_type_id)
+        cached = self._cache.get(key)
+        if cached and (self.ttl is None or time.monotonic() - cached[0] < self.ttl):
+            return cached[1]
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached and (self.ttl is None or time.monotonic() - cached[0] < self.ttl):
+                return cached[1]
+            schema = AttributeSchema(self.get_custom(component_id, app_id, associated_type_id))
+            self._cache[key] = (time.monotonic(), schema)
+            return schema
+
+    def ticket_schema(self, app_id: int, type_id: int = 0) -> AttributeSchema:
+        """Cached ticket attribute definitions for an application."""
+        return self.schema(AttributeComponent.TICKET, app_id, type_id)
+
+    def invalidate(self, component_id: Optional[int] = None) -> None:
+        """Drop cached schemas, either for one component or all of them."""
+        with self._lock:
+            if component_id is None:
+                self._cache.clear()
+            else:
+                for key in [k for k in self._cache if k[0] == component_id]:
+                    del self._cache[key]
@@ -0,0 +1,29 @@
+from teamdynamix.tdadmin.accounts import AccountManager
+from teamdynamix.tdadmin.applications import ApplicationManager
+from teamdynamix.tdadmin.attributes import AttributeManager
+from teamdynamix.tdadmin.groups import GroupManager
+from teamdynamix.tdadmin.locations import LocationManager
+from teamdynamix.tdadmin.time import TimeManager
+from teamdynamix.tdadmin.type_categories import TypeCategoryManager
+from teamdynamix.tdadmin.user_management import UserManager
+
+class TDAdmin:
+    """Base class for administrative operations in TeamDynamix"""
+
+    def __init__(self, client):
+        """Initialize TDAdmin with all available managers
+
+        Args:
+            client: TeamDynamix API client instance with authentication
+        """
+        self._client = client
+
+        # Initialize all managers
+        self.accounts = AccountManager(client)
+        self.applications = ApplicationManager(client)
+        self.attributes = AttributeManager(client)
+        self.groups = GroupManager(client)
+        self.locations = LocationManager(client)
+        self.time = TimeManager(client)
+        self.type_categories = TypeCategoryManager(client)
+        self.users = UserManager(client)
@@ -0,0 +1,187 @@
+__all__ = ['DaysOffManager', 'BusinessCalendar']
+
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+from teamdynamix.utils.rate_limiter import RateLimiter
+
+DateLike = Union[date, datetime, str]
+
+
+def _to_date(value: DateLike) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def _to_minute(value: str) -> int:
+    hours, minutes = value.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+@dataclass(frozen=True)
+class BusinessCalendar:
+    """
+    Working hours and days off used to measure SLA time.
+
+    Attributes:
+        open_minute: Start of the business day, in minutes after midnight
+        close_minute: End of the business day, in minutes after midnight
+        weekmask: Seven 0/1 characters for Monday..Sunday working days
+        holidays: Dates that are not worked regardless of the weekmask
+        timezone: IANA name of the zone business hours are defined in
+    """
+    open_minute: int = 8 * 60
+    close_minute: int = 17 * 60
+    weekmask: str = "1111100"
+    holidays: FrozenSet[date] = field(default_factory=frozenset)
+    timezone: str = "UTC"
+
+    def __post_init__(self):
+        if not 0 <= self.open_minute < self.close_minute <= 24 * 60:
+            raise ValueError("Business hours must satisfy 00:00 <= open < close <= 24:00")
+        if len(self.weekmask) != 7 or set(self.weekmask) - {"0", "1"}:
+            raise ValueError("weekmask must be seven 0/1 characters, Monday first")
+
+    @classmethod
+    def from_hours(cls, open_time: str = "08:00", close_time: str = "17:00",
+                   holidays: Iterable[DateLike] = (), **kwargs) -> 'BusinessCalendar':
+        """Build a calendar from ``HH:MM`` strings and any date-like holidays."""
+        return cls(
+            open_minute=_to_minute(open_time),
+            close_minute=_to_minute(close_time),
+            holidays=frozenset(_to_date(d) for d in holidays),
+            **kwargs
+        )
+
+    @property
+    def minutes_per_day(self) -> int:
+        return self.close_minute - self.open_minute
+
+    def is_business_day(self, day: DateLike) -> bool:
+        day = _to_date(day)
+        return self.weekmask[day.weekday()] == "1" and day not in self.holidays
+
+
+class DaysOffManager:
+    """
+    Manages organizational days off for TeamDynamix, cached per date range.
+
+    The TDX Web API has no documented days-off resource, so the endpoint that
+    serves them must be given. It is called as ``GET <endpoint>?startDate=
+    YYYY-MM-DD&endDate=YYYY-MM-DD`` and must return a list of entries, each
+    either a single day (``{"Date": "2024-12-25"}``) or an inclusive range
+    (``{"StartDate": "2024-12-24", "EndDate": "2024-12-26"}``); dates may
+    carry a time part, which is ignored. Without such an endpoint, pass the
+    holidays to ``BusinessCalendar.from_hours`` directly.
+    """
+
+    def __init__(self, client, endpoint: str, ttl: Optional[float] = 24 * 3600):
+        """
+        Initialize DaysOffManager.
+
+        Args:
+            client: TeamDynamix API client instance
+            endpoint: Path of the resource listing days off (see class docstring)
+            ttl: Seconds a cached range stays valid; None caches until invalidated
+
+        Raises:
+            ValueError: If no endpoint is given
+        """
+        if not endpoint:
+            raise ValueError("A days-off endpoint is required")
+        self._client = client
+        self.endpoint = endpoint
+        self.ttl = ttl
+        self._cache: Dict[Tuple[date, date], Tuple[float, FrozenSet[date]]] = {}
+        self._lock = threading.Lock()
+
+    @RateLimiter()
+    def get_days_off(self, start: DateLike, end: DateLike) -> List[Dict]:
+        """
+        Gets the days off between two dates.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            start: First date of the range
+            end: Last date of the range
+
+        Returns:
+            List of day-off entries, as returned by the endpoint
+        """
+        return self._client.get(self.endpoint, params={
+            "startDate": _to_date(start).isoformat(),
+            "endDate": _to_date(end).isoformat()
+        }) or []
+
+    @staticmethod
+    def _expand(entries: Iterable[Dict[str, Any]]) -> FrozenSet[date]:
+        """Flatten single-date and start/end-range entries into a set of dates."""
+        days = set()
+        for entry in entries:
+            if entry.get("Date"):
+                days.add(_to_date(entry["Date"]))
+            elif entry.get("StartDate"):
+                day = _to_date(entry["StartDate"])
+                last = _to_date(entry.get("EndDate") or entry["StartDate"])
+                while day <= last:
+                    days.add(day)
+                    day += timedelta(days=1)
+        return frozenset(days)
+
+    def holidays(self, start: DateLike, end: DateLike) -> FrozenSet[date]:
+        """
+        Days off in a range, served from the cache while it is fresh.
+
+        Args:
+            start: First date of the range
+            end: Last date of the range
+
+        Returns:
+            Set of dates that are not worked
+        """
+        key = (_to_date(start), _to_date(end))
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached and (self.ttl is None or time.monotonic() - cached[0] < self.ttl):
+                return cached[1]
+        days = self._expand(self.get_days_off(*key))
+        with self._lock:
+            self._cache[key] = (time.monotonic(), days)
+        return days
+
+    def calendar(self, open_time: str = "08:00", close_time: str = "17:00",
+                 weekmask: str = "1111100", timezone: str = "UTC",
+                 years: Optional[Iterable[int]] = None) -> BusinessCalendar:
+        """
+        Build a BusinessCalendar with the organization's days off.
+
+        Args:
+            open_time: Start of the business day as ``HH:MM``
+            close_time: End of the business day as ``HH:MM``
+            weekmask: Seven 0/1 characters for Monday..Sunday working days
+            timezone: IANA name of the zone business hours are defined in
+            years: Calendar years to load days off for; defaults to last,
+                current and next year
+
+        Returns:
+            BusinessCalendar including the cached days off
+        """
+        if years is None:
+            this_year = date.today().year
+            years = (this_year - 1, this_year, this_year + 1)
+        holidays = set()
+        for year in years:
+            holidays |= self.holidays(date(year, 1, 1), date(year, 12, 31))
+        return BusinessCalendar.from_hours(
+            open_time, close_time, holidays=holidays, weekmask=weekmask, timezone=timezone
+        )
+
+    def invalidate(self) -> None:
+        """Drop all cached days off."""
+        with self._lock:
+            self._cache.clear()
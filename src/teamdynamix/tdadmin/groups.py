@@ -0,0 +1,279 @@
+__all__ = ['GroupManager', 'GroupSyncResult', 'GroupSyncReport']
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+from teamdynamix.exceptions import RequestError
+from teamdynamix.utils.concurrency import client_executor, map_concurrently
+from teamdynamix.utils.rate_limiter import RateLimiter
+
+# TDX does not publish a hard cap for the bulk member endpoints; this keeps
+# request bodies small enough to retry cheaply.
+DEFAULT_MEMBER_BATCH_SIZE = 100
+
+
+@dataclass
+class GroupSyncResult:
+    """Outcome of synchronizing the membership of a single group."""
+    group_id: int
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    calls: int = 0
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+@dataclass
+class GroupSyncReport:
+    """Aggregate outcome of a multi-group synchronization run."""
+    results: List[GroupSyncResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def calls(self) -> int:
+        return sum(r.calls for r in self.results)
+
+    @property
+    def failed(self) -> List[GroupSyncResult]:
+        return [r for r in self.results if not r.ok]
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals suitable for logging or metrics."""
+        return {
+            "groups": len(self.results),
+            "changed": sum(1 for r in self.results if r.changed),
+            "failed": len(self.failed),
+            "added": sum(len(r.added) for r in self.results),
+            "removed": sum(len(r.removed) for r in self.results),
+            "calls": self.calls,
+            "elapsed": round(self.elapsed, 3),
+        }
+
+
+def _normalize_uid(uid: Any) -> str:
+    """UIDs are GUIDs; TDX returns them lower-case but IdPs often do not."""
+    return str(uid).strip().lower()
+
+
+def _chunks(items: List[str], size: int) -> Iterable[List[str]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class GroupManager:
+    """Manages group operations for TeamDynamix"""
+
+    def __init__(self, client):
+        """
+        Initialize GroupManager.
+
+        Args:
+            client: TeamDynamix API client instance
+        """
+        self._client = client
+
+    @RateLimiter()
+    def get(self, group_id: int) -> Dict:
+        """
+        Gets a group.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            group_id: ID of the group
+
+        Returns:
+            Group information
+        """
+        return self._client.get(f"api/groups/{group_id}")
+
+    @RateLimiter()
+    def search(self, **criteria) -> List[Dict]:
+        """
+        Gets a list of groups.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            **criteria: GroupSearch fields (e.g. NameLike, IsActive)
+
+        Returns:
+            List of groups matching the criteria
+        """
+        return self._client.post("api/groups/search", json=criteria) or []
+
+    @RateLimiter()
+    def get_members(self, group_id: int) -> List[Dict]:
+        """
+        Gets the users belonging to a group.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            group_id: ID of the group
+
+        Returns:
+            List of users in the group
+        """
+        return self._client.get(f"api/groups/{group_id}/members") or []
+
+    @RateLimiter()
+    def add_members(
+        self,
+        group_id: int,
+        uids: List[str],
+        is_primary: bool = False,
+        is_notified: bool = False,
+        is_manager: bool = False
+    ) -> Any:
+        """
+        Adds a collection of users to a group.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            group_id: ID of the group
+            uids: UIDs of the users to add
+            is_primary: Whether the group becomes the users' primary group
+            is_notified: Whether the users are notified of group activity
+            is_manager: Whether the users manage the group
+
+        Returns:
+            Response from the API
+        """
+        return self._client.post(
+            f"api/groups/{group_id}/members",
+            json=list(uids),
+            params={
+                "isPrimary": str(is_primary).lower(),
+                "isNotified": str(is_notified).lower(),
+                "isManager": str(is_manager).lower()
+            }
+        )
+
+    @RateLimiter()
+    def remove_members(self, group_id: int, uids: List[str]) -> Any:
+        """
+        Removes a collection of users from a group.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            group_id: ID of the group
+            uids: UIDs of the users to remove
+
+        Returns:
+            Response from the API
+        """
+        return self._client.delete(f"api/groups/{group_id}/members", json=list(uids))
+
+    def sync_members(
+        self,
+        group_id: int,
+        desired_uids: Iterable[str],
+        batch_size: int = DEFAULT_MEMBER_BATCH_SIZE,
+        remove_extra: bool = True,
+        dry_run: bool = False
+    ) -> GroupSyncResult:
+        """
+        Makes a group's membership match ``desired_uids`` with as few calls as possible.
+
+        Current membership is fetched once, the difference is computed locally
+        and only the missing/extra members are sent through the bulk add and
+        remove endpoints, ``batch_size`` UIDs per call. A group that is
+        already in sync costs a single call.
+
+        Args:
+            group_id: ID of the group
+            desired_uids: UIDs that should be members of the group
+            batch_size: Maximum UIDs sent per add/remove call
+            remove_extra: Remove members not in ``desired_uids``
+            dry_run: Compute the diff without applying it
+
+        Returns:
+            GroupSyncResult describing the changes and the calls made
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        started = time.perf_counter()
+        result = GroupSyncResult(group_id=group_id)
+        try:
+            members = self.get_members(group_id)
+            result.calls += 1
+
+            current = {_normalize_uid(m["UID"]) for m in members if m.get("UID")}
+            desired = {_normalize_uid(uid) for uid in desired_uids if uid}
+
+            to_add = sorted(desired - current)
+            to_remove = sorted(current - desired) if remove_extra else []
+            result.unchanged = len(current & desired)
+
+            if not dry_run:
+                for batch in _chunks(to_add, batch_size):
+                    self.add_members(group_id, batch)
+                    result.calls += 1
+                    result.added.extend(batch)
+                for batch in _chunks(to_remove, batch_size):
+                    self.remove_members(group_id, batch)
+                    result.calls += 1
+                    result.removed.extend(batch)
+            else:
+                result.added, result.removed = to_add, to_remove
+        except RequestError as e:
+            result.error = str(e)
+        finally:
+            result.elapsed = time.perf_counter() - started
+        return result
+
+    def sync_many(
+        self,
+        desired: Mapping[int, Iterable[str]],
+        max_workers: int = 4,
+        batch_size: int = DEFAULT_MEMBER_BATCH_SIZE,
+        remove_extra: bool = True,
+        dry_run: bool = False
+    ) -> GroupSyncReport:
+        """
+        Synchronizes many groups concurrently.
+
+        Groups run on ``max_workers`` threads; every call still goes through
+        the shared rate limiters, so adding workers never exceeds the API
+        budget. A failure in one group is recorded and does not stop the rest.
+
+        Args:
+            desired: Mapping of group ID to the UIDs that should be members
+            max_workers: Number of groups synchronized at once
+            batch_size: Maximum UIDs sent per add/remove call
+            remove_extra: Remove members not in the desired set
+            dry_run: Compute the diffs without applying them
+
+        Returns:
+            GroupSyncReport with a result per group
+        """
+        started = time.perf_counter()
+        report = GroupSyncReport()
+
+        def sync(group_id: int) -> GroupSyncResult:
+            return self.sync_members(
+                group_id,
+                desired[group_id],
+                batch_size=batch_size,
+                remove_extra=remove_extra,
+                dry_run=dry_run
+            )
+
+        for group_id, result, error in map_concurrently(
+            sync, list(desired), max_workers, executor=client_executor(self._client)
+        ):
+            if error is not None:
+                result = GroupSyncResult(group_id=group_id, error=str(error))
+            report.results.append(result)
+
+        report.results.sort(key=lambda r: r.group_id)
+        report.elapsed = time.perf_counter() - started
+        return report
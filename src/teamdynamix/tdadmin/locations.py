@@ -0,0 +1,302 @@
+__all__ = ['LocationManager', 'LocationIndex']
+
+import math
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from teamdynamix.utils.concurrency import client_executor, map_concurrently
+from teamdynamix.utils.rate_limiter import RateLimiter
+from teamdynamix.utils.snapshot import read_snapshot, write_snapshot
+
+SNAPSHOT_VERSION = 1
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE_LATITUDE = 111.0
+
+
+def _key(name: Optional[str]) -> str:
+    return (name or "").strip().casefold()
+
+
+def _coordinates(location: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    try:
+        lat, lon = float(location["Latitude"]), float(location["Longitude"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if lat == 0 and lon == 0:  # unset coordinates come back as zeros
+        return None
+    return lat, lon
+
+
+def haversine_km(a: Tuple[float, float], b: Tuple[float, float]) -> float:
+    """Great-circle distance between two (latitude, longitude) points in km."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (*a, *b))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + \
+        math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(h))
+
+
+class LocationIndex:
+    """
+    Immutable lookup tables over a set of locations and their rooms.
+
+    Built once per load/refresh and swapped in whole, so readers never see a
+    partially updated index and lookups need no locking.
+    """
+
+    def __init__(self, locations: Iterable[Dict[str, Any]]):
+        self.locations: Dict[int, Dict[str, Any]] = {}
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        self._by_external_id: Dict[str, Dict[str, Any]] = {}
+        self._rooms: Dict[int, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+        self._rooms_by_name: Dict[Tuple[int, str], Dict[str, Any]] = {}
+        points = []
+
+        for location in locations:
+            self.locations[location["ID"]] = location
+            self._by_name.setdefault(_key(location.get("Name")), location)
+            if location.get("ExternalID"):
+                self._by_external_id[str(location["ExternalID"])] = location
+            for room in location.get("Rooms") or []:
+                self._rooms[room["ID"]] = (location, room)
+                self._rooms_by_name[(location["ID"], _key(room.get("Name")))] = room
+            coords = _coordinates(location)
+            if coords:
+                points.append((coords[0], coords[1], location["ID"]))
+
+        # Sorted by latitude so nearest() only scans a latitude band
+        points.sort()
+        self._latitudes = [p[0] for p in points]
+        self._points = points
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    def get(self, location_id: int) -> Optional[Dict[str, Any]]:
+        return self.locations.get(location_id)
+
+    def by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """Case-insensitive lookup by location name."""
+        return self._by_name.get(_key(name))
+
+    def by_external_id(self, external_id: Any) -> Optional[Dict[str, Any]]:
+        return self._by_external_id.get(str(external_id))
+
+    def room(self, room_id: int) -> Optional[Dict[str, Any]]:
+        entry = self._rooms.get(room_id)
+        return entry[1] if entry else None
+
+    def room_location(self, room_id: int) -> Optional[Dict[str, Any]]:
+        entry = self._rooms.get(room_id)
+        return entry[0] if entry else None
+
+    def room_by_name(self, location_id: int, name: str) -> Optional[Dict[str, Any]]:
+        """Case-insensitive lookup of a room within a location."""
+        return self._rooms_by_name.get((location_id, _key(name)))
+
+    def nearest(self, latitude: float, longitude: float,
+                max_km: Optional[float] = None) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Find the closest location that has coordinates.
+
+        Only locations inside a latitude band are measured; the band doubles
+        until it is wider than the best distance found, at which point no
+        location outside it can be closer.
+
+        Args:
+            latitude: Latitude of the point
+            longitude: Longitude of the point
+            max_km: Ignore locations farther than this
+
+        Returns:
+            (location, distance in km) or None
+        """
+        if not self._points:
+            return None
+        origin = (latitude, longitude)
+        band = 0.05
+        best: Optional[Tuple[float, int]] = None
+        while True:
+            lo = bisect_left(self._latitudes, latitude - band)
+            hi = bisect_right(self._latitudes, latitude + band)
+            for lat, lon, location_id in self._points[lo:hi]:
+                distance = haversine_km(origin, (lat, lon))
+                if best is None or distance < best[0]:
+                    best = (distance, location_id)
+            covered_km = band * KM_PER_DEGREE_LATITUDE
+            if (best and best[0] <= covered_km) or band >= 180 or \
+                    (max_km is not None and covered_km > max_km):
+                break
+            band *= 2
+        if best is None or (max_km is not None and best[0] > max_km):
+            return None
+        return self.locations[best[1]], best[0]
+
+
+class LocationManager:
+    """Manages locations and rooms for TeamDynamix, backed by an in-memory index"""
+
+    def __init__(self, client, snapshot_path: Optional[Union[str, Path]] = None):
+        """
+        Initialize LocationManager.
+
+        Args:
+            client: TeamDynamix API client instance
+            snapshot_path: File used to warm-start and persist the index (optional)
+        """
+        self._client = client
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self._index: Optional[LocationIndex] = None
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @RateLimiter()
+    def get(self, location_id: int) -> Dict:
+        """
+        Gets a location, including its rooms.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            location_id: ID of the location
+
+        Returns:
+            Location information
+        """
+        return self._client.get(f"api/locations/{location_id}")
+
+    @RateLimiter()
+    def search(self, **criteria) -> List[Dict]:
+        """
+        Gets a list of locations.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            **criteria: LocationSearch fields (e.g. NameLike, IsActive, ReturnRooms)
+
+        Returns:
+            List of locations matching the criteria
+        """
+        return self._client.post("api/locations/search", json=criteria) or []
+
+    @property
+    def index(self) -> LocationIndex:
+        """The current index, loaded from the snapshot or the API on first use."""
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    if not (self.snapshot_path and self.load_snapshot()):
+                        self._load()
+        assert self._index is not None
+        return self._index
+
+    @property
+    def loaded_at(self) -> Optional[float]:
+        """Epoch seconds when the index was last fetched from the API."""
+        return self._loaded_at
+
+    def _swap(self, locations: Iterable[Dict[str, Any]], loaded_at: float) -> None:
+        self._index = LocationIndex(locations)
+        self._loaded_at = loaded_at
+        if self.snapshot_path:
+            self.save_snapshot()
+
+    def _load(self) -> None:
+        """Fetch every location with its rooms in a single search call."""
+        started = time.time()
+        self._swap(self.search(ReturnRooms=True), started)
+
+    def reload(self) -> LocationIndex:
+        """Discard the index and fetch everything again."""
+        with self._lock:
+            self._load()
+        return self.index
+
+    def refresh(self, max_workers: int = 4) -> Dict[str, int]:
+        """
+        Brings the index up to date by fetching only what changed.
+
+        A search without rooms lists every location with its ModifiedDate;
+        only locations that are new or modified since the last load are
+        refetched individually (with rooms), and deleted ones are dropped.
+
+        Args:
+            max_workers: Number of changed locations fetched at once
+
+        Returns:
+            Counts of added, updated and removed locations
+        """
+        current = self.index
+        started = time.time()
+        listing = self.search(ReturnRooms=False)
+
+        changed = [
+            loc["ID"] for loc in listing
+            if loc["ID"] not in current.locations
+            or loc.get("ModifiedDate") != current.locations[loc["ID"]].get("ModifiedDate")
+        ]
+        fetched = {}
+        for location_id, location, error in map_concurrently(
+            self.get, changed, max_workers, executor=client_executor(self._client)
+        ):
+            if error is not None:
+                raise error
+            fetched[location_id] = location
+
+        listed = {loc["ID"]: loc for loc in listing}
+        # A detail fetch that came back empty keeps the previous record, or
+        # the listing row (without rooms) for a location new to the index
+        merged = [fetched.get(i) or current.locations.get(i) or row for i, row in listed.items()]
+        with self._lock:
+            self._swap(merged, started)
+
+        return {
+            "added": sum(1 for i in changed if i not in current.locations),
+            "updated": sum(1 for i in changed if i in current.locations),
+            "removed": sum(1 for i in current.locations if i not in listed),
+        }
+
+    def save_snapshot(self, path: Optional[Union[str, Path]] = None) -> None:
+        """Write the current index to disk for the next process to warm-start from."""
+        if self._index is None:
+            raise ValueError("No locations loaded")
+        write_snapshot(
+            path or self.snapshot_path,
+            SNAPSHOT_VERSION,
+            loaded_at=self._loaded_at,
+            locations=list(self._index.locations.values())
+        )
+
+    def load_snapshot(self, path: Optional[Union[str, Path]] = None) -> bool:
+        """
+        Load the index from a snapshot file.
+
+        Returns:
+            True if a compatible snapshot was loaded, False otherwise
+        """
+        state = read_snapshot(path or self.snapshot_path, SNAPSHOT_VERSION)
+        if state is None:
+            return False
+        self._index = LocationIndex(state.get("locations") or [])
+        self._loaded_at = state.get("loaded_at")
+        return True
+
+    def resolve(self, ticket: Any) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Resolve a ticket's ``LocationID``/``LocationRoomID`` without an API call.
+
+        Args:
+            ticket: Ticket (or ticket dict) carrying location fields
+
+        Returns:
+            (location, room); either may be None
+        """
+        get = ticket.get if isinstance(ticket, dict) else lambda k: getattr(ticket, k, None)
+        index = self.index
+        room_id = get("LocationRoomID")
+        room = index.room(room_id) if room_id else None
+        location_id = get("LocationID")
+        location = index.get(location_id) if location_id else None
+        if location is None and room_id:
+            location = index.room_location(room_id)
+        return location, room
@@ -0,0 +1,228 @@
+__all__ = ['TimeManager', 'TimeEntryFailure', 'TimeBatchReport']
+
+import threading
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+from teamdynamix.exceptions import CircuitOpenError, RequestError
+from teamdynamix.utils.concurrency import client_executor, map_concurrently
+from teamdynamix.utils.rate_limiter import RateLimiter
+
+# The time entry endpoint rejects batches larger than 50 entries.
+MAX_TIME_BATCH_SIZE = 50
+
+
+@dataclass
+class TimeEntryFailure:
+    """A time entry that could not be saved."""
+    entry: Dict[str, Any]
+    message: str
+
+
+@dataclass
+class TimeBatchReport:
+    """Outcome of submitting a stream of time entries."""
+    submitted: int = 0
+    succeeded: List[Dict[str, Any]] = field(default_factory=list)
+    failed: List[TimeEntryFailure] = field(default_factory=list)
+    # Sent when a timeout or connection error hit; they may have been saved
+    unknown: List[TimeEntryFailure] = field(default_factory=list)
+    calls: int = 0
+    retries: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed and not self.unknown
+
+    @property
+    def entries_per_second(self) -> float:
+        return len(self.succeeded) / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals suitable for logging or metrics."""
+        return {
+            "submitted": self.submitted,
+            "succeeded": len(self.succeeded),
+            "failed": len(self.failed),
+            "unknown": len(self.unknown),
+            "calls": self.calls,
+            "retries": self.retries,
+            "elapsed": round(self.elapsed, 3),
+            "entries_per_second": round(self.entries_per_second, 1),
+        }
+
+
+def _batches(entries: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(entries)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+class TimeManager:
+    """Manages time entry operations for TeamDynamix"""
+
+    def __init__(self, client):
+        """
+        Initialize TimeManager.
+
+        Args:
+            client: TeamDynamix API client instance
+        """
+        self._client = client
+
+    @RateLimiter()
+    def get(self, entry_id: int) -> Dict:
+        """
+        Gets a time entry.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            entry_id: ID of the time entry
+
+        Returns:
+            Time entry information
+        """
+        return self._client.get(f"api/time/{entry_id}")
+
+    @RateLimiter()
+    def submit_batch(self, entries: List[Dict[str, Any]]) -> Dict:
+        """
+        Adds or updates a batch of time entries.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            entries: Up to 50 time entries
+
+        Returns:
+            Bulk operation results with ``Succeeded`` and ``Failed`` collections
+        """
+        if len(entries) > MAX_TIME_BATCH_SIZE:
+            raise ValueError(f"A time batch holds at most {MAX_TIME_BATCH_SIZE} entries")
+        return self._client.post("api/time", json=entries) or {}
+
+    def _submit(self, batch: List[Dict[str, Any]], max_retries: int, backoff: float,
+                report: TimeBatchReport, lock: threading.Lock) -> None:
+        """
+        Submit one batch, retrying only what failed.
+
+        Items the API reports as failed are resubmitted on their own; a batch
+        rejected as a whole with a 4xx is split in half until the offending
+        entries are isolated, so one bad entry never costs the rest of its
+        batch. A 429 or 5xx retries the whole batch after a backoff, and a
+        batch refused by an open circuit breaker (never sent) is retried once
+        the breaker may let it through, without using up an attempt. After a
+        timeout or connection error the batch may have been saved, so it is
+        reported as unknown rather than sent again.
+        """
+        queue: List[Tuple[List[Dict[str, Any]], int]] = [(batch, 0)]
+        while queue:
+            entries, attempt = queue.pop()
+            try:
+                result = self.submit_batch(entries)
+            except CircuitOpenError as e:
+                time.sleep(max(e.retry_after, backoff))
+                queue.append((entries, attempt))
+                with lock:
+                    report.retries += 1
+                continue
+            except RequestError as e:
+                status_code = e.status_code
+                with lock:
+                    report.calls += 1
+                if status_code is None:
+                    with lock:
+                        report.unknown.extend(TimeEntryFailure(entry, str(e)) for entry in entries)
+                elif status_code == 429 or status_code >= 500:
+                    if attempt < max_retries:
+                        time.sleep(backoff * 2 ** attempt)
+                        queue.append((entries, attempt + 1))
+                        with lock:
+                            report.retries += 1
+                    else:
+                        with lock:
+                            report.failed.extend(TimeEntryFailure(entry, str(e)) for entry in entries)
+                elif len(entries) > 1:
+                    middle = len(entries) // 2
+                    queue.append((entries[middle:], attempt))
+                    queue.append((entries[:middle], attempt))
+                    with lock:
+                        report.retries += 1
+                else:
+                    with lock:
+                        report.failed.append(TimeEntryFailure(entries[0], str(e)))
+                continue
+
+            failures = result.get("Failed") or []
+            retry: List[Dict[str, Any]] = []
+            with lock:
+                report.calls += 1
+                report.succeeded.extend(result.get("Succeeded") or [])
+                for failure in failures:
+                    index = failure.get("Index")
+                    message = failure.get("ErrorMessage") or "Failed"
+                    if index is None or not 0 <= index < len(entries):
+                        # Not attributable to an entry; keep the API's item so it is not lost
+                        report.failed.append(TimeEntryFailure(failure, message))
+                        continue
+                    if attempt < max_retries:
+                        retry.append(entries[index])
+                    else:
+                        report.failed.append(TimeEntryFailure(entries[index], message))
+                if retry:
+                    report.retries += 1
+            if retry:
+                queue.append((retry, attempt + 1))
+
+    def add_entries(
+        self,
+        entries: Iterable[Dict[str, Any]],
+        batch_size: int = MAX_TIME_BATCH_SIZE,
+        max_workers: int = 2,
+        max_retries: int = 1,
+        backoff: float = 1.0
+    ) -> TimeBatchReport:
+        """
+        Submits any number of time entries through the batch endpoint.
+
+        Entries are buffered into full batches as they are read, batches run
+        on ``max_workers`` threads behind the rate limiter, and on partial
+        failure only the failed entries are retried.
+
+        Args:
+            entries: Time entries (streamed)
+            batch_size: Entries per call, at most 50
+            max_workers: Number of batches in flight
+            max_retries: Times a failed entry is resubmitted before it is reported
+            backoff: Seconds before retrying a batch after a 429 or 5xx,
+                doubled on each further retry
+
+        Returns:
+            TimeBatchReport with saved entries, failures and throughput
+        """
+        if not 1 <= batch_size <= MAX_TIME_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {MAX_TIME_BATCH_SIZE}")
+
+        started = time.perf_counter()
+        report = TimeBatchReport()
+        lock = threading.Lock()
+
+        def counted(batches: Iterator[List[Dict[str, Any]]]) -> Iterator[List[Dict[str, Any]]]:
+            for batch in batches:
+                report.submitted += len(batch)
+                yield batch
+
+        work = counted(_batches(entries, batch_size))
+        for _, _, error in map_concurrently(
+            lambda batch: self._submit(batch, max_retries, backoff, report, lock), work, max_workers,
+            executor=client_executor(self._client)
+        ):
+            if error is not None:
+                raise error
+
+        report.elapsed = time.perf_counter() - started
+        return report
@@ -0,0 +1,317 @@
+__all__ = ['TypeCategoryManager', 'TicketCatalog']
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+from teamdynamix.utils.concurrency import client_executor, map_concurrently
+from teamdynamix.utils.rate_limiter import RateLimiter
+from teamdynamix.utils.snapshot import read_snapshot, write_snapshot
+
+SNAPSHOT_VERSION = 1
+
+
+def _key(name: Any) -> str:
+    return str(name or "").strip().casefold()
+
+
+class _Lookup:
+    """Items of one kind (types, statuses, ...) indexed by ID and name."""
+
+    def __init__(self, items: Iterable[Dict[str, Any]]):
+        self.items: Dict[int, Dict[str, Any]] = {}
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        for item in items:
+            self.items[item["ID"]] = item
+            # Prefer active items when an inactive one shares the name
+            current = self._by_name.get(_key(item.get("Name")))
+            if current is None or (item.get("IsActive", True) and not current.get("IsActive", True)):
+                self._by_name[_key(item.get("Name"))] = item
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self.items
+
+    def get(self, item: Union[int, str]) -> Optional[Dict[str, Any]]:
+        return self.items.get(item) if isinstance(item, int) else self._by_name.get(_key(item))
+
+    def id(self, name: str) -> int:
+        """
+        Resolve a name to its ID (case-insensitive).
+
+        Raises:
+            KeyError: If no item has that name
+        """
+        found = self._by_name.get(_key(name))
+        if found is None:
+            raise KeyError(name)
+        return found["ID"]
+
+    def is_active(self, item_id: int) -> bool:
+        item = self.items.get(item_id)
+        return bool(item) and item.get("IsActive", True)
+
+
+class TicketCatalog:
+    """
+    An application's ticket types, type categories, statuses, priorities
+    and sources, indexed for lookups and local payload validation.
+
+    Immutable once built; a refresh builds and swaps in a new catalog.
+    """
+
+    def __init__(self, app_id: int, types: List[Dict[str, Any]], statuses: List[Dict[str, Any]],
+                 priorities: List[Dict[str, Any]], sources: List[Dict[str, Any]]):
+        self.app_id = app_id
+        self.types = _Lookup(types)
+        self.statuses = _Lookup(statuses)
+        self.priorities = _Lookup(priorities)
+        self.sources = _Lookup(sources)
+        self.categories: Dict[int, str] = {}
+        self._types_by_category: Dict[int, List[Dict[str, Any]]] = {}
+        for ticket_type in types:
+            category_id = ticket_type.get("CategoryID")
+            if category_id is not None:
+                self.categories.setdefault(category_id, ticket_type.get("CategoryName"))
+                self._types_by_category.setdefault(category_id, []).append(ticket_type)
+
+    def types_in_category(self, category: Union[int, str]) -> List[Dict[str, Any]]:
+        """Types in a category, by category ID or (case-insensitive) name."""
+        if not isinstance(category, int):
+            matches = [cid for cid, name in self.categories.items() if _key(name) == _key(category)]
+            if not matches:
+                return []
+            category = matches[0]
+        return list(self._types_by_category.get(category, []))
+
+    def validate(self, payload: Dict[str, Any]) -> List[str]:
+        """
+        Check a ticket payload's type, status, priority and source IDs.
+
+        Returns:
+            Problems found; empty when the payload is valid
+        """
+        problems = []
+        for field, lookup, label in (
+            ("TypeID", self.types, "type"),
+            ("StatusID", self.statuses, "status"),
+            ("PriorityID", self.priorities, "priority"),
+            ("SourceID", self.sources, "source"),
+        ):
+            value = payload.get(field)
+            if value is None:
+                continue
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                problems.append(f"{field} must be an integer, got {value!r}")
+                continue
+            if value not in lookup:
+                problems.append(f"{field} {value} is not a {label} of application {self.app_id}")
+            elif not lookup.is_active(value):
+                problems.append(f"{field} {value} ({lookup.get(value).get('Name')}) is inactive")
+        return problems
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "types": list(self.types.items.values()),
+            "statuses": list(self.statuses.items.values()),
+            "priorities": list(self.priorities.items.values()),
+            "sources": list(self.sources.items.values()),
+        }
+
+
+class TypeCategoryManager:
+    """Manages ticket types and related reference data for TeamDynamix, cached per application"""
+
+    def __init__(self, client, snapshot_path: Optional[Union[str, Path]] = None,
+                 ttl: Optional[float] = None, recheck_after: float = 60.0):
+        """
+        Initialize TypeCategoryManager.
+
+        Args:
+            client: TeamDynamix API client instance
+            snapshot_path: File used to warm-start and persist catalogs (optional)
+            ttl: Seconds a catalog stays valid; None keeps it until refreshed
+            recheck_after: Minimum age in seconds before :meth:`recheck`
+                fetches a catalog again
+        """
+        self._client = client
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.ttl = ttl
+        self.recheck_after = recheck_after
+        self._catalogs: Dict[int, TicketCatalog] = {}
+        self._loaded_at: Dict[int, float] = {}
+        self._snapshot_read = False
+        self._lock = threading.Lock()
+
+    @RateLimiter()
+    def get_types(self, app_id: int) -> List[Dict]:
+        """
+        Gets the ticket types of an application.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            app_id: ID of the ticketing application
+
+        Returns:
+            List of ticket types, each with its CategoryID and CategoryName
+        """
+        return self._client.get(f"api/{int(app_id)}/tickets/types") or []
+
+    @RateLimiter()
+    def get_statuses(self, app_id: int) -> List[Dict]:
+        """
+        Gets the ticket statuses of an application.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            app_id: ID of the ticketing application
+
+        Returns:
+            List of ticket statuses
+        """
+        return self._client.get(f"api/{int(app_id)}/tickets/statuses") or []
+
+    @RateLimiter()
+    def get_priorities(self) -> List[Dict]:
+        """
+        Gets the ticket priorities.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Returns:
+            List of ticket priorities
+        """
+        return self._client.get("api/tickets/priorities") or []
+
+    @RateLimiter()
+    def get_sources(self) -> List[Dict]:
+        """
+        Gets the ticket sources.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Returns:
+            List of ticket sources
+        """
+        return self._client.get("api/tickets/sources") or []
+
+    def _fresh(self, app_id: int) -> Optional[TicketCatalog]:
+        catalog = self._catalogs.get(app_id)
+        if catalog is None:
+            return None
+        if self.ttl is not None and time.time() - self._loaded_at.get(app_id, 0) >= self.ttl:
+            return None
+        return catalog
+
+    def peek(self, app_id: int) -> Optional[TicketCatalog]:
+        """The catalog for an application if it is available without an API call."""
+        app_id = int(app_id)
+        if not self._snapshot_read and self.snapshot_path:
+            with self._lock:
+                if not self._snapshot_read:
+                    self.load_snapshot()
+        return self._fresh(app_id)
+
+    def catalog(self, app_id: int) -> TicketCatalog:
+        """
+        The catalog for an application, fetched on first use.
+
+        Types, statuses, priorities and sources are requested concurrently,
+        so a cold load costs roughly one round trip.
+        """
+        app_id = int(app_id)
+        catalog = self.peek(app_id)
+        if catalog is not None:
+            return catalog
+        with self._lock:
+            catalog = self._fresh(app_id)
+            if catalog is None:
+                catalog = self._fetch(app_id)
+        return catalog
+
+    def _fetch(self, app_id: int) -> TicketCatalog:
+        calls = {
+            "types": lambda: self.get_types(app_id),
+            "statuses": lambda: self.get_statuses(app_id),
+            "priorities": self.get_priorities,
+            "sources": self.get_sources,
+        }
+        started = time.time()
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        for name, result, error in map_concurrently(
+            lambda name: calls[name](), list(calls), len(calls),
+            executor=client_executor(self._client)
+        ):
+            if error is not None:
+                raise error
+            results[name] = result
+        catalog = TicketCatalog(app_id, **results)
+        self._catalogs[app_id] = catalog
+        self._loaded_at[app_id] = started
+        if self.snapshot_path:
+            self.save_snapshot()
+        return catalog
+
+    def refresh(self, app_id: int) -> TicketCatalog:
+        """Fetch an application's catalog again."""
+        with self._lock:
+            return self._fetch(int(app_id))
+
+    def recheck(self, app_id: int) -> Optional[TicketCatalog]:
+        """
+        Fetch an application's catalog again after a payload failed against it,
+        e.g. because an admin has since added a status.
+
+        Returns:
+            The new catalog, or None if the current one is younger than
+            ``recheck_after`` (so invalid payloads cannot cause a refresh storm)
+        """
+        app_id = int(app_id)
+        with self._lock:
+            if time.time() - self._loaded_at.get(app_id, 0) < self.recheck_after:
+                return None
+            return self._fetch(app_id)
+
+    def validate(self, app_id: int, payload: Dict[str, Any]) -> List[str]:
+        """Check a ticket payload against an application's catalog (fetched if needed)."""
+        return self.catalog(app_id).validate(payload)
+
+    def invalidate(self, app_id: Optional[int] = None) -> None:
+        """Drop cached catalogs, either for one application or all of them."""
+        with self._lock:
+            if app_id is None:
+                self._catalogs.clear()
+                self._loaded_at.clear()
+            else:
+                self._catalogs.pop(int(app_id), None)
+                self._loaded_at.pop(int(app_id), None)
+
+    def save_snapshot(self, path: Optional[Union[str, Path]] = None) -> None:
+        """Write every loaded catalog to disk for the next process to warm-start from."""
+        write_snapshot(
+            path or self.snapshot_path,
+            SNAPSHOT_VERSION,
+            apps={
+                str(app_id): {"loaded_at": self._loaded_at.get(app_id), **catalog.to_dict()}
+                for app_id, catalog in self._catalogs.items()
+            }
+        )
+
+    def load_snapshot(self, path: Optional[Union[str, Path]] = None) -> bool:
+        """
+        Load catalogs from a snapshot file.
+
+        Returns:
+            True if a compatible snapshot was loaded, False otherwise
+        """
+        self._snapshot_read = True
+        state = read_snapshot(path or self.snapshot_path, SNAPSHOT_VERSION)
+        if state is None:
+            return False
+        for app_id, data in (state.get("apps") or {}).items():
+            loaded_at = data.pop("loaded_at", None) or 0
+            self._catalogs[int(app_id)] = TicketCatalog(int(app_id), **data)
+            self._loaded_at[int(app_id)] = loaded_at
+        return True
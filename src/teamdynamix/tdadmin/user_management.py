@@ -0,0 +1,500 @@
+__all__ = ['UserManager', 'ChunkProgress', 'RowError', 'BulkReport']
+
+import csv
+import io
+import json
+import os
+import threading
+import time
+import zipfile
+from dataclasses import dataclass, field
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from xml.sax.saxutils import escape
+from teamdynamix.exceptions import RequestError
+from teamdynamix.utils.concurrency import client_executor, map_concurrently
+from teamdynamix.utils.rate_limiter import RateLimiter
+
+# The people import processes one uploaded workbook per call, so larger
+# workbooks mean fewer calls against the limiter; 5,000 rows keeps a single
+# upload well under the web API's request size limit.
+DEFAULT_IMPORT_CHUNK_SIZE = 5000
+# Bulk endpoints take a UID list in the body; 1,000 UIDs is ~40KB of JSON.
+DEFAULT_BULK_CHUNK_SIZE = 1000
+
+REQUIRED_IMPORT_COLUMNS = ("Username", "First Name", "Last Name")
+
+Rows = Union[str, Path, io.TextIOBase, Iterable[Dict[str, Any]]]
+
+
+@dataclass
+class RowError:
+    """A row (or UID) that could not be processed."""
+    row: int
+    key: str
+    message: str
+
+
+@dataclass
+class BulkReport:
+    """Outcome of a chunked import or bulk operation."""
+    operation: str
+    rows: int = 0
+    chunks: int = 0
+    skipped_chunks: int = 0
+    calls: int = 0
+    elapsed: float = 0.0
+    errors: List[RowError] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def write_errors(self, path: Union[str, Path]) -> None:
+        """Write the per-row error report as CSV."""
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Row", "Key", "Error"])
+            for error in sorted(self.errors, key=lambda e: e.row):
+                writer.writerow([error.row, error.key, error.message])
+
+
+class ChunkProgress:
+    """
+    Records which chunks of a job have completed so a rerun can resume.
+
+    Chunks are identified by index, so a resumed run must read the same
+    source in the same order with the same chunk size; the chunk size is
+    stored with the progress and checked on load.
+    """
+
+    def __init__(self, path: Union[str, Path], chunk_size: int):
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self._lock = threading.Lock()
+        self._completed = set()
+        if self.path.exists():
+            state = json.loads(self.path.read_text(encoding="utf-8"))
+            if state.get("chunk_size") != chunk_size:
+                raise ValueError(
+                    f"Progress file {self.path} was written with chunk_size="
+                    f"{state.get('chunk_size')}, not {chunk_size}"
+                )
+            self._completed = set(state.get("completed", []))
+
+    def is_done(self, index: int) -> bool:
+        return index in self._completed
+
+    def mark_done(self, index: int) -> None:
+        with self._lock:
+            self._completed.add(index)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp.write_text(json.dumps({
+                "chunk_size": self.chunk_size,
+                "completed": sorted(self._completed)
+            }), encoding="utf-8")
+            os.replace(tmp, self.path)
+
+    @property
+    def completed(self) -> int:
+        return len(self._completed)
+
+
+def iter_rows(source: Rows) -> Iterator[Dict[str, Any]]:
+    """
+    Stream rows from a CSV path, an open text file or an iterable of dicts.
+
+    Args:
+        source: CSV file path, text file object or iterable of row dicts
+
+    Yields:
+        One dict per row
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, newline="", encoding="utf-8-sig") as f:
+            yield from csv.DictReader(f)
+    elif isinstance(source, io.TextIOBase):
+        yield from csv.DictReader(source)
+    else:
+        yield from source
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[Tuple[int, int, List[Any]]]:
+    """Yield (chunk index, first row number, items) without materializing the source."""
+    iterator = iter(items)
+    index, row = 0, 1
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield index, row, chunk
+        index += 1
+        row += len(chunk)
+
+
+def _column_name(index: int) -> str:
+    name = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        name = chr(65 + rem) + name
+    return name
+
+
+def _build_xlsx(header: Sequence[str], rows: Iterable[Sequence[Any]]) -> bytes:
+    """
+    Build a single-sheet .xlsx workbook using inline strings.
+
+    The people import only accepts Excel workbooks; this writes the minimal
+    OOXML package needed so the import does not depend on a spreadsheet library.
+    """
+    def row_xml(number: int, values: Sequence[Any]) -> str:
+        cells = "".join(
+            f'<c r="{_column_name(i)}{number}" t="inlineStr"><is><t>{escape(str(v))}</t></is></c>'
+            for i, v in enumerate(values) if v not in (None, "")
+        )
+        return f'<row r="{number}">{cells}</row>'
+
+    sheet_rows = [row_xml(1, header)]
+    sheet_rows.extend(row_xml(n, values) for n, values in enumerate(rows, start=2))
+
+    ns = "http://schemas.openxmlformats.org"
+    files = {
+        "[Content_Types].xml": (
+            f'<?xml version="1.0" encoding="UTF-8"?><Types xmlns="{ns}/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            '</Types>'
+        ),
+        "_rels/.rels": (
+            f'<?xml version="1.0" encoding="UTF-8"?><Relationships xmlns="{ns}/package/2006/relationships">'
+            f'<Relationship Id="rId1" Type="{ns}/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+            '</Relationships>'
+        ),
+        "xl/workbook.xml": (
+            f'<?xml version="1.0" encoding="UTF-8"?><workbook xmlns="{ns}/spreadsheetml/2006/main" '
+            f'xmlns:r="{ns}/officeDocument/2006/relationships">'
+            '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets></workbook>'
+        ),
+        "xl/_rels/workbook.xml.rels": (
+            f'<?xml version="1.0" encoding="UTF-8"?><Relationships xmlns="{ns}/package/2006/relationships">'
+            f'<Relationship Id="rId1" Type="{ns}/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+            '</Relationships>'
+        ),
+        "xl/worksheets/sheet1.xml": (
+            f'<?xml version="1.0" encoding="UTF-8"?><worksheet xmlns="{ns}/spreadsheetml/2006/main">'
+            f'<sheetData>{"".join(sheet_rows)}</sheetData></worksheet>'
+        ),
+    }
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+class UserManager:
+    """Manages bulk user (people) operations for TeamDynamix"""
+
+    def __init__(self, client):
+        """
+        Initialize UserManager.
+
+        Args:
+            client: TeamDynamix API client instance
+        """
+        self._client = client
+
+    @RateLimiter()
+    def upload_import(self, workbook: bytes, filename: str = "people.xlsx") -> Any:
+        """
+        Uploads a people import workbook to be processed by TeamDynamix.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            workbook: Contents of an .xlsx people import file
+            filename: Name reported for the uploaded file
+
+        Returns:
+            Response from the API
+        """
+        return self._client.post(
+            "api/people/import",
+            files={"file": (
+                filename,
+                workbook,
+                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            )}
+        )
+
+    @RateLimiter()
+    def change_status(self, uids: List[str], is_active: bool) -> Any:
+        """
+        Activates or deactivates a collection of users.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            uids: UIDs of the users to update
+            is_active: New active status
+
+        Returns:
+            Response from the API
+        """
+        return self._client.post(
+            "api/people/bulk/changestatus",
+            json=list(uids),
+            params={"isActive": str(is_active).lower()}
+        )
+
+    @RateLimiter()
+    def manage_applications(self, uids: List[str], application_names: List[str],
+                            replace_existing: bool = False) -> Any:
+        """
+        Grants a collection of users access to applications.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            uids: UIDs of the users to update
+            application_names: System names of the applications to grant
+            replace_existing: Remove applications not in ``application_names``
+
+        Returns:
+            Response from the API
+        """
+        return self._client.post("api/people/bulk/manageapplications", json={
+            "UserUids": list(uids),
+            "ApplicationNames": list(application_names),
+            "ReplaceExistingApplications": replace_existing
+        })
+
+    @RateLimiter()
+    def manage_groups(self, uids: List[str], group_ids: List[int],
+                      remove_other_groups: bool = False) -> Any:
+        """
+        Adds a collection of users to groups.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            uids: UIDs of the users to update
+            group_ids: IDs of the groups to add the users to
+            remove_other_groups: Remove the users from groups not in ``group_ids``
+
+        Returns:
+            Response from the API
+        """
+        return self._client.post("api/people/bulk/managegroups", json={
+            "UserUids": list(uids),
+            "GroupIDs": list(group_ids),
+            "RemoveOtherGroups": remove_other_groups
+        })
+
+    @RateLimiter()
+    def change_security_role(self, uids: List[str], security_role_id: str) -> Any:
+        """
+        Changes the security role of a collection of users.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            uids: UIDs of the users to update
+            security_role_id: ID of the security role to apply
+
+        Returns:
+            Response from the API
+        """
+        return self._client.post(
+            "api/people/bulk/changesecurityrole",
+            json=list(uids),
+            params={"securityRoleId": security_role_id}
+        )
+
+    @RateLimiter()
+    def change_account(self, uids: List[str], account_id: int) -> Any:
+        """
+        Changes the acct/dept of a collection of users.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            uids: UIDs of the users to update
+            account_id: ID of the acct/dept to apply
+
+        Returns:
+            Response from the API
+        """
+        return self._client.post(
+            "api/people/bulk/changeacctdept",
+            json=list(uids),
+            params={"accountId": account_id}
+        )
+
+    def _run_chunked(
+        self,
+        operation: str,
+        items: Iterable[Any],
+        submit: Callable[[List[Any]], Any],
+        key: Callable[[Any], str],
+        chunk_size: int,
+        max_workers: int,
+        progress: Optional[Union[str, Path, ChunkProgress]],
+        validate: Optional[Callable[[Any], Optional[str]]] = None
+    ) -> BulkReport:
+        """
+        Split ``items`` into chunks and submit them concurrently.
+
+        Invalid items are reported and left out of their chunk; a failed
+        chunk reports every item it carried so the error report stays per-row.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if progress is not None and not isinstance(progress, ChunkProgress):
+            progress = ChunkProgress(progress, chunk_size)
+
+        started = time.perf_counter()
+        report = BulkReport(operation=operation)
+        report_lock = threading.Lock()
+
+        def pending_chunks():
+            for index, first_row, chunk in _chunks(items, chunk_size):
+                report.rows += len(chunk)
+                if progress is not None and progress.is_done(index):
+                    report.skipped_chunks += 1
+                    continue
+                yield index, first_row, chunk
+
+        def process(entry: Tuple[int, int, List[Any]]) -> None:
+            index, first_row, chunk = entry
+            valid, errors, failed = [], [], False
+            for offset, item in enumerate(chunk):
+                message = validate(item) if validate else None
+                if message:
+                    errors.append(RowError(first_row + offset, key(item), message))
+                else:
+                    valid.append((first_row + offset, item))
+            if valid:
+                try:
+                    submit([item for _, item in valid])
+                except RequestError as e:
+                    errors.extend(RowError(row, key(item), str(e)) for row, item in valid)
+                    failed = True
+                with report_lock:
+                    report.calls += 1
+            with report_lock:
+                report.chunks += 1
+                report.errors.extend(errors)
+            # A chunk whose call failed stays pending so a rerun retries it
+            if progress is not None and not failed:
+                progress.mark_done(index)
+
+        for _, _, error in map_concurrently(
+            process, pending_chunks(), max_workers, executor=client_executor(self._client)
+        ):
+            if error is not None:
+                raise error
+
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def import_people(
+        self,
+        rows: Rows,
+        chunk_size: int = DEFAULT_IMPORT_CHUNK_SIZE,
+        max_workers: int = 2,
+        progress: Optional[Union[str, Path, ChunkProgress]] = None,
+        columns: Optional[Sequence[str]] = None
+    ) -> BulkReport:
+        """
+        Streams people rows into the TeamDynamix people import.
+
+        Rows are read lazily, grouped into ``chunk_size`` workbooks and
+        uploaded on ``max_workers`` threads, so memory stays bounded by the
+        chunks in flight regardless of the source size. Rows missing a
+        required column are reported instead of uploaded.
+
+        Args:
+            rows: CSV file path, text file object or iterable of row dicts
+                keyed by people import column names
+            chunk_size: Rows per uploaded workbook
+            max_workers: Number of uploads in flight
+            progress: Progress file (or ChunkProgress) used to resume a run
+            columns: Workbook column order; defaults to the first row's keys
+
+        Returns:
+            BulkReport including per-row errors
+        """
+        source = iter_rows(rows)
+        first = next(source, None)
+        if first is None:
+            return BulkReport(operation="import_people")
+        header: List[str] = list(columns or first.keys())
+
+        def validate(row: Dict[str, Any]) -> Optional[str]:
+            missing = [c for c in REQUIRED_IMPORT_COLUMNS if not str(row.get(c) or "").strip()]
+            return f"Missing required column(s): {', '.join(missing)}" if missing else None
+
+        def submit(chunk: List[Dict[str, Any]]) -> Any:
+            workbook = _build_xlsx(header, ([row.get(c) for c in header] for row in chunk))
+            return self.upload_import(workbook)
+
+        return self._run_chunked(
+            "import_people",
+            chain([first], source),
+            submit,
+            key=lambda row: str(row.get("Username") or ""),
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            progress=progress,
+            validate=validate
+        )
+
+    def bulk(
+        self,
+        operation: str,
+        uids: Iterable[str],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_workers: int = 2,
+        progress: Optional[Union[str, Path, ChunkProgress]] = None,
+        **options
+    ) -> BulkReport:
+        """
+        Applies a bulk people operation to any number of users in chunks.
+
+        Args:
+            operation: One of ``change_status``, ``manage_applications``,
+                ``manage_groups``, ``change_security_role``, ``change_account``
+            uids: UIDs of the users to update (streamed)
+            chunk_size: UIDs per call
+            max_workers: Number of calls in flight
+            progress: Progress file (or ChunkProgress) used to resume a run
+            **options: Remaining arguments of the operation, e.g.
+                ``is_active=False`` or ``group_ids=[1110]``
+
+        Returns:
+            BulkReport including per-UID errors
+        """
+        operations = {
+            "change_status": self.change_status,
+            "manage_applications": self.manage_applications,
+            "manage_groups": self.manage_groups,
+            "change_security_role": self.change_security_role,
+            "change_account": self.change_account,
+        }
+        if operation not in operations:
+            raise ValueError(f"Unknown bulk operation: {operation}")
+        method = operations[operation]
+
+        return self._run_chunked(
+            operation,
+            (str(uid).strip() for uid in uids),
+            lambda chunk: method(chunk, **options),
+            key=str,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            progress=progress,
+            validate=lambda uid: None if uid else "Empty UID"
+        )
@@ -1,3 +1,4 @@
 from .core import TDNext
+from .scope import AppScope, AppTickets
 
-__all__ = ['TDNext']
\ No newline at end of file
+__all__ = ['TDNext', 'AppScope', 'AppTickets']
\ No newline at end of file
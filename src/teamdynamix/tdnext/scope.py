@@ -0,0 +1,111 @@
+__all__ = ['AppScope', 'AppTickets']
+
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+from teamdynamix.tdnext.tickets.hydrate import HydratedTicket
+from teamdynamix.tdnext.tickets.tickets import Ticket, ticket_prefix
+from teamdynamix.utils.concurrency import map_concurrently
+
+
+class AppTickets:
+    """
+    Ticket operations bound to one application.
+
+    The same calls as TicketManager without the AppID argument; the ID is
+    validated and the URL prefix built once, when the scope is created.
+    """
+
+    def __init__(self, manager, app_id: int):
+        self._manager = manager
+        self._client = manager._client
+        self.app_id, self.prefix = ticket_prefix(app_id)
+
+    def create(self, **fields) -> Ticket:
+        """Creates a ticket in this application (see ``TicketManager.create``)."""
+        return self._manager.create(AppID=self.app_id, **fields)
+
+    def get(self, ticket_id: int) -> Ticket:
+        """Gets a ticket of this application."""
+        return self._manager.get(self.app_id, ticket_id)
+
+    def search(self, raw: bool = False, **criteria) -> List[Any]:
+        """Searches this application's tickets (see ``TicketManager.search``)."""
+        return self._manager.search(self.app_id, raw=raw, **criteria)
+
+    def ticket(self, ticket_id: int) -> Ticket:
+        """A Ticket handle for calling ticket operations without fetching it first."""
+        return Ticket(_client=self._client, ID=ticket_id, AppID=self.app_id)
+
+    def hydrate_many(self, ticket_ids: Sequence[Any], parts: Optional[Sequence[str]] = None,
+                     **kwargs) -> List[HydratedTicket]:
+        """Hydrates tickets of this application, given as Tickets or IDs."""
+        tickets = [t if isinstance(t, Ticket) else self.ticket(t) for t in ticket_ids]
+        return self._manager.hydrate_many(tickets, parts, **kwargs)
+
+
+class AppScope:
+    """
+    A view of the client bound to one application, e.g. ``client.app(122)``.
+
+    On creation it starts loading the application's reference data in the
+    background: the application record, its ticket types/statuses/priorities/
+    sources catalog and its ticket attribute definitions, all in parallel.
+    Ticket creates through the scope are then validated locally as soon as
+    the catalog is in.
+    """
+
+    def __init__(self, client, app_id: int, prefetch: bool = True):
+        """
+        Initialize AppScope.
+
+        Args:
+            client: TeamDynamix API client instance
+            app_id: ID of the application
+            prefetch: Start loading reference data in the background
+        """
+        self._client = client
+        self.tickets = AppTickets(client.tickets, app_id)
+        self.app_id = self.tickets.app_id
+        self.errors: Dict[str, BaseException] = {}
+        self._ready = threading.Event()
+        if prefetch:
+            threading.Thread(target=self._prefetch, daemon=True,
+                             name=f"teamdynamix-app-{self.app_id}").start()
+        else:
+            self._ready.set()
+
+    def _prefetch(self) -> None:
+        tdadmin = self._client.tdadmin
+        loaders = {
+            "application": lambda: tdadmin.applications.get(self.app_id),
+            "catalog": lambda: tdadmin.type_categories.catalog(self.app_id),
+            "attributes": lambda: tdadmin.attributes.ticket_schema(self.app_id),
+        }
+        try:
+            for name, _, error in map_concurrently(lambda n: loaders[n](), list(loaders), len(loaders)):
+                if error is not None:
+                    self.errors[name] = error
+        finally:
+            self._ready.set()
+
+    def ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the prefetch to finish; True if it did within ``timeout``."""
+        return self._ready.wait(timeout)
+
+    @property
+    def application(self) -> Optional[Dict[str, Any]]:
+        """The application record (from the cached application list)."""
+        return self._client.tdadmin.applications.get(self.app_id)
+
+    @property
+    def catalog(self):
+        """Ticket types, statuses, priorities and sources of the application."""
+        return self._client.tdadmin.type_categories.catalog(self.app_id)
+
+    @property
+    def attributes(self):
+        """Ticket custom attribute definitions of the application."""
+        return self._client.tdadmin.attributes.ticket_schema(self.app_id)
+
+    def __repr__(self) -> str:
+        return f"<AppScope {self.app_id}>"
@@ -1,3 +1,11 @@
 from .tickets import Ticket, TicketManager
+from .attributes import AttributeView, extract_attributes
+from .sla import SlaEngine, SlaReport
+from .changes import ChangeDetector, ChangeType, TicketChange
+from .export import TicketExporter, ExportReport
+from .hydrate import HydratedTicket, TICKET_PARTS
+from .outbox import TicketOutbox, OutboxHandle, OutboxStatus
 
-__all__ = ['Ticket', 'TicketManager']
\ No newline at end of file
+__all__ = ['Ticket', 'TicketManager', 'AttributeView', 'extract_attributes', 'SlaEngine', 'SlaReport',
+           'ChangeDetector', 'ChangeType', 'TicketChange', 'TicketExporter', 'ExportReport',
+           'HydratedTicket', 'TICKET_PARTS', 'TicketOutbox', 'OutboxHandle', 'OutboxStatus']
\ No newline at end of file
@@ -0,0 +1,119 @@
+__all__ = ['AttributeView', 'extract_attributes']
+
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+AttributeKey = Union[int, str]
+
+
+def _name_key(name: Any) -> str:
+    return str(name or "").strip().casefold()
+
+
+class AttributeView(Mapping):
+    """
+    Read-only mapping over an item's custom attributes.
+
+    The API returns attributes as a list of dicts; this indexes them by ID
+    and (case-insensitive) name on first access so every later lookup is a
+    dict hit instead of a scan. Keys may be attribute names or integer IDs.
+    ``view[key]`` returns the display text (``ValueText``, falling back to
+    ``Value``); use :meth:`value` for the raw value.
+    """
+
+    __slots__ = ('_attributes', '_by_id', '_by_name')
+
+    def __init__(self, attributes: Optional[List[Dict[str, Any]]]):
+        self._attributes = attributes or []
+        self._by_id: Optional[Dict[int, Dict[str, Any]]] = None
+        self._by_name: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _build(self) -> None:
+        by_id, by_name = {}, {}
+        for attribute in self._attributes:
+            if attribute.get("ID") is not None:
+                by_id[int(attribute["ID"])] = attribute
+            by_name.setdefault(_name_key(attribute.get("Name")), attribute)
+        self._by_id, self._by_name = by_id, by_name
+
+    def field(self, key: AttributeKey) -> Dict[str, Any]:
+        """The full attribute dict for ``key``; raises KeyError if absent."""
+        if self._by_id is None:
+            self._build()
+        assert self._by_id is not None and self._by_name is not None
+        found = self._by_id.get(key) if isinstance(key, int) else self._by_name.get(_name_key(key))
+        if found is None:
+            raise KeyError(key)
+        return found
+
+    def value(self, key: AttributeKey, default: Any = None) -> Any:
+        """The raw ``Value`` (choice IDs for choice attributes)."""
+        try:
+            return self.field(key).get("Value")
+        except KeyError:
+            return default
+
+    def __getitem__(self, key: AttributeKey) -> Any:
+        attribute = self.field(key)
+        text = attribute.get("ValueText")
+        return text if text not in (None, "") else attribute.get("Value")
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self.field(key)  # type: ignore[arg-type]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        return (a.get("Name") for a in self._attributes)
+
+    def __len__(self) -> int:
+        return len(self._attributes)
+
+    def __repr__(self) -> str:
+        return f"AttributeView({dict(self.items())!r})"
+
+
+def extract_attributes(
+    items: Iterable[Any],
+    names: Sequence[AttributeKey],
+    raw: bool = False,
+    id_field: str = "ID"
+) -> Dict[str, List[Any]]:
+    """
+    Pull the same attributes out of many items into columns.
+
+    Each item's attribute list is walked once and the requested keys are
+    then read from that pass, so the cost is one scan per item regardless
+    of how many columns are requested. The result can be passed straight to
+    ``pandas.DataFrame`` or written as CSV.
+
+    Args:
+        items: Tickets (or ticket dicts) carrying an ``Attributes`` list
+        names: Attribute names or IDs to extract; each becomes a column
+        raw: Return raw ``Value`` instead of display text
+        id_field: Item field emitted as the first column
+
+    Returns:
+        Dict of column name to list of values, one entry per item
+    """
+    columns: Dict[str, List[Any]] = {id_field: []}
+    wanted = [(str(n), n if isinstance(n, int) else _name_key(n)) for n in names]
+    for column, _ in wanted:
+        columns[column] = []
+
+    for item in items:
+        if isinstance(item, dict):
+            item_id, attributes = item.get(id_field), item.get("Attributes")
+        else:
+            item_id, attributes = getattr(item, id_field, None), item.Attributes
+        row: Dict[Any, Any] = {}
+        for attribute in attributes or []:
+            text = attribute.get("ValueText")
+            value = attribute.get("Value") if raw or text in (None, "") else text
+            row[attribute.get("ID")] = value
+            row.setdefault(_name_key(attribute.get("Name")), value)
+        columns[id_field].append(item_id)
+        for column, key in wanted:
+            columns[column].append(row.get(key))
+    return columns
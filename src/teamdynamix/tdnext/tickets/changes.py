@@ -0,0 +1,231 @@
+__all__ = ['ChangeDetector', 'ChangeType', 'TicketChange', 'DEFAULT_FINGERPRINT_FIELDS']
+
+import hashlib
+import sqlite3
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from teamdynamix.utils.codec import DEFAULT_CODEC
+
+# Fields whose change counts as a ticket change. ModifiedDate is left out on
+# purpose: TDX bumps it for edits nobody downstream cares about.
+DEFAULT_FINGERPRINT_FIELDS: Tuple[str, ...] = (
+    "StatusID", "PriorityID", "TypeID", "Title", "AccountID",
+    "ResponsibleUid", "ResponsibleGroupID", "IsSlaViolated",
+    "IsOnHold", "RespondByDate", "ResolveByDate", "CompletedDate",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    app_id INTEGER NOT NULL,
+    ticket_id INTEGER NOT NULL,
+    digest BLOB NOT NULL,
+    status_id INTEGER,
+    responsible TEXT,
+    sla_violated INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (app_id, ticket_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS detector (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# SQLite's default limit on host parameters is 999; stay well under it.
+_LOOKUP_CHUNK = 400
+
+
+class ChangeType:
+    """Kinds of change the detector reports."""
+    CREATED = "created"
+    STATUS_CHANGED = "status_changed"
+    REASSIGNED = "reassigned"
+    SLA_VIOLATED = "sla_violated"
+    # Any other fingerprinted field changed
+    UPDATED = "updated"
+
+
+@dataclass(frozen=True)
+class TicketChange:
+    """A change observed on one ticket between two batches."""
+    type: str
+    app_id: int
+    ticket_id: int
+    old: Any
+    new: Any
+    ticket: Any
+
+
+def _get(ticket: Any, name: str) -> Any:
+    return ticket.get(name) if isinstance(ticket, dict) else getattr(ticket, name, None)
+
+
+def _responsible(ticket: Any) -> str:
+    return f"{_get(ticket, 'ResponsibleUid') or ''}|{_get(ticket, 'ResponsibleGroupID') or ''}"
+
+
+class ChangeDetector:
+    """
+    Finds tickets that changed between polls without keeping full copies.
+
+    Each ticket is reduced to a 16-byte BLAKE2 digest of the fingerprinted
+    fields, stored in SQLite together with the few values the typed events
+    report (status, responsible person/group, SLA flag). A batch is checked
+    with one indexed lookup per few hundred tickets; only tickets whose
+    digest differs are examined further, and the store survives restarts,
+    so a restarted poller does not re-announce every ticket.
+
+    Example:
+        detector = ChangeDetector("ticket-fingerprints.sqlite3")
+        detector.on(ChangeType.STATUS_CHANGED, notify_requestor)
+        detector.poll(client.tickets, 122, StatusIDs=[28549, 28550])
+    """
+
+    def __init__(self, path: str = "ticket-fingerprints.sqlite3",
+                 fields: Sequence[str] = DEFAULT_FINGERPRINT_FIELDS,
+                 report_created: bool = True):
+        """
+        Initialize ChangeDetector.
+
+        Args:
+            path: SQLite file holding the fingerprints (":memory:" for none)
+            fields: Ticket fields included in the fingerprint
+            report_created: Emit CREATED for tickets seen for the first time
+        """
+        self.fields = tuple(fields)
+        self.report_created = report_created
+        self._listeners: Dict[str, List[Callable[[TicketChange], None]]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._reset_on_field_change()
+
+    def _reset_on_field_change(self) -> None:
+        """Digests over a different field list can not be compared; start over."""
+        fields = ",".join(self.fields)
+        row = self._db.execute("SELECT value FROM detector WHERE key = 'fields'").fetchone()
+        if row is None or row[0] != fields:
+            with self._db:
+                if row is not None:
+                    self._db.execute("DELETE FROM fingerprints")
+                self._db.execute("INSERT OR REPLACE INTO detector VALUES ('fields', ?)", (fields,))
+
+    def fingerprint(self, ticket: Any) -> bytes:
+        """Digest of a ticket's fingerprinted fields."""
+        values = [_get(ticket, name) for name in self.fields]
+        return hashlib.blake2b(DEFAULT_CODEC.dumps(values), digest_size=16).digest()
+
+    def on(self, change_type: str, listener: Callable[[TicketChange], None]) -> None:
+        """Call ``listener(change)`` for every change of ``change_type``."""
+        self._listeners[change_type].append(listener)
+
+    def _stored(self, keys: List[Tuple[int, int]]) -> Dict[Tuple[int, int], Tuple]:
+        stored: Dict[Tuple[int, int], Tuple] = {}
+        by_app: Dict[int, List[int]] = defaultdict(list)
+        for app_id, ticket_id in keys:
+            by_app[app_id].append(ticket_id)
+        for app_id, ticket_ids in by_app.items():
+            for start in range(0, len(ticket_ids), _LOOKUP_CHUNK):
+                chunk = ticket_ids[start:start + _LOOKUP_CHUNK]
+                rows = self._db.execute(
+                    "SELECT ticket_id, digest, status_id, responsible, sla_violated "
+                    f"FROM fingerprints WHERE app_id = ? AND ticket_id IN ({','.join('?' * len(chunk))})",
+                    (app_id, *chunk)
+                )
+                for ticket_id, *row in rows:
+                    stored[(app_id, ticket_id)] = tuple(row)
+        return stored
+
+    def diff(self, tickets: Iterable[Any], app_id: Optional[int] = None,
+             commit: bool = True) -> List[TicketChange]:
+        """
+        Compare a batch of tickets with the stored fingerprints.
+
+        Args:
+            tickets: Ticket objects or ticket dicts (e.g. search results)
+            app_id: Application ID for tickets that do not carry AppID
+            commit: Store the new fingerprints; pass False to preview changes
+
+        Returns:
+            Changes in batch order; a ticket can produce several (e.g. a
+            status change and a reassignment)
+        """
+        batch = []
+        for ticket in tickets:
+            key = (int(_get(ticket, "AppID") or app_id or 0), int(_get(ticket, "ID")))
+            batch.append((key, ticket, self.fingerprint(ticket)))
+
+        changes: List[TicketChange] = []
+        updates = []
+        with self._lock:
+            stored = self._stored([key for key, _, _ in batch])
+            for (app, ticket_id), ticket, digest in batch:
+                previous = stored.get((app, ticket_id))
+                if previous is not None and previous[0] == digest:
+                    continue
+                status = _get(ticket, "StatusID")
+                responsible = _responsible(ticket)
+                violated = bool(_get(ticket, "IsSlaViolated"))
+                updates.append((app, ticket_id, digest, status, responsible, int(violated)))
+
+                if previous is None:
+                    if self.report_created:
+                        changes.append(TicketChange(ChangeType.CREATED, app, ticket_id,
+                                                    None, status, ticket))
+                    continue
+                _, old_status, old_responsible, old_violated = previous
+                typed = False
+                if old_status != status:
+                    changes.append(TicketChange(ChangeType.STATUS_CHANGED, app, ticket_id,
+                                                old_status, status, ticket))
+                    typed = True
+                if old_responsible != responsible:
+                    changes.append(TicketChange(ChangeType.REASSIGNED, app, ticket_id,
+                                                old_responsible, responsible, ticket))
+                    typed = True
+                if violated and not old_violated:
+                    changes.append(TicketChange(ChangeType.SLA_VIOLATED, app, ticket_id,
+                                                False, True, ticket))
+                    typed = True
+                if not typed:
+                    changes.append(TicketChange(ChangeType.UPDATED, app, ticket_id,
+                                                None, None, ticket))
+
+            if commit and updates:
+                with self._db:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?, ?, ?)", updates
+                    )
+
+        for change in changes:
+            for listener in self._listeners.get(change.type, ()):
+                listener(change)
+        return changes
+
+    def poll(self, manager, app_id: int, **criteria) -> List[TicketChange]:
+        """
+        Search an application's tickets and diff the results.
+
+        Args:
+            manager: TicketManager to search with
+            app_id: ID of the ticketing application
+            **criteria: TicketSearch fields (e.g. StatusIDs, ModifiedDateFrom)
+
+        Returns:
+            Changes found in the search results
+        """
+        return self.diff(manager.search(app_id, **criteria), app_id=app_id)
+
+    def forget(self, app_id: int, ticket_ids: Iterable[int]) -> None:
+        """Drop stored fingerprints, e.g. for deleted tickets."""
+        with self._lock, self._db:
+            self._db.executemany("DELETE FROM fingerprints WHERE app_id = ? AND ticket_id = ?",
+                                 [(app_id, t) for t in ticket_ids])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM fingerprints").fetchone()[0]
+
+    def close(self) -> None:
+        self._db.close()
@@ -0,0 +1,137 @@
+__all__ = ['HydratedTicket', 'TICKET_PARTS', 'hydrate_tickets']
+
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple
+from teamdynamix.exceptions import RequestError
+from teamdynamix.utils.concurrency import client_executor, map_concurrently
+
+# Sub-resources a ticket can be hydrated with, and how each is fetched.
+# Attachments are not a list endpoint of their own; they come with the ticket.
+_FETCHERS: Dict[str, Callable[[Any], Any]] = {
+    "feed": lambda ticket: ticket.get_feed(),
+    "contacts": lambda ticket: ticket.get_contacts(),
+    "assets": lambda ticket: ticket.get_assets(),
+    "tasks": lambda ticket: ticket.get_tasks(),
+    "attachments": lambda ticket: (
+        ticket.Attachments if ticket.Attachments is not None
+        else ticket.refresh().Attachments
+    ),
+}
+TICKET_PARTS: Tuple[str, ...] = tuple(_FETCHERS)
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of decoded JSON: dicts become mapping proxies, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True)
+class HydratedTicket:
+    """
+    A ticket together with its sub-resources, read-only.
+
+    Parts that were not requested are None; parts that failed to load are
+    None with the error message in ``errors``.
+    """
+    ticket: Any
+    feed: Optional[Tuple[Mapping[str, Any], ...]] = None
+    contacts: Optional[Tuple[Mapping[str, Any], ...]] = None
+    assets: Optional[Tuple[Mapping[str, Any], ...]] = None
+    attachments: Optional[Tuple[Mapping[str, Any], ...]] = None
+    tasks: Optional[Tuple[Mapping[str, Any], ...]] = None
+    errors: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def __getattr__(self, name: str) -> Any:
+        # Ticket fields read straight through, e.g. hydrated.Title
+        if name.startswith("__") or name == "ticket":
+            raise AttributeError(name)
+        return getattr(self.ticket, name)
+
+
+def _validate_parts(parts: Optional[Sequence[str]]) -> Tuple[str, ...]:
+    parts = tuple(dict.fromkeys(parts or TICKET_PARTS))
+    unknown = [p for p in parts if p not in _FETCHERS]
+    if unknown:
+        raise ValueError(f"Unknown ticket parts: {', '.join(unknown)}; expected {', '.join(TICKET_PARTS)}")
+    return parts
+
+
+def hydrate_tickets(
+    client,
+    tickets: Iterable[Any],
+    parts: Optional[Sequence[str]] = None,
+    cache: Optional[MutableMapping[Tuple[int, int, str], Any]] = None,
+    max_workers: int = 8
+) -> List[HydratedTicket]:
+    """
+    Fetch the requested sub-resources of many tickets concurrently.
+
+    Every (ticket, part) pair is one unit of work, so a single ticket's parts
+    load side by side and many tickets share the same ``max_workers`` slots;
+    the rate limiters on the Ticket methods still bound the request rate.
+    Parts found in ``cache`` (keyed by ``(AppID, ID, part)``) are not fetched,
+    and fetched parts are stored back into it.
+
+    Args:
+        client: TeamDynamix API client instance
+        tickets: Tickets to hydrate
+        parts: Parts to load (default: all of ``TICKET_PARTS``)
+        cache: Mapping to read and fill, e.g. a dict or a TTL cache (optional)
+        max_workers: Maximum calls in flight
+
+    Returns:
+        One HydratedTicket per ticket, in input order
+    """
+    parts = _validate_parts(parts)
+    tickets = list(tickets)
+    started = time.perf_counter()
+    loaded: List[Dict[str, Any]] = [{} for _ in tickets]
+    errors: List[Dict[str, str]] = [{} for _ in tickets]
+
+    work = []
+    for index, ticket in enumerate(tickets):
+        for part in parts:
+            key = (ticket.AppID, ticket.ID, part)
+            if cache is not None and key in cache:
+                loaded[index][part] = cache[key]
+            else:
+                work.append((index, part))
+
+    def fetch(item: Tuple[int, str]) -> Any:
+        index, part = item
+        return _FETCHERS[part](tickets[index])
+
+    for (index, part), result, error in map_concurrently(
+        fetch, work, max_workers, executor=client_executor(client)
+    ):
+        if error is None:
+            result = result or []
+            loaded[index][part] = result
+            if cache is not None:
+                cache[(tickets[index].AppID, tickets[index].ID, part)] = result
+        elif isinstance(error, RequestError):
+            errors[index][part] = str(error)
+        else:
+            raise error
+
+    elapsed = time.perf_counter() - started
+    return [
+        HydratedTicket(
+            ticket=ticket,
+            errors=MappingProxyType(errors[index]),
+            elapsed=elapsed,
+            **{part: _freeze(value) for part, value in loaded[index].items()}
+        )
+        for index, ticket in enumerate(tickets)
+    ]
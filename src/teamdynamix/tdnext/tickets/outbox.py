@@ -0,0 +1,430 @@
+__all__ = ['TicketOutbox', 'OutboxHandle', 'OutboxStatus']
+
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Union
+from teamdynamix.exceptions import CircuitOpenError, RequestError
+from teamdynamix.tdnext.tickets.tickets import Ticket
+from teamdynamix.utils.codec import DEFAULT_CODEC
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    app_id INTEGER NOT NULL,
+    ticket_id INTEGER,
+    payload BLOB NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    enqueued_at REAL NOT NULL,
+    next_attempt_at REAL NOT NULL,
+    finished_at REAL,
+    result BLOB,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_ready ON outbox (status, next_attempt_at, id);
+"""
+
+# Writes that post a new resource; resending one whose outcome is unknown
+# could create it twice.
+_NOT_IDEMPOTENT = {"create", "update"}
+
+
+class OutboxStatus:
+    """States of a queued write."""
+    PENDING = "pending"
+    INFLIGHT = "inflight"
+    DONE = "done"
+    FAILED = "failed"
+    # The request may or may not have reached TDX (timeout, dropped
+    # connection, crash mid-call); it is not resent automatically.
+    UNKNOWN = "unknown"
+
+    FINAL = (DONE, FAILED, UNKNOWN)
+
+
+class OutboxHandle:
+    """Reference to a queued write, returned as soon as it is stored."""
+
+    def __init__(self, outbox: 'TicketOutbox', key: str):
+        self._outbox = outbox
+        self.key = key
+
+    @property
+    def status(self) -> str:
+        return self._outbox._row(self.key)["status"]
+
+    @property
+    def done(self) -> bool:
+        return self.status in OutboxStatus.FINAL
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for the write to be sent and return the API response.
+
+        Raises:
+            TimeoutError: If it is still queued after ``timeout`` seconds
+            RequestError: If the write failed or its outcome is unknown
+        """
+        row = self._outbox._wait(self.key, timeout)
+        if row["status"] == OutboxStatus.DONE:
+            return DEFAULT_CODEC.loads(row["result"]) if row["result"] else None
+        raise RequestError(f"Outbox write {self.key} {row['status']}: {row['error']}")
+
+    def __repr__(self) -> str:
+        return f"<OutboxHandle {self.key}>"
+
+
+class TicketOutbox:
+    """
+    Durable write-behind queue for ticket creates, updates and edits.
+
+    Writes are committed to a local SQLite file and a handle is returned
+    straight away; background workers send them through the regular
+    TicketManager/Ticket methods, so they drain as fast as the rate limiters
+    allow without ever blocking the caller. Queued writes survive restarts.
+
+    Each write carries an idempotency key. Enqueueing the same key twice
+    returns the existing handle, so a caller retrying its own request does
+    not queue a second ticket. A create or feed update whose outcome is
+    unknown (timeout, dropped connection, process killed mid-call) is never
+    resent blindly: it is parked as ``unknown`` unless ``resolve_unknown``
+    confirms it did not happen. Edits replace the whole ticket and are
+    simply retried.
+
+    Example:
+        with TicketOutbox(client, "outbox.sqlite3") as outbox:
+            handle = outbox.create(AppID=122, TypeID=4713, Title="Printer jam", ...)
+            ...
+            ticket_json = handle.result(timeout=30)
+    """
+
+    def __init__(
+        self,
+        client,
+        path: str = "teamdynamix-outbox.sqlite3",
+        workers: int = 2,
+        max_attempts: int = 5,
+        backoff: float = 2.0,
+        resolve_unknown: Optional[Callable[[str, str, Dict[str, Any]], Optional[bool]]] = None,
+        start: bool = True
+    ):
+        """
+        Initialize the outbox.
+
+        Args:
+            client: TeamDynamix API client instance
+            path: SQLite file holding the queue
+            workers: Background threads sending writes
+            max_attempts: Attempts before a write is marked failed
+            backoff: Base delay in seconds between attempts, doubled each time
+            resolve_unknown: Called as ``resolve_unknown(key, kind, payload)``
+                for a non-idempotent write with an unknown outcome; return
+                False to resend it, True to mark it done, None to leave it
+                as ``unknown`` (optional)
+            start: Start the workers immediately
+        """
+        self._client = client
+        self.path = path
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.resolve_unknown = resolve_unknown
+        self._codec = DEFAULT_CODEC
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._worker_count = workers
+        self._sent = 0
+        self._latency_total = 0.0
+
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._recover()
+        if start:
+            self.start()
+
+    def _recover(self) -> None:
+        """Writes left in flight by a previous process are retried or parked."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE outbox SET status = ?, error = 'interrupted' "
+                "WHERE status = ? AND kind IN ('create', 'update')",
+                (OutboxStatus.UNKNOWN, OutboxStatus.INFLIGHT)
+            )
+            self._db.execute(
+                "UPDATE outbox SET status = ? WHERE status = ?",
+                (OutboxStatus.PENDING, OutboxStatus.INFLIGHT)
+            )
+
+    # Enqueueing
+
+    def _enqueue(self, kind: str, app_id: int, ticket_id: Optional[int],
+                 payload: Dict[str, Any], key: Optional[str]) -> OutboxHandle:
+        key = key or uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR IGNORE INTO outbox "
+                "(key, kind, app_id, ticket_id, payload, status, enqueued_at, next_attempt_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, kind, int(app_id), ticket_id, self._codec.dumps(payload),
+                 OutboxStatus.PENDING, now, now)
+            )
+            self._changed.notify_all()
+        return OutboxHandle(self, key)
+
+    def create(self, idempotency_key: Optional[str] = None, **ticket_fields) -> OutboxHandle:
+        """
+        Queues a ticket creation.
+
+        Args:
+            idempotency_key: Key identifying this write (generated if omitted)
+            **ticket_fields: Arguments for ``TicketManager.create``, including AppID
+
+        Returns:
+            OutboxHandle for the queued write
+        """
+        if "AppID" not in ticket_fields:
+            raise ValueError("AppID is required")
+        return self._enqueue("create", ticket_fields["AppID"], None, ticket_fields,
+                             idempotency_key)
+
+    def update(self, ticket: Union[Ticket, Dict[str, Any]], item_update: Dict,
+               idempotency_key: Optional[str] = None) -> OutboxHandle:
+        """
+        Queues a ticket feed update (``Ticket.update``).
+
+        Args:
+            ticket: Ticket, or a mapping with its ``AppID`` and ``ID``
+            item_update: Update data
+            idempotency_key: Key identifying this write (generated if omitted)
+        """
+        app_id, ticket_id = _ids(ticket)
+        return self._enqueue("update", app_id, ticket_id, item_update, idempotency_key)
+
+    def edit(self, ticket: Union[Ticket, Dict[str, Any]], updated_ticket: Dict,
+             notify_new_responsible: bool = False,
+             idempotency_key: Optional[str] = None) -> OutboxHandle:
+        """
+        Queues a full ticket edit (``Ticket.edit``).
+
+        Args:
+            ticket: Ticket, or a mapping with its ``AppID`` and ``ID``
+            updated_ticket: Updated ticket data
+            notify_new_responsible: Whether to notify newly responsible people
+            idempotency_key: Key identifying this write (generated if omitted)
+        """
+        app_id, ticket_id = _ids(ticket)
+        payload = {"ticket": updated_ticket, "notify_new_responsible": notify_new_responsible}
+        return self._enqueue("edit", app_id, ticket_id, payload, idempotency_key)
+
+    def handle(self, key: str) -> OutboxHandle:
+        """Handle for a previously queued write."""
+        self._row(key)
+        return OutboxHandle(self, key)
+
+    # Draining
+
+    def start(self) -> None:
+        """Start the background workers."""
+        self._stop.clear()
+        while len(self._threads) < self._worker_count:
+            thread = threading.Thread(target=self._work, daemon=True,
+                                      name=f"teamdynamix-outbox-{len(self._threads)}")
+            thread.start()
+            self._threads.append(thread)
+
+    def _claim(self) -> Optional[sqlite3.Row]:
+        """Mark the next ready write in flight, waiting briefly if there is none."""
+        with self._lock:
+            while not self._stop.is_set():
+                now = time.time()
+                row = self._db.execute(
+                    "SELECT * FROM outbox WHERE status = ? AND next_attempt_at <= ? "
+                    "ORDER BY id LIMIT 1",
+                    (OutboxStatus.PENDING, now)
+                ).fetchone()
+                if row is not None:
+                    self._db.execute(
+                        "UPDATE outbox SET status = ?, attempts = attempts + 1 WHERE id = ?",
+                        (OutboxStatus.INFLIGHT, row["id"])
+                    )
+                    return row
+                delay = self._db.execute(
+                    "SELECT MIN(next_attempt_at) FROM outbox WHERE status = ?",
+                    (OutboxStatus.PENDING,)
+                ).fetchone()[0]
+                self._changed.wait(min(1.0, max(0.01, delay - now)) if delay else 1.0)
+        return None
+
+    def _send(self, row: sqlite3.Row) -> Any:
+        payload = self._codec.loads(row["payload"])
+        if row["kind"] == "create":
+            return self._client.tickets.create(**payload)
+        ticket = Ticket(_client=self._client, ID=row["ticket_id"], AppID=row["app_id"])
+        if row["kind"] == "update":
+            return ticket.update(payload)
+        return ticket.edit(payload["ticket"], payload["notify_new_responsible"])
+
+    def _work(self) -> None:
+        while not self._stop.is_set():
+            row = self._claim()
+            if row is None:
+                continue
+            try:
+                result = self._send(row)
+            except RequestError as e:
+                self._failed(row, e)
+            except Exception as e:
+                self._finish(row, OutboxStatus.FAILED, error=str(e))
+            else:
+                if isinstance(result, Ticket):
+                    result = {"ID": result.ID, "AppID": result.AppID or row["app_id"]}
+                self._finish(row, OutboxStatus.DONE, result=result)
+
+    def _failed(self, row: sqlite3.Row, error: RequestError) -> None:
+        if isinstance(error, CircuitOpenError):
+            # Rejected before anything was sent: retry once the breaker may
+            # let calls through, without using up an attempt
+            self._retry(row, max(error.retry_after, self.backoff), error, attempts=row["attempts"])
+            return
+        status_code = getattr(error, "status_code", None)
+        # Without a status the request may have been processed anyway
+        if status_code is None and row["kind"] in _NOT_IDEMPOTENT:
+            resolved = None
+            if self.resolve_unknown is not None:
+                resolved = self.resolve_unknown(row["key"], row["kind"],
+                                                self._codec.loads(row["payload"]))
+            if resolved is None:
+                self._finish(row, OutboxStatus.UNKNOWN, error=str(error))
+                return
+            if resolved:
+                self._finish(row, OutboxStatus.DONE)
+                return
+
+        retryable = status_code is None or status_code == 429 or status_code >= 500
+        if not retryable or row["attempts"] + 1 >= self.max_attempts:
+            self._finish(row, OutboxStatus.FAILED, error=str(error))
+            return
+        self._retry(row, self.backoff * 2 ** row["attempts"], error, attempts=row["attempts"] + 1)
+
+    def _retry(self, row: sqlite3.Row, delay: float, error: RequestError, attempts: int) -> None:
+        with self._lock:
+            self._db.execute(
+                "UPDATE outbox SET status = ?, next_attempt_at = ?, attempts = ?, error = ? "
+                "WHERE id = ?",
+                (OutboxStatus.PENDING, time.time() + delay, attempts, str(error), row["id"])
+            )
+            self._changed.notify_all()
+
+    def _finish(self, row: sqlite3.Row, status: str, result: Any = None,
+                error: Optional[str] = None) -> None:
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "UPDATE outbox SET status = ?, finished_at = ?, result = ?, error = ? WHERE id = ?",
+                (status, now, None if result is None else self._codec.dumps(result),
+                 error, row["id"])
+            )
+            if status == OutboxStatus.DONE:
+                self._sent += 1
+                self._latency_total += now - row["enqueued_at"]
+            self._changed.notify_all()
+
+    # Inspection
+
+    def _row(self, key: str) -> sqlite3.Row:
+        with self._lock:
+            row = self._db.execute("SELECT * FROM outbox WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return row
+
+    def _wait(self, key: str, timeout: Optional[float]) -> sqlite3.Row:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while True:
+                row = self._db.execute("SELECT * FROM outbox WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    raise KeyError(key)
+                if row["status"] in OutboxStatus.FINAL:
+                    return row
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"Outbox write {key} is still {row['status']}")
+                self._changed.wait(1.0 if remaining is None else min(1.0, remaining))
+
+    def requeue(self, key: str) -> None:
+        """Send a failed or unknown write again, e.g. once it is confirmed it never landed."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE outbox SET status = ?, attempts = 0, next_attempt_at = ?, error = NULL "
+                "WHERE key = ? AND status IN (?, ?)",
+                (OutboxStatus.PENDING, time.time(), key, OutboxStatus.FAILED, OutboxStatus.UNKNOWN)
+            )
+            self._changed.notify_all()
+
+    def purge(self, older_than: float = 86400) -> int:
+        """Delete completed writes finished more than ``older_than`` seconds ago."""
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM outbox WHERE status = ? AND finished_at < ?",
+                (OutboxStatus.DONE, time.time() - older_than)
+            )
+            return cursor.rowcount
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, lag and throughput for logging or monitoring."""
+        now = time.time()
+        with self._lock:
+            counts = dict(self._db.execute(
+                "SELECT status, COUNT(*) FROM outbox GROUP BY status"
+            ).fetchall())
+            oldest = self._db.execute(
+                "SELECT MIN(enqueued_at) FROM outbox WHERE status IN (?, ?)",
+                (OutboxStatus.PENDING, OutboxStatus.INFLIGHT)
+            ).fetchone()[0]
+            sent, latency_total = self._sent, self._latency_total
+        return {
+            "depth": counts.get(OutboxStatus.PENDING, 0) + counts.get(OutboxStatus.INFLIGHT, 0),
+            **{status: counts.get(status, 0) for status in (
+                OutboxStatus.PENDING, OutboxStatus.INFLIGHT, OutboxStatus.DONE,
+                OutboxStatus.FAILED, OutboxStatus.UNKNOWN)},
+            "lag_seconds": round(now - oldest, 3) if oldest else 0.0,
+            "sent": sent,
+            "mean_latency_seconds": round(latency_total / sent, 3) if sent else 0.0,
+        }
+
+    def close(self, wait: bool = True) -> None:
+        """Stop the workers; writes not yet sent stay queued for the next start.
+
+        With ``wait=False`` the workers finish their current write in the
+        background and the database stays open.
+        """
+        self._stop.set()
+        with self._lock:
+            self._changed.notify_all()
+        if not wait:
+            return
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self._db.close()
+
+    def __enter__(self) -> 'TicketOutbox':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _ids(ticket: Union[Ticket, Dict[str, Any]]):
+    if isinstance(ticket, Ticket):
+        return ticket.AppID, ticket.ID
+    return ticket["AppID"], ticket["ID"]
@@ -1,9 +1,14 @@
 __all__ = ['Ticket', 'TicketManager']
 
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, MutableMapping, Optional, Any, Sequence, Tuple, Union
 from uuid import UUID
 from datetime import datetime
+from functools import cached_property, lru_cache
+from teamdynamix.utils.codec import DEFAULT_CODEC, JSONCodec
 from teamdynamix.utils.rate_limiter import RateLimiter 
+from teamdynamix.tdnext.tickets.attributes import AttributeView
+from teamdynamix.tdnext.tickets.hydrate import HydratedTicket, hydrate_tickets
+from teamdynamix.tdadmin.type_categories import TicketCatalog
 from dataclasses import dataclass, field, fields
 
 @dataclass(frozen=True)
@@ -146,12 +151,26 @@ class Ticket:
     
 
     @classmethod
-    def from_dict(cls, client, data: Dict[str, Any]) -> 'Ticket':
-        """Create a Ticket instance from a dictionary of attributes."""
+    def from_dict(cls, client, data: Union[Dict[str, Any], bytes, str]) -> 'Ticket':
+        """
+        Create a Ticket instance from a dictionary of attributes.
+        Raw JSON (bytes or str) is decoded with the client's codec first.
+        """
+        if isinstance(data, (bytes, bytearray, str)):
+            codec = getattr(client, "codec", None)
+            data = (codec if isinstance(codec, JSONCodec) else DEFAULT_CODEC).loads(data)
         # Filter out unknown fields from the response data
-        valid_fields = {f.name for f in fields(cls)}
+        valid_fields = _field_names(cls)
         filtered_data = {k: v for k, v in data.items() if k in valid_fields}
         return cls(_client=client, **filtered_data)
+
+    @cached_property
+    def attr(self) -> AttributeView:
+        """
+        Custom attributes indexed by name and ID, e.g. ``ticket.attr["Building"]``.
+        The index is built on first access and reused afterwards.
+        """
+        return AttributeView(self.Attributes)
     
     def _base_url(self, endpoint: str = "") -> str:
         """
@@ -163,7 +182,39 @@ class Ticket:
         Returns:
             Complete endpoint URL
         """
-        return f"/{self.AppID}/tickets/{self.ID}{endpoint}"
+        return f"api/{self.AppID}/tickets/{self.ID}{endpoint}"
+
+    @RateLimiter()
+    def refresh(self) -> 'Ticket':
+        """
+        Gets the current state of this ticket.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Returns:
+            A new Ticket with the latest data
+        """
+        return Ticket.from_dict(self._client, self._client.get(self._base_url()))
+
+    def hydrate(
+        self,
+        parts: Optional[Sequence[str]] = None,
+        cache: Optional[MutableMapping[Tuple[int, int, str], Any]] = None
+    ) -> HydratedTicket:
+        """
+        Loads the ticket's feed, contacts, assets, attachments and tasks concurrently.
+
+        The parts are fetched side by side, so the wait is roughly that of the
+        slowest call rather than the sum of them.
+
+        Args:
+            parts: Parts to load (default: all of them)
+            cache: Mapping of ``(AppID, ID, part)`` to reuse and fill (optional)
+
+        Returns:
+            Read-only HydratedTicket
+        """
+        return hydrate_tickets(self._client, [self], parts, cache=cache,
+                               max_workers=len(parts or ()) or 5)[0]
 
     @RateLimiter()
     def remove_asset(self, asset_id: int) -> bool:
@@ -210,6 +261,28 @@ class Ticket:
             files=attachment
         )
 
+    @RateLimiter()
+    def get_assets(self) -> List[Dict]:
+        """
+        Gets the assets/CIs associated with the ticket.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Returns:
+            List of associated configuration items
+        """
+        return self._client.get(self._base_url("/assets"))
+
+    @RateLimiter()
+    def get_tasks(self) -> List[Dict]:
+        """
+        Gets the ticket tasks.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Returns:
+            List of ticket tasks
+        """
+        return self._client.get(self._base_url("/tasks"))
+
     @RateLimiter()
     def get_contacts(self) -> List[Dict]:
         """
@@ -293,6 +366,33 @@ class Ticket:
         )
 
 
+@lru_cache(maxsize=None)
+def _field_names(cls) -> frozenset:
+    """Field names of a dataclass, computed once per class."""
+    return frozenset(f.name for f in fields(cls))
+
+
+@lru_cache(maxsize=1024)
+def _cached_prefix(app_id: Any) -> Tuple[int, str]:
+    return int(app_id), f"api/{int(app_id)}/tickets"
+
+
+def ticket_prefix(app_id: Any) -> Tuple[int, str]:
+    """
+    Validated application ID and its ``api/{appId}/tickets`` URL prefix.
+
+    Computed once per distinct AppID value, so hot paths do neither the
+    integer conversion nor the string building per call.
+
+    Raises:
+        ValueError: If the AppID is not an integer
+    """
+    try:
+        return _cached_prefix(app_id)
+    except (TypeError, ValueError):
+        raise ValueError(f"AppID must be an integer, got {type(app_id)}: {app_id}")
+
+
 class TicketManager:
     """Manages ticket operations for TeamDynamix"""
     
@@ -309,6 +409,80 @@ class TicketManager:
         """Build URL with required appId parameter"""
         return f"/api/{appId}/tickets{endpoint}"
 
+    def _catalog(self, app_id: int, fetch: bool, recheck: bool = False) -> Optional[TicketCatalog]:
+        """
+        The application's type/status catalog, if one is (or, with ``fetch``,
+        can be) loaded. ``recheck`` asks for a fresh copy instead, if the
+        loaded one is old enough to be worth fetching again.
+        """
+        tdadmin = getattr(self._client, "tdadmin", None)
+        manager = getattr(tdadmin, "type_categories", None)
+        if manager is None or not hasattr(manager, "peek"):
+            return None
+        if recheck:
+            catalog = manager.recheck(app_id)
+        else:
+            catalog = manager.catalog(app_id) if fetch else manager.peek(app_id)
+        return catalog if isinstance(catalog, TicketCatalog) else None
+
+    @RateLimiter()
+    def get(self, app_id: int, ticket_id: int) -> Ticket:
+        """
+        Gets a ticket.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            app_id: ID of the ticketing application
+            ticket_id: ID of the ticket
+
+        Returns:
+            Ticket
+        """
+        _, prefix = ticket_prefix(app_id)
+        return Ticket.from_dict(self._client, self._client.get(f"{prefix}/{ticket_id}"))
+
+    @RateLimiter()
+    def search(self, app_id: int, raw: bool = False, **criteria) -> Union[List[Ticket], List[Dict]]:
+        """
+        Gets a list of tickets.
+        Rate limit: 60 calls per IP address every 60 seconds.
+
+        Args:
+            app_id: ID of the ticketing application
+            raw: Return the decoded JSON dicts instead of Ticket objects
+            **criteria: TicketSearch fields (e.g. StatusIDs, ModifiedDateFrom, MaxResults)
+
+        Returns:
+            List of tickets matching the criteria. Search results do not include
+            custom attributes or the full description.
+        """
+        _, prefix = ticket_prefix(app_id)
+        results = self._client.post(f"{prefix}/search", json=criteria) or []
+        if raw:
+            return results
+        return [Ticket.from_dict(self._client, item) for item in results]
+
+    def hydrate_many(
+        self,
+        tickets: List[Ticket],
+        parts: Optional[Sequence[str]] = None,
+        cache: Optional[MutableMapping[Tuple[int, int, str], Any]] = None,
+        max_workers: int = 8
+    ) -> List[HydratedTicket]:
+        """
+        Loads sub-resources for many tickets, all parts of all tickets concurrently.
+
+        Args:
+            tickets: Tickets to hydrate
+            parts: Parts to load: feed, contacts, assets, attachments, tasks (default: all)
+            cache: Mapping of ``(AppID, ID, part)`` to reuse and fill (optional)
+            max_workers: Maximum calls in flight; the rate limiters still apply
+
+        Returns:
+            One read-only HydratedTicket per ticket, in input order
+        """
+        return hydrate_tickets(self._client, tickets, parts, cache=cache, max_workers=max_workers)
+
 
     @RateLimiter(max_calls=120, period=60)
     def create(
@@ -332,13 +506,23 @@ class TicketManager:
         NotifyResponsible: bool = True,
         AllowRequestorCreation: bool = True,
         ApplyDefaults: bool = True,
+        validate: Optional[bool] = None,
         **additional_fields
     ) -> Ticket:
-        """Creates a ticket."""
-        try:
-            app_id = int(AppID)
-        except (TypeError, ValueError):
-            raise ValueError(f"AppID must be an integer, got {type(AppID)}: {AppID}")
+        """
+        Creates a ticket.
+
+        The type, status, priority and source IDs are checked against the
+        application's catalog before anything is sent. With ``validate=None``
+        this happens only when the catalog is already in memory or in its
+        snapshot; True fetches it if needed, False skips the check. A payload
+        the catalog rejects is checked again against a freshly fetched one
+        before it is refused, unless the catalog was only just loaded.
+
+        Raises:
+            ValueError: If AppID is not an integer or the payload fails validation
+        """
+        app_id, prefix = ticket_prefix(AppID)
         # Construct the ticket data (body)
         ticket_data = {
             "TypeID": TypeID,
@@ -358,10 +542,21 @@ class TicketManager:
         if Classification is not None: ticket_data["Classification"] = Classification
         if Attributes is not None: ticket_data["Attributes"] = Attributes
         if Notify is not None: ticket_data["Notify"] = Notify
+
+        if validate is not False:
+            catalog = self._catalog(app_id, fetch=bool(validate))
+            problems = catalog.validate(ticket_data) if catalog is not None else []
+            if problems:
+                # The catalog may predate a type or status added since; check once more
+                catalog = self._catalog(app_id, fetch=False, recheck=True)
+                if catalog is not None:
+                    problems = catalog.validate(ticket_data)
+            if problems:
+                raise ValueError("Invalid ticket: " + "; ".join(problems))
         
         # Make the API call
         response = self._client.post(
-            f"api/{app_id}/tickets",
+            prefix,
             json=ticket_data,
             params={
                 "EnableNotifyReviewer": str(EnableNotifyReviewer).lower(),
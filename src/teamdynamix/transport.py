@@ -0,0 +1,178 @@
+"""Pluggable HTTP transports for the TeamDynamix client."""
+
+import json as jsonlib
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+import requests
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx is an optional dependency
+    httpx = None
+
+__all__ = ['Transport', 'Response', 'RequestsTransport', 'HttpxTransport']
+
+Timeout = Optional[Union[float, Tuple[float, float]]]
+
+
+class Response:
+    """
+    Minimal response object for transports not built on requests.
+
+    Exposes the parts of ``requests.Response`` the client relies on, and
+    raises ``requests.exceptions.HTTPError`` from :meth:`raise_for_status`
+    so error handling is the same whichever transport is used.
+    """
+
+    def __init__(self, status_code: int, content: bytes = b"",
+                 headers: Optional[Mapping[str, str]] = None, url: str = ""):
+        self.status_code = status_code
+        self.content = content
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+        self.url = url
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return jsonlib.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} Error for url: {self.url}", response=self
+            )
+
+    def __repr__(self) -> str:
+        return f"<Response [{self.status_code}]>"
+
+
+class Transport:
+    """
+    Sends HTTP requests for the client.
+
+    The interface mirrors ``requests``: ``request()`` takes the same keyword
+    arguments and returns an object with ``status_code``, ``headers``,
+    ``content``, ``text``, ``json()`` and ``raise_for_status()``. Failures
+    are raised as ``requests.exceptions`` so the client maps them the same
+    way for every transport.
+    """
+    name = "base"
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                params: Optional[Dict] = None, data: Any = None, json: Any = None,
+                files: Optional[Dict] = None, timeout: Timeout = None) -> Any:
+        raise NotImplementedError
+
+    def post(self, url: str, **kwargs) -> Any:
+        return self.request("POST", url, **kwargs)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Transport details for logging or monitoring."""
+        return {"transport": self.name}
+
+    def close(self) -> None:
+        pass
+
+
+class RequestsTransport(Transport):
+    """
+    HTTP/1.1 transport built on ``requests`` (the default).
+
+    Without a session the module-level ``requests`` functions are used, so a
+    new connection is opened per call; pass a ``requests.Session`` to reuse
+    connections.
+    """
+    name = "requests"
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session = session
+
+    def request(self, method: str, url: str, **kwargs) -> Any:
+        # Looked up per call so code patching requests.request still applies
+        http = self.session if self.session is not None else requests
+        return http.request(method=method, url=url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Any:
+        http = self.session if self.session is not None else requests
+        return http.post(url, **kwargs)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {"transport": self.name, "session": self.session is not None}
+
+    def close(self) -> None:
+        if self.session is not None:
+            self.session.close()
+
+
+class HttpxTransport(Transport):
+    """
+    Transport built on ``httpx``, with HTTP/2 by default.
+
+    Over HTTP/2 concurrent calls to the same host are multiplexed over a
+    single connection instead of one socket each. Falls back to HTTP/1.1
+    when the server does not negotiate HTTP/2 (e.g. plain http).
+    """
+    name = "httpx"
+
+    def __init__(self, http2: bool = True, max_connections: int = 10,
+                 client: Optional[Any] = None):
+        """
+        Initialize HttpxTransport.
+
+        Args:
+            http2: Negotiate HTTP/2 (needs the ``h2`` package)
+            max_connections: Maximum open connections in the pool
+            client: Existing ``httpx.Client`` to use (optional)
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError("HttpxTransport requires httpx (pip install 'httpx[http2]')")
+        self.http2 = http2
+        # requests follows redirects by default; match it
+        self.client = client or httpx.Client(
+            http2=http2,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections)
+        )
+
+    @staticmethod
+    def _timeout(timeout: Timeout) -> Any:
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                params: Optional[Dict] = None, data: Any = None, json: Any = None,
+                files: Optional[Dict] = None, timeout: Timeout = None) -> Response:
+        body: Dict[str, Any] = {}
+        if isinstance(data, (bytes, str)):
+            body["content"] = data
+        elif data is not None:
+            body["data"] = data
+        try:
+            response = self.client.request(
+                method, url, headers=headers, params=params, json=json, files=files,
+                timeout=self._timeout(timeout), **body
+            )
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e))
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e))
+        except httpx.TooManyRedirects as e:
+            raise requests.exceptions.TooManyRedirects(str(e))
+        except httpx.HTTPError as e:
+            # e.g. DecodingError; anything else httpx raises while sending
+            raise requests.exceptions.RequestException(str(e))
+        return Response(response.status_code, response.content, response.headers, str(response.url))
+
+    def metrics(self) -> Dict[str, Any]:
+        return {"transport": self.name, "http2": self.http2}
+
+    def close(self) -> None:
+        self.client.close()
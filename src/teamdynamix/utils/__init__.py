@@ -1,3 +1,4 @@
 from .rate_limiter import RateLimiter
+from .concurrency import client_executor, map_concurrently
 
-__all__ = ['RateLimiter']
+__all__ = ['RateLimiter', 'client_executor', 'map_concurrently']
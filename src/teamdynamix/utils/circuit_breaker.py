@@ -0,0 +1,139 @@
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Deque, Dict, Optional
+
+# Numeric path segments (app, ticket, group IDs...) and GUIDs collapse into
+# one breaker per endpoint rather than one per resource.
+_ID_SEGMENT = re.compile(
+    r"/(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})(?=/|$)"
+)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    """
+    Thresholds for per-endpoint circuit breakers.
+
+    Attributes:
+        failure_rate: Fraction of failed calls in the window that opens the breaker
+        min_calls: Calls that must be in the window before the rate is judged
+        window: Number of most recent calls the rate is computed over
+        open_seconds: How long an open breaker fails fast before a trial call
+        half_open_calls: Trial calls allowed while half-open
+    """
+    failure_rate: float = 0.5
+    min_calls: int = 10
+    window: int = 20
+    open_seconds: float = 30.0
+    half_open_calls: int = 1
+
+
+def endpoint_key(method: str, endpoint: str) -> str:
+    """Breaker key for a call, e.g. ``GET api/{id}/tickets/{id}/feed``."""
+    path = "/" + endpoint.split("?", 1)[0].strip("/")
+    return f"{method.upper()} {_ID_SEGMENT.sub('/{id}', path).lstrip('/')}"
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open breaker over a rolling window of call outcomes.
+
+    While closed, calls flow and outcomes are recorded. Once the window holds
+    ``min_calls`` outcomes and the failure fraction reaches ``failure_rate``
+    the breaker opens and calls fail fast. After ``open_seconds`` it goes
+    half-open and lets ``half_open_calls`` trial calls through: a success
+    closes it, a failure opens it again.
+    """
+
+    def __init__(self, config: CircuitBreakerConfig):
+        self.config = config
+        self.state = CircuitState.CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=config.window)
+        self._opened_at = 0.0
+        self._trials = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    def retry_after(self) -> float:
+        return max(0.0, self._opened_at + self.config.open_seconds - time.monotonic())
+
+    def allow(self) -> bool:
+        """Whether a call may proceed; counts a rejection if not."""
+        with self._lock:
+            if self.state is CircuitState.OPEN and self.retry_after() <= 0:
+                self.state = CircuitState.HALF_OPEN
+                self._trials = 0
+            if self.state is CircuitState.HALF_OPEN:
+                if self._trials < self.config.half_open_calls:
+                    self._trials += 1
+                    return True
+            elif self.state is CircuitState.CLOSED:
+                return True
+            self._rejected += 1
+            return False
+
+    def record(self, success: bool) -> None:
+        """Record the outcome of a call that was allowed through."""
+        with self._lock:
+            if self.state is CircuitState.HALF_OPEN:
+                if success:
+                    self.state = CircuitState.CLOSED
+                    self._outcomes.clear()
+                else:
+                    self._open()
+                return
+            self._outcomes.append(success)
+            failures = self._outcomes.count(False)
+            if len(self._outcomes) >= self.config.min_calls and \
+                    failures / len(self._outcomes) >= self.config.failure_rate:
+                self._open()
+
+    def release(self) -> None:
+        """End an allowed call without an outcome, freeing its half-open trial slot."""
+        with self._lock:
+            if self.state is CircuitState.HALF_OPEN and self._trials > 0:
+                self._trials -= 1
+
+    def _open(self) -> None:
+        self.state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state.value,
+                "calls": len(self._outcomes),
+                "failures": self._outcomes.count(False),
+                "rejected": self._rejected,
+                "retry_after": round(self.retry_after(), 3) if self.state is CircuitState.OPEN else 0.0,
+            }
+
+
+class CircuitBreakerRegistry:
+    """Lazily creates one breaker per endpoint, all sharing a configuration."""
+
+    def __init__(self, config: Optional[CircuitBreakerConfig] = None):
+        self.config = config or CircuitBreakerConfig()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CircuitBreaker:
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(key, CircuitBreaker(self.config))
+        return breaker
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {key: breaker.snapshot() for key, breaker in list(self._breakers.items())}
@@ -0,0 +1,128 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Optional, Union
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+
+def _default(value: Any) -> Any:
+    """Serialize the non-JSON types that appear in ticket payloads."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JSONCodec:
+    """
+    Encodes request bodies and decodes response bodies.
+
+    Subclasses wrap a specific JSON library; use :func:`get_codec` to pick one.
+    """
+    name = "base"
+
+    def dumps(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: Union[bytes, bytearray, str]) -> Any:
+        raise NotImplementedError
+
+    def decode_response(self, response: Any) -> Any:
+        """Decode a response body, or None when it is empty."""
+        content = response.content
+        return self.loads(content) if content else None
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class StdlibCodec(JSONCodec):
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False,
+                          default=_default).encode("utf-8")
+
+    def loads(self, data: Union[bytes, bytearray, str]) -> Any:
+        return json.loads(data)
+
+    def decode_response(self, response: Any) -> Any:
+        # requests' own decoder handles charset detection for odd responses
+        return response.json() if response.content else None
+
+
+class OrjsonCodec(JSONCodec):
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default)
+
+    def loads(self, data: Union[bytes, bytearray, str]) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder(enc_hook=_default)
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, bytearray, str]) -> Any:
+        return self._decoder.decode(data.encode("utf-8") if isinstance(data, str) else data)
+
+
+_CODECS: Dict[str, Any] = {
+    "json": StdlibCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+
+def available_codecs() -> Dict[str, bool]:
+    """Which codecs can be used in this environment."""
+    return {"json": True, "orjson": orjson is not None, "msgspec": msgspec is not None}
+
+
+def get_codec(codec: Optional[Union[str, JSONCodec]] = None) -> JSONCodec:
+    """
+    Resolve a codec by name.
+
+    Args:
+        codec: ``"json"`` (the default), ``"orjson"``, ``"msgspec"``, ``"auto"``
+            for the fastest installed library, or a JSONCodec instance
+
+    Returns:
+        JSONCodec instance
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the requested library is not installed
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    name = codec or "json"
+    if name == "auto":
+        name = "orjson" if orjson is not None else "msgspec" if msgspec is not None else "json"
+    if name not in _CODECS:
+        raise ValueError(f"Unknown JSON codec: {name}")
+    if not available_codecs()[name]:
+        raise ImportError(f"The {name} codec requires the {name} package")
+    return _CODECS[name]()
+
+
+DEFAULT_CODEC = StdlibCodec()
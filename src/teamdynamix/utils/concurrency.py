@@ -0,0 +1,62 @@
+from concurrent.futures import FIRST_COMPLETED, Executor, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+DEFAULT_MAX_WORKERS = 4
+
+
+def map_concurrently(
+    func: Callable[[T], Any],
+    items: Iterable[T],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    executor: Optional[Executor] = None
+) -> Iterator[Tuple[T, Any, Optional[BaseException]]]:
+    """
+    Run ``func`` over ``items`` on worker threads, yielding as each finishes.
+
+    Items are pulled from ``items`` lazily and at most ``max_workers`` are in
+    flight at once, so a generator over a large file is streamed rather than
+    read into memory. Calls still pass through the rate limiters on the
+    methods they invoke, so ``max_workers`` bounds in-flight requests while
+    the limiters bound the request rate.
+
+    Args:
+        func: Callable applied to each item
+        items: Items to process
+        max_workers: Maximum number of items in flight
+        executor: Existing executor to submit work to (optional)
+
+    Yields:
+        (item, result, error) tuples in completion order; ``error`` is the
+        exception raised by ``func`` or None on success
+    """
+    max_workers = max(1, max_workers)
+    owned = executor is None
+    pool = executor or ThreadPoolExecutor(max_workers=max_workers)
+    iterator = iter(items)
+    pending = {}
+    try:
+        while True:
+            for item in iterator:
+                pending[pool.submit(func, item)] = item
+                if len(pending) >= max_workers:
+                    break
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                error = future.exception()
+                yield item, (None if error else future.result()), error
+    finally:
+        for future in pending:
+            future.cancel()
+        if owned:
+            pool.shutdown(wait=True)
+
+
+def client_executor(client: Any) -> Optional[Executor]:
+    """The executor a client was configured with, if any."""
+    executor = getattr(client, 'executor', None)
+    return executor if isinstance(executor, Executor) else None
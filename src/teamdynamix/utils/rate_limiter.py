@@ -3,13 +3,37 @@ from functools import wraps
 from collections import defaultdict
 import threading
 
+from teamdynamix.utils.response_cache import ResponseCache
+
+# Slots deferred by rate-limited calls running on this thread (see RateLimiter)
+_deferred = threading.local()
+
+
+def reserve_deferred() -> None:
+    """
+    Take the rate limit slots deferred by calls on this thread.
+
+    The client calls this right before it sends a request, so calls answered
+    from its response cache never use up (or wait for) a slot.
+    """
+    pending = getattr(_deferred, 'pending', None)
+    while pending:
+        pending.pop()()
+
+
 class RateLimiter:
-    """Rate limiter for TeamDynamix API - configurable calls per IP address per period"""
-    
+    """
+    Rate limiter for TeamDynamix API - configurable calls per IP address per period
+
+    For a client with a response cache the slot is reserved only once the
+    call actually sends a request, so cached reads are not throttled. Calls
+    through a client created with ``rate_limit=False`` are not throttled.
+    """
+
     def __init__(self, max_calls: int = 60, period: int = 60):
         """
         Initialize rate limiter with configurable limits
-        
+
         Args:
             max_calls: Maximum number of calls allowed per period (default: 60)
             period: Time period in seconds (default: 60)
@@ -19,29 +43,65 @@ class RateLimiter:
         self.timestamps = defaultdict(list)
         self.timestamps['api'] = []
         self.lock = threading.Lock()
+        self._key_locks = defaultdict(threading.Lock)
+
+    @staticmethod
+    def _key(args) -> str:
+        """
+        Bucket a call belongs to: the ``rate_limit_key`` of the client behind
+        the decorated object, so each TeamDynamix instance has its own budget.
+        """
+        client = getattr(args[0], '_client', None) if args else None
+        return getattr(client, 'rate_limit_key', None) or 'api'
+
+    def _reserve(self, key: str) -> None:
+        """Take a slot in ``key``'s bucket, sleeping until one is free."""
+        with self.lock:
+            key_lock = self._key_locks[key]
+
+        # Waiting for one bucket never blocks callers using another
+        with key_lock:
+            now = time.time()
+
+            # Clean old timestamps
+            self.timestamps[key] = [
+                ts for ts in self.timestamps[key]
+                if now - ts < self.period
+            ]
+
+            # Check if we've exceeded the rate limit
+            if len(self.timestamps[key]) >= self.max_calls:
+                oldest_call = self.timestamps[key][0]
+                sleep_time = self.period - (now - oldest_call)
+                if sleep_time > 0:
+                    time.sleep(sleep_time)
+                    now = time.time()
+
+            # Add current timestamp
+            self.timestamps[key].append(now)
 
     def __call__(self, func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            with self.lock:
-                now = time.time()
-                
-                # Clean old timestamps
-                self.timestamps['api'] = [
-                    ts for ts in self.timestamps['api'] 
-                    if now - ts < self.period
-                ]
-
-                # Check if we've exceeded the rate limit
-                if len(self.timestamps['api']) >= self.max_calls:
-                    oldest_call = self.timestamps['api'][0]
-                    sleep_time = self.period - (now - oldest_call)
-                    if sleep_time > 0:
-                        time.sleep(sleep_time)
-                        now = time.time()
-
-                # Add current timestamp
-                self.timestamps['api'].append(now)
-                
+            key = self._key(args)
+            client = getattr(args[0], '_client', None) if args else None
+            if getattr(client, 'rate_limit', True) is False:
+                return func(*args, **kwargs)
+            if not isinstance(getattr(client, 'cache', None), ResponseCache):
+                # The slot is reserved here; make the call itself outside the
+                # lock so concurrent callers are throttled, not serialized.
+                self._reserve(key)
+                return func(*args, **kwargs)
+
+            # The call may be answered from the cache: leave the slot to
+            # reserve_deferred(), and drop it if no request was sent
+            if not hasattr(_deferred, 'pending'):
+                _deferred.pending = []
+            pending = _deferred.pending
+            pending.append(lambda: self._reserve(key))
+            depth = len(pending)
+            try:
                 return func(*args, **kwargs)
-        return wrapper
\ No newline at end of file
+            finally:
+                del pending[depth - 1:]
+        return wrapper
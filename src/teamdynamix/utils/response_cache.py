@@ -0,0 +1,347 @@
+import bisect
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Union
+from urllib.parse import urlencode
+
+from teamdynamix.utils.circuit_breaker import endpoint_key
+
+__all__ = ['ResponseCache', 'CachedResponse', 'MemoryBackend', 'SqliteBackend']
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    content BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    expires_at REAL NOT NULL,
+    used_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at);
+CREATE INDEX IF NOT EXISTS responses_path ON responses (path);
+"""
+
+
+def resource_path(endpoint: str) -> str:
+    """The resource an endpoint addresses, e.g. ``api/122/tickets/555``."""
+    return endpoint.split("?", 1)[0].strip("/").lower()
+
+
+@dataclass
+class CachedResponse:
+    """A cached GET response body with its validators."""
+    key: str
+    path: str
+    content: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class MemoryBackend:
+    """In-process LRU store bounded by total body bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        # Keys by resource path, and the paths sorted so a subtree is one range
+        self._by_path: Dict[str, Set[str]] = {}
+        self._paths: List[str] = []
+
+    def _index(self, entry: CachedResponse) -> None:
+        keys = self._by_path.get(entry.path)
+        if keys is None:
+            keys = self._by_path[entry.path] = set()
+            bisect.insort(self._paths, entry.path)
+        keys.add(entry.key)
+
+    def _unindex(self, entry: CachedResponse) -> None:
+        keys = self._by_path[entry.path]
+        keys.discard(entry.key)
+        if not keys:
+            del self._by_path[entry.path]
+            del self._paths[bisect.bisect_left(self._paths, entry.path)]
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, entry: CachedResponse) -> None:
+        self.delete([entry.key])
+        if entry.size > self.max_bytes:
+            return
+        self._entries[entry.key] = entry
+        self._index(entry)
+        self.bytes += entry.size
+        while self.bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._unindex(evicted)
+            self.bytes -= evicted.size
+            self.evictions += 1
+
+    def delete(self, keys: List[str]) -> None:
+        for key in keys:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._unindex(entry)
+                self.bytes -= entry.size
+
+    def affected(self, paths: Iterable[str], subtree: str) -> List[str]:
+        """Keys cached for any of ``paths`` or for a path under ``subtree``."""
+        keys = [key for path in paths for key in self._by_path.get(path, ())]
+        prefix = subtree + "/"
+        for path in self._paths[bisect.bisect_left(self._paths, prefix):]:
+            if not path.startswith(prefix):
+                break
+            keys.extend(self._by_path[path])
+        return keys
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_path.clear()
+        self._paths.clear()
+        self.bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteBackend:
+    """
+    On-disk LRU store bounded by total body bytes, kept in one SQLite file.
+
+    Entries survive restarts; give each process its own file.
+    """
+
+    def __init__(self, path: Union[str, Path], max_bytes: int):
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self.bytes = self._db.execute(
+            "SELECT COALESCE(SUM(LENGTH(content)), 0) FROM responses"
+        ).fetchone()[0]
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        row = self._db.execute(
+            "SELECT key, path, content, etag, last_modified, expires_at FROM responses WHERE key = ?",
+            (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        with self._db:
+            self._db.execute("UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key))
+        return CachedResponse(*row)
+
+    def put(self, entry: CachedResponse) -> None:
+        self.delete([entry.key])
+        if entry.size > self.max_bytes:
+            return
+        with self._db:
+            self._db.execute(
+                "INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (entry.key, entry.path, entry.content, entry.etag, entry.last_modified,
+                 entry.expires_at, time.time())
+            )
+            self.bytes += entry.size
+            while self.bytes > self.max_bytes:
+                rows = self._db.execute(
+                    "SELECT key, LENGTH(content) FROM responses ORDER BY used_at LIMIT 32"
+                ).fetchall()
+                for key, size in rows:
+                    if self.bytes <= self.max_bytes:
+                        break
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self.bytes -= size
+                    self.evictions += 1
+
+    def delete(self, keys: List[str]) -> None:
+        with self._db:
+            for key in keys:
+                row = self._db.execute("SELECT LENGTH(content) FROM responses WHERE key = ?",
+                                       (key,)).fetchone()
+                if row is not None:
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self.bytes -= row[0]
+
+    def affected(self, paths: Iterable[str], subtree: str) -> List[str]:
+        """Keys cached for any of ``paths`` or for a path under ``subtree``."""
+        paths = list(paths)
+        # "0" sorts right after "/", so the range holds exactly the subtree
+        rows = self._db.execute(
+            f"SELECT key FROM responses WHERE path IN ({', '.join('?' * len(paths))}) "
+            "OR (path >= ? AND path < ?)",
+            (*paths, subtree + "/", subtree + "0")
+        ).fetchall()
+        return [key for key, in rows]
+
+    def clear(self) -> None:
+        with self._db:
+            self._db.execute("DELETE FROM responses")
+        self.bytes = 0
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+class ResponseCache:
+    """
+    Opt-in cache of GET response bodies for the client.
+
+    Entries are keyed by the caller's identity, the full URL and the query
+    parameters, so clients for different users or instances can share one
+    cache. Each endpoint gets a TTL from ``policies`` (glob patterns over
+    endpoint templates such as ``api/{id}/tickets/{id}/feed``) or the
+    default ``ttl``. Expired entries with an ETag or Last-Modified are
+    revalidated with a conditional request, and a 304 renews them without
+    downloading the body again. Any write (POST/PUT/PATCH/DELETE, except
+    POST searches) drops the cached responses of its resource, the resources
+    under it and the ones above it, so e.g. a new feed entry also drops the
+    cached ticket.
+
+    Example:
+        cache = ResponseCache(ttl=60, policies={"api/{id}/tickets/{id}/feed": 300,
+                                                "api/people/*": 3600})
+        client = TeamDynamix(..., cache=cache)
+    """
+
+    def __init__(self, ttl: float = 60.0, policies: Optional[Mapping[str, float]] = None,
+                 max_bytes: int = 64 * 1024 * 1024, path: Optional[Union[str, Path]] = None,
+                 revalidate: bool = True, stale_if_error: bool = False):
+        """
+        Initialize ResponseCache.
+
+        Args:
+            ttl: Seconds a response stays fresh when no policy matches; 0 disables
+            policies: TTL per endpoint template pattern; 0 never caches the endpoint
+            max_bytes: Total body size kept before least recently used entries go
+            path: SQLite file to keep the cache on disk; in memory if not given
+            revalidate: Revalidate expired entries with ETag/Last-Modified
+            stale_if_error: Answer a GET that failed with a 429, 5xx, timeout or
+                open circuit from an expired entry, if there is one
+        """
+        self.ttl = ttl
+        self.policies = dict(policies or {})
+        self.revalidate = revalidate
+        self.stale_if_error = stale_if_error
+        self.backend = SqliteBackend(path, max_bytes) if path else MemoryBackend(max_bytes)
+        self._counts = {"hits": 0, "misses": 0, "revalidated": 0, "stale_served": 0,
+                        "invalidated": 0}
+        self._lock = threading.Lock()
+
+    def ttl_for(self, endpoint: str) -> float:
+        """TTL for an endpoint: an exact policy, else the first matching pattern, else ``ttl``."""
+        template = endpoint_key("GET", endpoint)[len("GET "):]
+        if template in self.policies:
+            return self.policies[template]
+        for pattern, ttl in self.policies.items():
+            if fnmatchcase(template, pattern):
+                return ttl
+        return self.ttl
+
+    @staticmethod
+    def key(identity: str, url: str, params: Optional[Dict] = None) -> str:
+        query = urlencode(sorted((str(k), str(v)) for k, v in (params or {}).items()
+                                 if v is not None))
+        raw = f"{identity}\n{url}?{query}".encode("utf-8")
+        return hashlib.blake2b(raw, digest_size=20).hexdigest()
+
+    def fresh(self, key: str) -> Optional[CachedResponse]:
+        """A fresh entry for ``key``, counting a hit or a miss."""
+        with self._lock:
+            entry = self.backend.get(key)
+            found = entry is not None and entry.fresh()
+            self._counts["hits" if found else "misses"] += 1
+        return entry if found else None
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """The entry for ``key`` whether fresh or not, without counting."""
+        with self._lock:
+            return self.backend.get(key)
+
+    def stale(self, key: str) -> Optional[CachedResponse]:
+        """Any entry for ``key``, to answer a failed call with when ``stale_if_error`` is set."""
+        with self._lock:
+            entry = self.backend.get(key) if self.stale_if_error else None
+            if entry is not None:
+                self._counts["stale_served"] += 1
+        return entry
+
+    def store(self, key: str, endpoint: str, content: bytes,
+              headers: Mapping[str, str]) -> None:
+        """Cache a 2xx response unless its endpoint's TTL is 0 or it is marked no-store."""
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0 or "no-store" in headers.get("Cache-Control", "").lower():
+            return
+        entry = CachedResponse(key, resource_path(endpoint), content, headers.get("ETag"),
+                               headers.get("Last-Modified"), time.time() + ttl)
+        with self._lock:
+            self.backend.put(entry)
+
+    def renew(self, entry: CachedResponse, endpoint: str, headers: Mapping[str, str]) -> None:
+        """Extend an entry the server confirmed with a 304."""
+        entry.expires_at = time.time() + self.ttl_for(endpoint)
+        entry.etag = headers.get("ETag") or entry.etag
+        entry.last_modified = headers.get("Last-Modified") or entry.last_modified
+        with self._lock:
+            self.backend.put(entry)
+            self._counts["revalidated"] += 1
+
+    def invalidate(self, endpoint: str) -> int:
+        """
+        Drop cached responses affected by a write to ``endpoint``.
+
+        Returns:
+            Number of entries dropped
+        """
+        path = resource_path(endpoint)
+        parts = path.split("/")
+        ancestors = ["/".join(parts[:i]) for i in range(1, len(parts))]
+        with self._lock:
+            keys = self.backend.affected([path, *ancestors], path)
+            self.backend.delete(keys)
+            self._counts["invalidated"] += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.backend.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._counts["hits"] + self._counts["misses"]
+            return {
+                **self._counts,
+                "hit_rate": round(self._counts["hits"] / lookups, 3) if lookups else 0.0,
+                "entries": len(self.backend),
+                "bytes": self.backend.bytes,
+                "evictions": self.backend.evictions,
+            }
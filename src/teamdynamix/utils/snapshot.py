@@ -0,0 +1,39 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+def write_snapshot(path: Union[str, Path], version: int, **payload: Any) -> None:
+    """
+    Atomically write a versioned JSON snapshot.
+
+    The file is written next to its destination and renamed over it, so a
+    crash mid-write never leaves a truncated snapshot behind.
+
+    Args:
+        path: Destination file
+        version: Schema version stored with the payload
+        **payload: JSON-serializable contents
+    """
+    target = Path(path)
+    tmp = target.with_suffix(target.suffix + ".tmp")
+    tmp.write_text(json.dumps({"version": version, **payload}), encoding="utf-8")
+    os.replace(tmp, target)
+
+
+def read_snapshot(path: Union[str, Path], version: int) -> Optional[Dict[str, Any]]:
+    """
+    Read a snapshot written by :func:`write_snapshot`.
+
+    Returns:
+        The snapshot contents, or None if the file is missing, unreadable or
+        was written with a different version
+    """
+    try:
+        state = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get("version") != version:
+        return None
+    return state
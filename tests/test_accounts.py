@@ -0,0 +1,79 @@
+from unittest.mock import Mock
+
+from teamdynamix.exceptions import RequestError
+from teamdynamix.tdadmin.accounts import AccountHierarchy, AccountManager
+
+
+ACCOUNTS = [
+    {"ID": 1, "Name": "University", "ParentID": None},
+    {"ID": 10, "Name": "College X", "ParentID": 1},
+    {"ID": 11, "Name": "Physics", "ParentID": 10, "Code": "PHYS"},
+    {"ID": 12, "Name": "Chemistry", "ParentID": 10},
+    {"ID": 20, "Name": "College Y", "ParentID": 1},
+    {"ID": 21, "Name": "History", "ParentID": 20},
+    {"ID": 30, "Name": "Orphan", "ParentID": 999},
+]
+
+
+def test_subtree_membership_and_paths():
+    hierarchy = AccountHierarchy(ACCOUNTS)
+
+    assert hierarchy.is_within(11, 10)
+    assert hierarchy.is_within(10, 10)
+    assert not hierarchy.is_within(21, 10)
+    assert not hierarchy.is_within(404, 10)
+    assert sorted(hierarchy.subtree(10)) == [10, 11, 12]
+    assert hierarchy.ancestors(11) == (1, 10)
+    assert hierarchy.path_names(11) == "University > College X > Physics"
+    assert hierarchy.by_code("PHYS")["ID"] == 11
+    assert 30 in hierarchy.roots
+
+
+def test_cycles_are_broken():
+    hierarchy = AccountHierarchy([
+        {"ID": 1, "Name": "A", "ParentID": 2},
+        {"ID": 2, "Name": "B", "ParentID": 1},
+    ])
+
+    assert sorted(hierarchy.order) == [1, 2]
+    assert hierarchy.is_within(2, 1)
+
+
+def test_rollup_totals():
+    rollup = AccountHierarchy(ACCOUNTS).rollup({11: 3, 12: 4, 21: 5, 10: 1})
+
+    assert rollup.total(10) == 8
+    assert rollup.total(1) == 13
+    assert rollup.total(30) == 0
+
+
+def test_manager_caches_and_warm_starts(tmp_path):
+    path = tmp_path / "accounts.json"
+    client = Mock()
+    client.post.return_value = ACCOUNTS
+    manager = AccountManager(client, snapshot_path=path)
+
+    assert manager.is_within(12, 10)
+    assert not manager.is_within(None, 10)
+    client.post.assert_called_once_with("api/accounts/search", json={})
+
+    warm_client = Mock()
+    warm = AccountManager(warm_client, snapshot_path=path)
+    assert warm.hierarchy.is_within(21, 20)
+    warm_client.post.assert_not_called()
+
+    expired = AccountManager(warm_client, ttl=0, snapshot_path=path)
+    warm_client.post.return_value = ACCOUNTS[:2]
+    assert len(expired.hierarchy) == 2
+
+
+def test_failed_refetch_serves_expired_hierarchy():
+    client = Mock()
+    client.post.return_value = ACCOUNTS
+    manager = AccountManager(client, ttl=0, retry_after=60)
+    assert manager.is_within(12, 10)
+
+    client.post.side_effect = RequestError("Service unavailable", status_code=503)
+    assert manager.is_within(12, 10)
+    assert manager.is_within(21, 20)
+    assert client.post.call_count == 2  # one failed refetch, then backing off
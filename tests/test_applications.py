@@ -0,0 +1,60 @@
+from unittest.mock import Mock
+
+import pytest
+
+from teamdynamix.http_client import TeamDynamix
+
+RESPONSES = {
+    "api/applications": [
+        {"AppID": 122, "Name": "IT Help Desk", "AppClass": "TDTickets"},
+        {"AppID": 200, "Name": "Assets", "AppClass": "TDAssets"},
+    ],
+    "api/122/tickets/types": [{"ID": 4713, "Name": "Incident", "CategoryID": 1, "CategoryName": "Support"}],
+    "api/122/tickets/statuses": [{"ID": 28549, "Name": "New"}],
+    "api/tickets/priorities": [{"ID": 864, "Name": "Medium"}],
+    "api/tickets/sources": [{"ID": 1648, "Name": "Email"}],
+    "api/122/tickets/555": {"ID": 555, "AppID": 122, "Title": "Printer jam"},
+}
+
+
+def make_client(name):
+    client = TeamDynamix(base_url=f"https://{name}.teamdynamix.com", username="u", password="p")
+    client.get = Mock(side_effect=lambda endpoint, **kwargs: RESPONSES.get(endpoint, []))
+    client.post = Mock(return_value={"ID": 1, "AppID": 122})
+    return client
+
+
+def test_applications_are_discovered_once():
+    client = make_client("apps")
+    apps = client.tdadmin.applications
+
+    assert [a["AppID"] for a in apps.ticketing()] == [122]
+    assert apps.by_name("assets")["AppID"] == 200
+    assert apps.get(999) is None
+    assert client.get.call_count == 1
+
+
+def test_app_scope_prefetches_reference_data_and_binds_app_id():
+    client = make_client("scope")
+
+    scope = client.app(122)
+    assert scope.ready(timeout=5) and not scope.errors
+    assert client.app(122) is scope
+    assert client.app("122") is scope
+    assert scope.application["Name"] == "IT Help Desk"
+    assert scope.catalog.types.id("Incident") == 4713
+
+    calls = client.get.call_count
+    scope.tickets.get(555)
+    assert client.get.call_args.args[0] == "api/122/tickets/555"
+
+    with pytest.raises(ValueError, match="TypeID 1 is not a type"):
+        scope.tickets.create(TypeID=1, Title="t", AccountID=1, StatusID=28549, PriorityID=864,
+                             RequestorUid="u", Description="d")
+    assert client.get.call_count == calls + 1
+    client.post.assert_not_called()
+
+
+def test_app_scope_rejects_non_integer_id():
+    with pytest.raises(ValueError):
+        make_client("bad").app("help desk", prefetch=False)
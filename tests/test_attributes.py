@@ -0,0 +1,55 @@
+from unittest.mock import Mock
+
+import pytest
+
+from teamdynamix.tdadmin.attributes import AttributeComponent, AttributeManager
+from teamdynamix.tdnext.tickets import Ticket, extract_attributes
+
+
+ATTRIBUTES = [
+    {"ID": 501, "Name": "Building", "Value": "9001", "ValueText": "Kimball",
+     "Choices": [{"ID": 9001, "Name": "Kimball"}, {"ID": 9002, "Name": "Hart"}]},
+    {"ID": 502, "Name": "Asset Tag", "Value": "A-100", "ValueText": None, "Choices": []},
+]
+
+
+def test_ticket_attr_lookup_by_name_and_id():
+    ticket = Ticket.from_dict(None, {"ID": 1, "Attributes": ATTRIBUTES})
+
+    assert ticket.attr["building"] == "Kimball"
+    assert ticket.attr.value("Building") == "9001"
+    assert ticket.attr[502] == "A-100"
+    assert "Room" not in ticket.attr
+    assert ticket.attr is ticket.attr
+    with pytest.raises(KeyError):
+        ticket.attr["Room"]
+
+
+def test_extract_attributes_into_columns():
+    tickets = [
+        Ticket.from_dict(None, {"ID": 1, "Attributes": ATTRIBUTES}),
+        {"ID": 2, "Attributes": [{"ID": 501, "Name": "Building", "Value": "9002", "ValueText": "Hart"}]},
+    ]
+
+    columns = extract_attributes(tickets, ["Building", 502])
+
+    assert columns == {"ID": [1, 2], "Building": ["Kimball", "Hart"], "502": ["A-100", None]}
+
+
+def test_schema_is_cached_and_resolves_choices():
+    client = Mock()
+    client.get.return_value = ATTRIBUTES
+    manager = AttributeManager(client)
+
+    schema = manager.ticket_schema(app_id=122)
+    assert manager.ticket_schema(app_id=122) is schema
+    client.get.assert_called_once_with("api/attributes/custom", params={
+        "componentId": AttributeComponent.TICKET, "appId": 122, "associatedTypeId": 0
+    })
+
+    assert schema.choice_id("building", "HART") == 9002
+    assert schema.build({"Building": "Kimball", "Asset Tag": "A-200"}) == [
+        {"ID": 501, "Value": "9001"}, {"ID": 502, "Value": "A-200"}
+    ]
+    with pytest.raises(KeyError):
+        schema.choice_id("Building", "Library")
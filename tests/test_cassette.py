@@ -0,0 +1,89 @@
+import gzip
+import time
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from scripts import stub_server
+from teamdynamix.cassette import RecordingTransport, ReplayTransport, load_cassette
+from teamdynamix.exceptions import CassetteError, RequestError
+from teamdynamix.http_client import TeamDynamix
+from teamdynamix.transport import RequestsTransport, Response
+
+TICKET = dict(AppID=122, TypeID=4713, Title="Recorded", AccountID=1, StatusID=28549,
+              PriorityID=864, RequestorUid="u", Description="d", validate=False)
+
+
+@pytest.fixture
+def cassette(tmp_path):
+    """Records a short session against the stub server and returns the cassette path."""
+    server = stub_server.serve(seed=1, latency_ms=20)
+    path = tmp_path / "tickets.jsonl.gz"
+    recorder = RecordingTransport(path, RequestsTransport(requests.Session()))
+    client = TeamDynamix(base_url=stub_server.base_url(server), username="recorder",
+                         password="hunter2-secret", use_environment=False, transport=recorder)
+    ticket = client.tickets.create(**TICKET)
+    client.tickets.get(122, ticket.ID)
+    with pytest.raises(RequestError):
+        client.get("api/122/tickets/1")
+    assert client.metrics()["transport"]["recorded"] == 4
+    recorder.close()
+    server.shutdown()
+    return path, ticket.ID, client.token
+
+
+def _replay_client(transport, name):
+    return TeamDynamix(base_url=f"https://{name}.invalid/TDWebApi", username="recorder",
+                       password="another-password", use_environment=False, transport=transport)
+
+
+def test_cassette_is_scrubbed(cassette):
+    path, _, token = cassette
+    raw = gzip.decompress(path.read_bytes()).decode("utf-8")
+
+    assert "hunter2-secret" not in raw
+    assert token not in raw
+    assert "127.0.0.1" not in raw
+    interactions = load_cassette(path)
+    assert [i["request"] for i in interactions][0] == "POST /TDWebApi/api/auth"
+    assert interactions[0]["body"]["password"] == "<scrubbed>"
+
+
+def test_replay_serves_recorded_session_offline(cassette):
+    path, ticket_id, _ = cassette
+    replay = ReplayTransport(path)
+    client = _replay_client(replay, "replay")
+
+    ticket = client.tickets.create(**TICKET)
+    assert ticket.ID == ticket_id
+    assert client.tickets.get(122, ticket_id).Title == "Recorded"
+    with pytest.raises(RequestError) as exc_info:
+        client.get("api/122/tickets/1")
+    assert exc_info.value.status_code == 404
+    with pytest.raises(CassetteError):
+        client.get("api/122/tickets/2")
+    assert replay.metrics() == {"transport": "replay", "served": 4, "unmatched": 1}
+
+
+def test_replay_latency(cassette):
+    path, ticket_id, _ = cassette
+    client = _replay_client(ReplayTransport(path, latency="recorded"), "recorded-latency")
+
+    started = time.perf_counter()
+    client.tickets.get(122, ticket_id)
+    assert time.perf_counter() - started >= 0.04  # auth + get, 20 ms each when recorded
+
+
+def test_invalid_json_body_is_recorded_as_text(tmp_path):
+    inner = Mock()
+    inner.request.return_value = Response(502, b"<html>Bad gateway</html>",
+                                          {"Content-Type": "application/json"})
+    recorder = RecordingTransport(tmp_path / "bad.jsonl", inner)
+
+    assert recorder.request("GET", "https://tdx.invalid/TDWebApi/api/people/x").status_code == 502
+    recorder.close()
+
+    replayed = ReplayTransport(tmp_path / "bad.jsonl").request(
+        "GET", "https://other.invalid/TDWebApi/api/people/x")
+    assert (replayed.status_code, replayed.text) == (502, "<html>Bad gateway</html>")
@@ -0,0 +1,58 @@
+from unittest.mock import Mock
+
+from teamdynamix.tdnext.tickets import ChangeDetector, ChangeType, Ticket, TicketManager
+
+
+def ticket(ticket_id, **fields):
+    return {"ID": ticket_id, "AppID": 122, "StatusID": 28549, "Title": f"Ticket {ticket_id}",
+            "ResponsibleGroupID": 1110, "IsSlaViolated": False, **fields}
+
+
+def test_only_changed_tickets_emit_typed_events(tmp_path):
+    detector = ChangeDetector(str(tmp_path / "fp.db"))
+    created = detector.diff([ticket(1), ticket(2), ticket(3)])
+    assert [c.type for c in created] == [ChangeType.CREATED] * 3
+
+    changes = detector.diff([
+        ticket(1),
+        ticket(2, StatusID=28550, ResponsibleUid="abc"),
+        ticket(3, IsSlaViolated=True),
+    ])
+
+    assert [(c.ticket_id, c.type) for c in changes] == [
+        (2, ChangeType.STATUS_CHANGED), (2, ChangeType.REASSIGNED), (3, ChangeType.SLA_VIOLATED),
+    ]
+    assert (changes[0].old, changes[0].new) == (28549, 28550)
+    assert detector.diff([ticket(1), ticket(2, StatusID=28550, ResponsibleUid="abc")]) == []
+
+
+def test_fingerprints_survive_restart_and_listeners_fire(tmp_path):
+    path = str(tmp_path / "fp.db")
+    ChangeDetector(path).diff([ticket(1)])
+
+    restarted = ChangeDetector(path)
+    seen = []
+    restarted.on(ChangeType.UPDATED, seen.append)
+
+    assert restarted.diff([ticket(1)]) == []
+    restarted.diff([ticket(1, Title="Renamed")])
+    assert [c.ticket_id for c in seen] == [1]
+    assert len(restarted) == 1
+
+
+def test_preview_does_not_commit():
+    detector = ChangeDetector(":memory:")
+    detector.diff([ticket(1)], commit=False)
+    assert len(detector) == 0
+
+
+def test_poll_uses_ticket_search():
+    client = Mock()
+    client.rate_limit_key = "changes-test"
+    client.post.return_value = [ticket(7)]
+    detector = ChangeDetector(":memory:")
+
+    changes = detector.poll(TicketManager(client), 122, StatusIDs=[28549])
+
+    client.post.assert_called_once_with("api/122/tickets/search", json={"StatusIDs": [28549]})
+    assert isinstance(changes[0].ticket, Ticket) and changes[0].type == ChangeType.CREATED
@@ -0,0 +1,91 @@
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from teamdynamix.exceptions import CircuitOpenError, RequestError
+from teamdynamix.http_client import TeamDynamix
+from teamdynamix.utils.circuit_breaker import CircuitBreakerConfig, endpoint_key
+
+
+def make_client(**kwargs):
+    client = TeamDynamix(
+        base_url="https://test.teamdynamix.com",
+        username="test_user",
+        password="test_pass",
+        circuit_breaker=CircuitBreakerConfig(min_calls=2, window=4, open_seconds=60),
+        **kwargs
+    )
+    client.token = "token"
+    client.token_expiration = datetime.now(timezone.utc) + timedelta(hours=1)
+    return client
+
+
+def test_endpoint_key_collapses_ids():
+    assert endpoint_key("get", "api/122/tickets/555/feed?x=1") == "GET api/{id}/tickets/{id}/feed"
+
+
+def test_breaker_opens_after_timeouts_and_fails_fast():
+    client = make_client(timeout=2)
+
+    with patch("requests.request", side_effect=requests.exceptions.Timeout("slow")) as mock_request:
+        for _ in range(2):
+            with pytest.raises(RequestError):
+                client.get("api/122/tickets/1")
+        with pytest.raises(CircuitOpenError) as exc_info:
+            client.get("api/122/tickets/2")
+
+    assert mock_request.call_count == 2
+    assert mock_request.call_args.kwargs["timeout"] == 2
+    assert exc_info.value.retry_after > 0
+    assert client.metrics()["circuit_breakers"]["GET api/{id}/tickets/{id}"]["state"] == "open"
+
+
+def test_client_errors_do_not_trip_breaker():
+    client = make_client()
+    response = Mock(status_code=404, text="missing")
+    response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+
+    with patch("requests.request", return_value=response):
+        for _ in range(3):
+            with pytest.raises(RequestError) as exc_info:
+                client.get("api/people/abc")
+
+    assert exc_info.value.status_code == 404
+    assert client.metrics()["circuit_breakers"]["GET api/people/abc"]["state"] == "closed"
+
+
+def test_fallback_answers_when_backend_fails():
+    cached = {"ID": 1, "Title": "From cache"}
+    client = make_client(fallback=lambda method, endpoint, params: cached if method == "GET" else None)
+
+    with patch("requests.request", side_effect=requests.exceptions.ConnectionError("down")):
+        assert client.get("api/122/tickets/1") == cached
+        with pytest.raises(RequestError):
+            client.post("api/122/tickets", json={})
+
+
+def test_unexpected_error_in_half_open_trial_does_not_wedge_breaker():
+    client = make_client()
+    client._breakers.config = CircuitBreakerConfig(min_calls=2, window=4, open_seconds=0.05)
+    html = Mock(status_code=200, content=b"<html>", text="<html>")
+    html.json.side_effect = ValueError("not JSON")
+    healthy = Mock(status_code=200, content=b"{}")
+    healthy.json.return_value = {"ID": 1}
+
+    with patch("requests.request", side_effect=requests.exceptions.Timeout("slow")):
+        for _ in range(2):
+            with pytest.raises(RequestError):
+                client.get("api/122/tickets/1")
+    time.sleep(0.06)
+    with patch("requests.request", return_value=html):
+        with pytest.raises(ValueError):
+            client.get("api/122/tickets/1")
+    # A local error is not a backend failure: the trial slot is free again
+    assert client.metrics()["circuit_breakers"]["GET api/{id}/tickets/{id}"]["state"] == "half_open"
+    with patch("requests.request", return_value=healthy):
+        assert client.get("api/122/tickets/1") == {"ID": 1}
+
+    assert client.metrics()["circuit_breakers"]["GET api/{id}/tickets/{id}"]["state"] == "closed"
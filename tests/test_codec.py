@@ -0,0 +1,63 @@
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from teamdynamix.http_client import TeamDynamix
+from teamdynamix.tdnext.tickets import Ticket
+from teamdynamix.utils.codec import StdlibCodec, available_codecs, get_codec
+
+
+def make_client(**kwargs):
+    client = TeamDynamix(
+        base_url="https://test.teamdynamix.com",
+        username="test_user",
+        password="test_pass",
+        **kwargs
+    )
+    client.token = "token"
+    client.token_expiration = datetime.now(timezone.utc) + timedelta(hours=1)
+    return client
+
+
+def test_get_codec_defaults_to_stdlib_and_rejects_unknown_names():
+    assert isinstance(get_codec(), StdlibCodec)
+    assert get_codec("auto").name in [n for n, ok in available_codecs().items() if ok]
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+@pytest.mark.parametrize("name", [n for n, ok in available_codecs().items() if ok])
+def test_codecs_roundtrip_ticket_values(name):
+    codec = get_codec(name)
+    created = datetime(2024, 7, 1, 15, 4, 5, tzinfo=timezone.utc)
+
+    decoded = codec.loads(codec.dumps({"Title": "Café", "CreatedDate": created}))
+
+    assert decoded == {"Title": "Café", "CreatedDate": created.isoformat()}
+
+
+def test_large_bodies_are_gzipped_when_enabled():
+    client = make_client(compress_requests=100)
+    response = Mock(status_code=200, content=b'{"ID": 1}')
+    response.json.return_value = {"ID": 1}
+    body = {"Description": "x" * 500}
+
+    with patch("requests.request", return_value=response) as mock_request:
+        client.post("api/122/tickets", json=body)
+        client.post("api/122/tickets", json={"Title": "small"})
+
+    large, small = mock_request.call_args_list
+    assert large.kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(large.kwargs["data"])) == body
+    assert "Content-Encoding" not in small.kwargs["headers"]
+    assert small.kwargs["json"] is None
+    assert "gzip" in small.kwargs["headers"]["Accept-Encoding"]
+
+
+def test_ticket_from_raw_json_bytes():
+    ticket = Ticket.from_dict(None, b'{"ID": 555, "AppID": 122, "Title": "Raw", "Unknown": 1}')
+
+    assert (ticket.ID, ticket.AppID, ticket.Title) == (555, 122, "Raw")
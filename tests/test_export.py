@@ -0,0 +1,84 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from teamdynamix.tdnext.tickets import TicketExporter
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+END = START + timedelta(days=40)
+
+
+class FakeTickets:
+    """Answers ticket searches from an in-memory list, honouring MaxResults."""
+
+    def __init__(self, count, fail_after=None):
+        step = (END - START) / count
+        self.tickets = [
+            {"ID": i, "Title": f"T{i}", "CreatedDate": (START + step * i).strftime("%Y-%m-%dT%H:%M:%SZ")}
+            for i in range(count)
+        ]
+        self.calls = 0
+        self.fail_after = fail_after
+
+    def search(self, app_id, raw=False, **criteria):
+        self.calls += 1
+        if self.fail_after is not None and self.calls > self.fail_after:
+            raise RuntimeError("Connection lost")
+        lower, upper = criteria["CreatedDateFrom"], criteria["CreatedDateTo"]
+        # TDX treats both bounds as inclusive
+        matches = [t for t in self.tickets if lower <= t["CreatedDate"] <= upper]
+        return matches[:criteria["MaxResults"]]
+
+
+def exported_ids(path):
+    ids = []
+    for part in sorted(path.glob("part-*.ndjson")):
+        ids.extend(json.loads(line)["ID"] for line in part.read_text().splitlines())
+    return ids
+
+
+def test_full_shards_are_split_and_every_ticket_exported_once(tmp_path):
+    tickets = FakeTickets(200)
+    exporter = TicketExporter(tickets, 122, tmp_path, start=START, end=END,
+                              shard_days=10, max_results=30, max_workers=3)
+
+    report = exporter.run()
+
+    assert sorted(exported_ids(tmp_path)) == list(range(200))
+    assert report.rows == 200 and report.splits > 0
+    assert not report.truncated
+    assert report.summary()["shard_seconds_max"] >= report.summary()["shard_seconds_p50"]
+
+
+def test_interrupted_export_resumes_from_checkpoint(tmp_path):
+    failing = FakeTickets(100, fail_after=2)
+    with pytest.raises(RuntimeError):
+        TicketExporter(failing, 122, tmp_path, start=START, end=END, shard_days=5,
+                       max_results=1000, max_workers=1).run()
+
+    resumed = FakeTickets(100)
+    report = TicketExporter(resumed, 122, tmp_path, start=START, end=END, shard_days=5,
+                            max_results=1000, max_workers=1).run()
+
+    assert resumed.calls == 8 - 2
+    assert sum(1 for s in report.shards if s.resumed) == 2
+    assert sorted(exported_ids(tmp_path)) == list(range(100))
+
+
+def test_checkpoint_for_other_export_is_rejected(tmp_path):
+    TicketExporter(FakeTickets(10), 122, tmp_path, start=START, end=END).run()
+    with pytest.raises(ValueError):
+        TicketExporter(FakeTickets(10), 123, tmp_path, start=START, end=END).run()
+
+
+def test_full_shard_with_fractional_end_is_truncated_not_split_forever(tmp_path):
+    tickets = FakeTickets(5)
+    for ticket in tickets.tickets:
+        ticket["CreatedDate"] = START.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    report = TicketExporter(tickets, 122, tmp_path, start=START,
+                            end=START + timedelta(seconds=1.5), max_results=2).run()
+
+    assert tickets.calls == 1
+    assert [s.end for s in report.truncated] == [START + timedelta(seconds=1)]
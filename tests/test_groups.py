@@ -0,0 +1,50 @@
+from unittest.mock import Mock
+
+from teamdynamix.exceptions import RequestError
+from teamdynamix.tdadmin.groups import GroupManager
+
+
+def make_manager(members_by_group):
+    client = Mock()
+    client.get.side_effect = lambda endpoint, **kw: [
+        {"UID": uid} for uid in members_by_group[int(endpoint.split("/")[2])]
+    ]
+    return GroupManager(client), client
+
+
+def test_sync_members_sends_only_the_diff():
+    manager, client = make_manager({10: ["AAA", "bbb", "ccc"]})
+
+    result = manager.sync_members(10, ["aaa", "BBB", "ddd", "eee"], batch_size=1)
+
+    assert result.ok
+    assert result.added == ["ddd", "eee"]
+    assert result.removed == ["ccc"]
+    assert result.unchanged == 2
+    # 1 fetch + 2 single-UID add batches + 1 remove batch
+    assert result.calls == 4
+    assert client.post.call_count == 2
+    client.delete.assert_called_once_with("api/groups/10/members", json=["ccc"])
+
+
+def test_sync_members_in_sync_costs_one_call():
+    manager, client = make_manager({10: ["aaa"]})
+
+    result = manager.sync_members(10, ["AAA"])
+
+    assert result.calls == 1
+    assert not result.changed
+    client.post.assert_not_called()
+    client.delete.assert_not_called()
+
+
+def test_sync_many_records_failures_per_group():
+    manager, client = make_manager({1: ["aaa"], 2: []})
+    client.post.side_effect = RequestError("HTTP request failed: 500")
+
+    report = manager.sync_many({1: ["aaa"], 2: ["bbb"]}, max_workers=2)
+
+    assert [r.group_id for r in report.results] == [1, 2]
+    assert report.results[0].ok
+    assert "500" in report.results[1].error
+    assert report.summary()["failed"] == 1
@@ -0,0 +1,72 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from teamdynamix.exceptions import RequestError
+from teamdynamix.tdnext.tickets import Ticket, TicketManager
+
+
+def make_client(delay=0.0, fail=()):
+    client = Mock()
+    client.rate_limit_key = f"hydrate-{id(client)}"
+    client.executor = None
+    calls = []
+    lock = threading.Lock()
+
+    def get(endpoint):
+        with lock:
+            calls.append(endpoint)
+        time.sleep(delay)
+        part = endpoint.rsplit("/", 1)[-1]
+        if part in fail:
+            raise RequestError("Boom", status_code=500)
+        if part.isdigit():
+            return {"ID": int(part), "AppID": 122, "Attachments": [{"ID": "a1", "Name": "log.txt"}]}
+        return [{"ID": 1, "Part": part}]
+
+    client.get.side_effect = get
+    return client, calls
+
+
+def test_hydrate_fetches_parts_concurrently():
+    client, calls = make_client(delay=0.1)
+    ticket = Ticket(_client=client, ID=555, AppID=122)
+
+    started = time.perf_counter()
+    hydrated = ticket.hydrate()
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.3
+    assert sorted(calls) == sorted([
+        "api/122/tickets/555/feed", "api/122/tickets/555/contacts", "api/122/tickets/555/assets",
+        "api/122/tickets/555/tasks", "api/122/tickets/555",
+    ])
+    assert hydrated.feed[0]["Part"] == "feed"
+    assert hydrated.attachments[0]["Name"] == "log.txt"
+    assert hydrated.ID == 555 and hydrated.ok
+    with pytest.raises(TypeError):
+        hydrated.feed[0]["Part"] = "changed"
+
+
+def test_hydrate_many_reuses_cache_and_records_failures():
+    client, calls = make_client(fail=("tasks",))
+    tickets = [Ticket(_client=client, ID=i, AppID=122, Attachments=[]) for i in (1, 2)]
+    cache = {(122, 1, "feed"): [{"ID": 9, "Part": "cached"}]}
+
+    hydrated = TicketManager(client).hydrate_many(tickets, parts=["feed", "tasks", "attachments"],
+                                                  cache=cache)
+
+    assert hydrated[0].feed[0]["Part"] == "cached"
+    assert hydrated[1].feed[0]["Part"] == "feed"
+    assert "api/122/tickets/1/feed" not in calls
+    assert hydrated[0].tasks is None and "tasks" in hydrated[0].errors
+    assert hydrated[0].attachments == ()
+    assert (122, 2, "feed") in cache
+
+
+def test_unknown_part_is_rejected():
+    client, _ = make_client()
+    with pytest.raises(ValueError):
+        Ticket(_client=client, ID=1, AppID=122).hydrate(parts=["history"])
@@ -0,0 +1,47 @@
+from unittest.mock import patch
+
+import pytest
+
+from scripts import load_test, stub_server
+
+
+@pytest.fixture
+def stub():
+    server = stub_server.serve(seed=1)
+    yield server
+    server.shutdown()
+
+
+def test_template_payloads_are_deterministic_and_follow_mix():
+    args = load_test.build_parser().parse_args(["--tickets", "200", "--base-url", "x"])
+    mix = load_test.parse_mix("28549:3,28550:1")
+
+    first = load_test.template_payloads(args, mix, load_test.parse_mix("4713"))
+    second = load_test.template_payloads(args, mix, load_test.parse_mix("4713"))
+
+    assert first == second
+    statuses = [p["StatusID"] for p in first]
+    assert set(statuses) == {28549, 28550}
+    assert statuses.count(28549) > statuses.count(28550)
+
+
+def test_load_run_against_stub_server(stub):
+    summary = load_test.main([
+        "--base-url", stub_server.base_url(stub), "--tickets", "30",
+        "--concurrency", "4", "--no-client-rate-limit", "--json",
+    ])
+
+    assert summary["succeeded"] == 30 and summary["failed"] == 0
+    assert summary["latency_ms"]["p50"] <= summary["latency_ms"]["p99"]
+    assert len(stub.state.tickets) == 30
+
+
+def test_no_client_rate_limit_never_waits_on_the_limiter(stub):
+    with patch("teamdynamix.utils.rate_limiter.time.sleep") as sleep:
+        summary = load_test.main([
+            "--base-url", stub_server.base_url(stub), "--tickets", "130",
+            "--concurrency", "8", "--no-client-rate-limit", "--json",
+        ])
+
+    assert summary["succeeded"] == 130
+    sleep.assert_not_called()
@@ -0,0 +1,78 @@
+from unittest.mock import Mock
+
+from teamdynamix.tdadmin.locations import LocationManager
+
+
+LOCATIONS = [
+    {"ID": 1, "Name": "Kimball Building", "ExternalID": "KIM", "ModifiedDate": "2024-01-01",
+     "Latitude": 43.8187, "Longitude": -111.7837,
+     "Rooms": [{"ID": 11, "Name": "Room 101"}]},
+    {"ID": 2, "Name": "Hart Building", "ExternalID": "HRT", "ModifiedDate": "2024-01-01",
+     "Latitude": 43.8146, "Longitude": -111.7846, "Rooms": []},
+    {"ID": 3, "Name": "Remote Office", "ModifiedDate": "2024-01-01",
+     "Latitude": 40.7608, "Longitude": -111.8910, "Rooms": []},
+]
+
+
+def make_manager(snapshot_path=None):
+    client = Mock()
+    client.post.return_value = LOCATIONS
+    return LocationManager(client, snapshot_path=snapshot_path), client
+
+
+def test_index_lookups_and_ticket_resolution():
+    manager, client = make_manager()
+    index = manager.index
+
+    assert index.by_name("kimball building")["ID"] == 1
+    assert index.by_external_id("HRT")["ID"] == 2
+    assert index.room_by_name(1, "ROOM 101")["ID"] == 11
+    assert manager.resolve({"LocationID": None, "LocationRoomID": 11})[0]["ID"] == 1
+    assert client.post.call_count == 1
+
+
+def test_nearest_location():
+    manager, _ = make_manager()
+
+    location, distance = manager.index.nearest(43.8150, -111.7850)
+
+    assert location["ID"] == 2
+    assert distance < 1
+    assert manager.index.nearest(0, 0, max_km=100) is None
+
+
+def test_snapshot_warm_start_and_incremental_refresh(tmp_path):
+    path = tmp_path / "locations.json"
+    manager, _ = make_manager(snapshot_path=path)
+    assert len(manager.index) == 3
+
+    warm, client = make_manager(snapshot_path=path)
+    client.post.return_value = [
+        {**LOCATIONS[0], "ModifiedDate": "2024-02-01", "Rooms": None},
+        LOCATIONS[1],
+        {"ID": 4, "Name": "New Hall", "ModifiedDate": "2024-02-01"},
+    ]
+    client.get.side_effect = lambda endpoint: {
+        "ID": int(endpoint.rsplit("/", 1)[1]), "Name": "Fetched", "Rooms": []
+    }
+
+    assert len(warm.index) == 3
+    client.post.assert_not_called()
+
+    counts = warm.refresh()
+
+    assert counts == {"added": 1, "updated": 1, "removed": 1}
+    assert sorted(c.args[0] for c in client.get.call_args_list) == [
+        "api/locations/1", "api/locations/4"
+    ]
+    assert warm.index.get(2)["Name"] == "Hart Building"
+
+
+def test_refresh_keeps_listing_row_when_new_location_detail_is_empty():
+    manager, client = make_manager()
+    assert len(manager.index) == 3
+    client.post.return_value = LOCATIONS + [{"ID": 4, "Name": "New Hall", "ModifiedDate": "2024-02-01"}]
+    client.get.side_effect = lambda endpoint: None
+
+    assert manager.refresh()["added"] == 1
+    assert manager.index.get(4)["Name"] == "New Hall"
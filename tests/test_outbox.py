@@ -0,0 +1,95 @@
+from unittest.mock import Mock
+
+import pytest
+
+from teamdynamix.exceptions import CircuitOpenError, RequestError
+from teamdynamix.tdnext.tickets import OutboxStatus, Ticket, TicketOutbox
+
+
+def make_client(create=None):
+    client = Mock()
+    client.tickets.create.side_effect = create or (
+        lambda **fields: Ticket(_client=client, ID=555, AppID=fields["AppID"])
+    )
+    return client
+
+
+def test_create_returns_handle_and_drains(tmp_path):
+    client = make_client()
+
+    with TicketOutbox(client, str(tmp_path / "outbox.db"), backoff=0) as outbox:
+        handle = outbox.create(AppID=122, TypeID=4713, Title="Printer jam")
+        assert handle.result(timeout=5) == {"ID": 555, "AppID": 122}
+        metrics = outbox.metrics()
+
+    client.tickets.create.assert_called_once_with(AppID=122, TypeID=4713, Title="Printer jam")
+    assert metrics["done"] == 1 and metrics["depth"] == 0
+
+
+def test_same_idempotency_key_is_queued_once(tmp_path):
+    client = make_client()
+    outbox = TicketOutbox(client, str(tmp_path / "outbox.db"), start=False)
+
+    first = outbox.create(idempotency_key="intake-42", AppID=122, Title="A")
+    second = outbox.create(idempotency_key="intake-42", AppID=122, Title="A")
+    assert first.key == second.key
+    assert outbox.metrics()["pending"] == 1
+
+    outbox.start()
+    first.result(timeout=5)
+    outbox.close()
+    assert client.tickets.create.call_count == 1
+
+
+def test_server_errors_are_retried_but_timeouts_are_not(tmp_path):
+    calls = []
+
+    def create(**fields):
+        calls.append(fields["Title"])
+        if fields["Title"] == "flaky" and calls.count("flaky") == 1:
+            raise RequestError("Service unavailable", status_code=503)
+        if fields["Title"] == "slow":
+            raise RequestError("Request timed out")
+        return Ticket(_client=None, ID=1, AppID=122)
+
+    with TicketOutbox(make_client(create), str(tmp_path / "outbox.db"), backoff=0) as outbox:
+        flaky = outbox.create(AppID=122, Title="flaky")
+        slow = outbox.create(AppID=122, Title="slow")
+        assert flaky.result(timeout=5)["ID"] == 1
+        with pytest.raises(RequestError):
+            slow.result(timeout=5)
+        assert slow.status == OutboxStatus.UNKNOWN
+
+    assert calls.count("flaky") == 2
+    assert calls.count("slow") == 1
+
+
+def test_queued_writes_survive_restart(tmp_path):
+    path = str(tmp_path / "outbox.db")
+    outbox = TicketOutbox(Mock(), path, start=False)
+    key = outbox.edit({"AppID": 122, "ID": 555}, {"Title": "Renamed"}).key
+    outbox.close()
+
+    client = make_client()
+    client.post.return_value = {"ID": 555, "Title": "Renamed"}
+    with TicketOutbox(client, path) as restarted:
+        assert restarted.handle(key).result(timeout=5) == {"ID": 555, "Title": "Renamed"}
+
+    assert client.post.call_args.kwargs["json"] == {"Title": "Renamed"}
+
+
+def test_open_circuit_keeps_write_pending(tmp_path):
+    calls = []
+
+    def create(**fields):
+        calls.append(fields["Title"])
+        if len(calls) <= 3:
+            raise CircuitOpenError("POST api/{id}/tickets", retry_after=0)
+        return Ticket(_client=None, ID=7, AppID=122)
+
+    with TicketOutbox(make_client(create), str(tmp_path / "outbox.db"), backoff=0,
+                      max_attempts=2) as outbox:
+        handle = outbox.create(AppID=122, Title="queued while open")
+        assert handle.result(timeout=5)["ID"] == 7
+
+    assert len(calls) == 4
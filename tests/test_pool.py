@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from teamdynamix import TeamDynamixPool
+from teamdynamix.utils.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def pool():
+    pool = TeamDynamixPool(max_workers=2)
+    pool.register("east", base_url="https://east.teamdynamix.com", username="u", password="p")
+    pool.register("west", base_url="https://west.teamdynamix.com", beid="b", web_services_key="k")
+    yield pool
+    pool.close()
+
+
+def test_clients_share_session_and_executor(pool, monkeypatch):
+    monkeypatch.setenv("BEID", "env-beid")
+    monkeypatch.setenv("WEB_SERVICES_KEY", "env-key")
+
+    east, west = pool["east"], pool["west"]
+
+    assert pool["east"] is east
+    assert east is not west
+    assert east._http.session is west._http.session is pool.session
+    assert east.executor is west.executor is pool.executor
+    assert east._beid is None  # environment credentials never leak into pooled tenants
+    assert east.rate_limit_key != west.rate_limit_key
+    with pytest.raises(KeyError):
+        pool["north"]
+
+
+def test_idle_clients_are_evicted_and_rebuilt(pool):
+    east = pool["east"]
+    pool.idle_timeout = 0
+
+    assert pool.evict_idle() == ["east"]
+    assert pool.metrics()["active_clients"] == 0
+    assert pool.metrics()["max_workers"] == 2
+    assert pool["east"] is not east
+    assert "east" in pool
+
+
+def test_rate_limits_are_tracked_per_tenant():
+    @RateLimiter(max_calls=1, period=60)
+    def call(manager):
+        return manager._client.rate_limit_key
+
+    east = SimpleNamespace(_client=SimpleNamespace(rate_limit_key="https://east"))
+    west = SimpleNamespace(_client=SimpleNamespace(rate_limit_key="https://west"))
+
+    with patch("teamdynamix.utils.rate_limiter.time.sleep") as sleep:
+        call(east)
+        call(west)
+        sleep.assert_not_called()
+        call(east)
+        sleep.assert_called_once()
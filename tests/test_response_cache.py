@@ -0,0 +1,132 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from teamdynamix.cassette import PLACEHOLDER_TOKEN, ReplayTransport
+from teamdynamix.http_client import TeamDynamix
+from teamdynamix.utils.response_cache import ResponseCache
+
+TICKET = "GET /TDWebApi/api/122/tickets/555"
+AUTH = {"request": "POST /TDWebApi/api/auth", "body": None,
+        "response": {"status": 200, "headers": {}, "text": PLACEHOLDER_TOKEN}}
+
+
+def _ticket(title, status=200, etag=None):
+    headers = {"content-type": "application/json"}
+    if etag:
+        headers["etag"] = etag
+    response = {"status": status, "headers": headers}
+    if status == 200:
+        response["json"] = {"ID": 555, "AppID": 122, "Title": title}
+    return {"request": TICKET, "body": None, "response": response}
+
+
+def _client(name, interactions, cache):
+    replay = ReplayTransport(interactions, match_body=False)
+    client = TeamDynamix(base_url=f"https://{name}.invalid/TDWebApi", username="u", password="p",
+                         use_environment=False, transport=replay, cache=cache)
+    return client, replay
+
+
+def test_hits_and_invalidation_on_write():
+    feed = {"request": "POST /TDWebApi/api/122/tickets/555/feed", "body": None,
+            "response": {"status": 200, "headers": {"content-type": "application/json"},
+                         "json": {"ID": 1}}}
+    client, replay = _client("cache-hits", [AUTH, _ticket("Before"), feed, _ticket("After")],
+                             ResponseCache(ttl=60))
+
+    assert client.get("api/122/tickets/555")["Title"] == "Before"
+    assert client.get("api/122/tickets/555")["Title"] == "Before"
+    client.post("api/122/tickets/555/feed", json={"Comments": "hi"})
+    assert client.get("api/122/tickets/555")["Title"] == "After"
+
+    assert replay.metrics()["served"] == 4
+    metrics = client.metrics()["cache"]
+    assert (metrics["hits"], metrics["misses"], metrics["invalidated"]) == (1, 2, 1)
+
+
+def test_expired_entry_revalidates_with_etag():
+    cache = ResponseCache(ttl=60, policies={"api/{id}/tickets/{id}": 0.05})
+    client, _ = _client("cache-etag", [AUTH, _ticket("Cached", etag='"v1"'),
+                                       _ticket(None, status=304)], cache)
+
+    first = client.get("api/122/tickets/555")
+    time.sleep(0.06)
+    assert client.get("api/122/tickets/555") == first
+    assert cache.metrics()["revalidated"] == 1
+    assert client.get("api/122/tickets/555") == first  # renewed, so fresh again
+    assert cache.metrics()["hits"] == 1
+
+
+def test_stale_entry_answers_backend_failure():
+    cache = ResponseCache(ttl=0.05, stale_if_error=True)
+    client, _ = _client("cache-stale", [AUTH, _ticket("Cached"), _ticket(None, status=503)], cache)
+
+    client.get("api/122/tickets/555")
+    time.sleep(0.06)
+    assert client.get("api/122/tickets/555")["Title"] == "Cached"
+    assert cache.metrics()["stale_served"] == 1
+
+
+@pytest.mark.parametrize("on_disk", [False, True])
+def test_lru_eviction_by_bytes(tmp_path, on_disk):
+    path = tmp_path / "responses.sqlite3" if on_disk else None
+    cache = ResponseCache(ttl=60, max_bytes=250, path=path)
+    for n in range(3):
+        cache.store(f"key-{n}", f"api/people/{n}", b"x" * 100, {})
+    cache.get("key-1")
+    cache.store("key-3", "api/people/3", b"x" * 100, {})
+
+    assert [cache.get(f"key-{n}") is not None for n in range(4)] == [False, True, False, True]
+    assert cache.metrics()["bytes"] == 200
+    assert cache.metrics()["evictions"] == 2
+    if on_disk:
+        assert ResponseCache(path=path, max_bytes=250).get("key-3").content == b"x" * 100
+
+
+def test_ttl_policies():
+    cache = ResponseCache(ttl=30, policies={"api/{id}/tickets/{id}/feed": 300,
+                                            "api/people/*": 3600, "api/{id}/tickets/search": 0})
+
+    assert cache.ttl_for("api/122/tickets/555/feed") == 300
+    assert cache.ttl_for("api/people/7e8a4f2c-1a2b-4c3d-8e9f-0a1b2c3d4e5f") == 3600
+    assert cache.ttl_for("api/122/tickets/555") == 30
+    cache.store("search", "api/122/tickets/search", b"[]", {})
+    assert cache.get("search") is None
+
+
+@pytest.mark.parametrize("on_disk", [False, True])
+def test_invalidate_drops_path_ancestors_and_subtree_only(tmp_path, on_disk):
+    cache = ResponseCache(ttl=60, path=tmp_path / "responses.sqlite3" if on_disk else None)
+    for path in ("api/122/tickets/555", "api/122/tickets/555/feed", "api/122/tickets/5551",
+                 "api/122", "api/people/x"):
+        cache.store(path, path, b"{}", {})
+
+    assert cache.invalidate("api/122/tickets/555") == 3
+    assert [p for p in ("api/122/tickets/5551", "api/people/x") if cache.get(p)] == \
+        ["api/122/tickets/5551", "api/people/x"]
+
+
+def test_search_posts_do_not_invalidate():
+    search = {"request": "POST /TDWebApi/api/122/tickets/search", "body": None,
+              "response": {"status": 200, "headers": {"content-type": "application/json"},
+                           "json": []}}
+    client, _ = _client("cache-search", [AUTH, _ticket("Cached"), search], ResponseCache(ttl=60))
+
+    client.get("api/122/tickets/555")
+    client.post("api/122/tickets/search", json={})
+    client.get("api/122/tickets/555")
+    assert client.metrics()["cache"]["hits"] == 1
+    assert client.metrics()["cache"]["invalidated"] == 0
+
+
+def test_cached_manager_reads_take_no_rate_limit_slot():
+    client, replay = _client("cache-limits", [AUTH, _ticket("Cached")], ResponseCache(ttl=60))
+
+    with patch("teamdynamix.utils.rate_limiter.time.sleep") as sleep:
+        titles = {client.tickets.get(122, 555).Title for _ in range(100)}
+
+    assert titles == {"Cached"}
+    sleep.assert_not_called()
+    assert replay.metrics()["served"] == 2
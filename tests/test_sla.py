@@ -0,0 +1,76 @@
+from datetime import date, datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from teamdynamix.tdadmin.daysoff import BusinessCalendar, DaysOffManager
+from teamdynamix.tdnext.tickets.sla import SlaEngine
+
+# 2024-07-01 is a Monday; 2024-07-04 is a holiday
+CALENDAR = BusinessCalendar.from_hours("08:00", "17:00", holidays=["2024-07-04"])
+
+
+def minutes(engine, start, end):
+    return engine.business_minutes(engine.to_local([start]), engine.to_local([end]))[0]
+
+
+def test_business_minutes_clip_hours_weekends_and_holidays():
+    engine = SlaEngine(CALENDAR)
+
+    assert minutes(engine, "2024-07-01T09:00:00Z", "2024-07-01T10:30:00Z") == 90
+    assert minutes(engine, "2024-07-01T06:00:00Z", "2024-07-01T20:00:00Z") == 540
+    # Wed 16:00 -> Fri 09:00 skips the Thursday holiday
+    assert minutes(engine, "2024-07-03T16:00:00Z", "2024-07-05T09:00:00Z") == 120
+    # Fri 16:00 -> Mon 09:00 skips the weekend
+    assert minutes(engine, "2024-07-05T16:00:00Z", "2024-07-08T09:00:00Z") == 120
+    assert minutes(engine, "2024-07-01T10:30:00Z", "2024-07-01T09:00:00Z") == -90
+    assert np.isnan(minutes(engine, None, "2024-07-01T09:00:00Z"))
+
+
+def test_timezone_conversion():
+    engine = SlaEngine(BusinessCalendar(timezone="America/Denver"))
+
+    # 15:00Z and 17:00Z are 09:00 and 11:00 in Denver (MDT)
+    assert minutes(engine, "2024-07-01T15:00:00Z", "2024-07-01T17:00:00Z") == 120
+
+
+def test_evaluate_flags_breaches_and_risk():
+    engine = SlaEngine(CALENDAR)
+    tickets = [
+        {"ID": 1, "RespondByDate": "2024-07-01T12:00:00Z", "ResolveByDate": "2024-07-02T12:00:00Z"},
+        {"ID": 2, "RespondByDate": "2024-07-01T10:30:00Z", "ResolveByDate": "2024-07-03T12:00:00Z"},
+        {"ID": 3, "ResolveByDate": "2024-07-01T09:00:00Z", "IsOnHold": True,
+         "PlacedOnHoldDate": "2024-07-01T08:30:00Z"},
+        {"ID": 4, "RespondByDate": "2024-07-01T09:00:00Z", "RespondedDate": "2024-07-01T08:45:00Z"},
+    ]
+
+    report = engine.evaluate(tickets, now=datetime(2024, 7, 1, 11, 0, tzinfo=timezone.utc))
+
+    assert report.respond_remaining[0] == 60
+    assert report.breached_ids() == [2]
+    assert report.at_risk_ids() == []
+    assert report.resolve_remaining[2] == 30  # frozen while on hold
+    assert not report.respond_pending[3] and report.respond_remaining[3] == 15
+
+    late = engine.evaluate(tickets, now=datetime(2024, 7, 1, 11, 30, tzinfo=timezone.utc),
+                           at_risk_minutes=45)
+    assert late.at_risk_ids() == [1]
+
+
+def test_days_off_calendar_is_cached():
+    client = Mock()
+    client.get.return_value = [
+        {"Date": "2024-12-25T00:00:00Z"},
+        {"StartDate": "2024-12-30", "EndDate": "2024-12-31"},
+    ]
+    manager = DaysOffManager(client, "api/custom/daysoff")
+
+    calendar = manager.calendar(years=[2024])
+    manager.calendar(years=[2024])
+
+    assert client.get.call_count == 1
+    assert client.get.call_args.args[0] == "api/custom/daysoff"
+    assert calendar.holidays == {date(2024, 12, 25), date(2024, 12, 30), date(2024, 12, 31)}
+    assert not calendar.is_business_day("2024-12-30")
@@ -0,0 +1,88 @@
+from unittest.mock import Mock
+
+import pytest
+
+from teamdynamix.exceptions import CircuitOpenError, RequestError
+from teamdynamix.tdadmin.time import TimeManager
+
+
+def entries(n):
+    return [{"Uid": "u1", "Minutes": i + 1} for i in range(n)]
+
+
+def test_add_entries_uses_full_batches():
+    client = Mock()
+    client.post.side_effect = lambda endpoint, json: {"Succeeded": json, "Failed": []}
+
+    report = TimeManager(client).add_entries(iter(entries(120)), max_workers=2)
+
+    assert report.ok
+    assert report.submitted == 120
+    assert len(report.succeeded) == 120
+    assert sorted(len(c.kwargs["json"]) for c in client.post.call_args_list) == [20, 50, 50]
+
+
+def test_partial_failure_retries_only_failed_entries():
+    client = Mock()
+    client.post.side_effect = [
+        {"Succeeded": entries(1), "Failed": [{"Index": 1, "ErrorMessage": "Locked"}]},
+        {"Succeeded": [], "Failed": [{"Index": 0, "ErrorMessage": "Still locked"}]},
+    ]
+
+    report = TimeManager(client).add_entries(entries(2), max_retries=1)
+
+    assert client.post.call_args_list[1].kwargs["json"] == [{"Uid": "u1", "Minutes": 2}]
+    assert [f.message for f in report.failed] == ["Still locked"]
+    assert report.calls == 2
+
+
+def test_rejected_batch_is_split_to_isolate_bad_entry():
+    def post(endpoint, json):
+        if any(e["Minutes"] == 3 for e in json):
+            raise RequestError("HTTP request failed: 400", status_code=400)
+        return {"Succeeded": json, "Failed": []}
+
+    client = Mock()
+    client.post.side_effect = post
+
+    report = TimeManager(client).add_entries(entries(4), max_retries=0)
+
+    assert len(report.succeeded) == 3
+    assert [f.entry["Minutes"] for f in report.failed] == [3]
+
+
+def test_batch_size_is_capped():
+    with pytest.raises(ValueError):
+        TimeManager(Mock()).add_entries(entries(1), batch_size=51)
+
+
+def test_server_errors_retry_whole_batch_and_timeouts_are_not_resubmitted():
+    client = Mock()
+    client.post.side_effect = [
+        RequestError("Service unavailable", status_code=503),
+        {"Succeeded": entries(4), "Failed": []},
+        RequestError("Request timed out"),
+    ]
+    manager = TimeManager(client)
+
+    report = manager.add_entries(entries(4), max_retries=1, backoff=0)
+    assert len(report.succeeded) == 4
+    assert [len(c.kwargs["json"]) for c in client.post.call_args_list] == [4, 4]
+
+    report = manager.add_entries(entries(4), max_retries=1, backoff=0)
+    assert client.post.call_count == 3
+    assert len(report.unknown) == 4 and not report.ok
+
+
+def test_open_circuit_retries_batch_without_spending_an_attempt():
+    client = Mock()
+    client.post.side_effect = [
+        CircuitOpenError("POST api/time", retry_after=0),
+        {"Succeeded": entries(1), "Failed": [{"ErrorMessage": "Bad row"}]},
+    ]
+
+    report = TimeManager(client).add_entries(entries(2), max_retries=0, backoff=0)
+
+    assert client.post.call_count == 2 and report.calls == 1
+    assert len(report.succeeded) == 1 and not report.unknown
+    assert [f.message for f in report.failed] == ["Bad row"]
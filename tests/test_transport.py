@@ -0,0 +1,67 @@
+import pytest
+import requests
+
+from scripts import stub_server
+from teamdynamix.exceptions import RequestError
+from teamdynamix.http_client import TeamDynamix
+from teamdynamix.transport import HttpxTransport, RequestsTransport, Response
+
+
+@pytest.fixture
+def stub():
+    server = stub_server.serve(seed=1)
+    yield server
+    server.shutdown()
+
+
+def test_response_raises_requests_http_error():
+    response = Response(404, b'{"Message": "missing"}', {"content-type": "application/json"})
+
+    assert response.json() == {"Message": "missing"}
+    assert response.headers["Content-Type"] == "application/json"
+    with pytest.raises(requests.exceptions.HTTPError) as exc_info:
+        response.raise_for_status()
+    assert exc_info.value.response is response
+
+
+@pytest.mark.parametrize("kind", ["requests", "httpx"])
+def test_transports_drive_the_client(stub, kind):
+    if kind == "httpx":
+        pytest.importorskip("httpx")
+        transport = HttpxTransport(http2=True)
+    else:
+        transport = RequestsTransport(requests.Session())
+    client = TeamDynamix(base_url=stub_server.base_url(stub), username="u", password="p",
+                         use_environment=False, transport=transport)
+
+    ticket = client.tickets.create(AppID=122, TypeID=4713, Title="Over the wire", AccountID=1,
+                                   StatusID=28549, PriorityID=864, RequestorUid="u",
+                                   Description="d", validate=False)
+    assert client.tickets.get(122, ticket.ID).Title == "Over the wire"
+    with pytest.raises(RequestError) as exc_info:
+        client.get("api/122/tickets/1")
+    assert exc_info.value.status_code == 404
+    assert client.metrics()["transport"]["transport"] == transport.name
+    transport.close()
+
+
+def test_httpx_follows_redirects_and_maps_all_errors():
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        if request.url.path == "/old":
+            return httpx.Response(301, headers={"Location": "/new"})
+        if request.url.path == "/loop":
+            return httpx.Response(302, headers={"Location": "/loop"})
+        if request.url.path == "/garbled":
+            return httpx.Response(200, headers={"Content-Encoding": "gzip"}, content=b"not gzip")
+        return httpx.Response(200, json={"ok": True})
+
+    transport = HttpxTransport(client=httpx.Client(transport=httpx.MockTransport(handler),
+                                                   follow_redirects=True))
+    assert transport.request("GET", "https://tdx.invalid/old").json() == {"ok": True}
+    with pytest.raises(requests.exceptions.TooManyRedirects):
+        transport.request("GET", "https://tdx.invalid/loop")
+    with pytest.raises(requests.exceptions.RequestException):
+        transport.request("GET", "https://tdx.invalid/garbled")
+    assert HttpxTransport(http2=False).client.follow_redirects
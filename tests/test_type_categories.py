@@ -0,0 +1,78 @@
+from unittest.mock import Mock
+
+import pytest
+
+from teamdynamix.http_client import TeamDynamix
+from teamdynamix.tdadmin.type_categories import TypeCategoryManager
+
+RESPONSES = {
+    "api/122/tickets/types": [
+        {"ID": 4713, "Name": "Incident", "CategoryID": 10, "CategoryName": "Support", "IsActive": True},
+        {"ID": 4714, "Name": "Request", "CategoryID": 10, "CategoryName": "Support", "IsActive": True},
+        {"ID": 4715, "Name": "Legacy", "CategoryID": 11, "CategoryName": "Old", "IsActive": False},
+    ],
+    "api/122/tickets/statuses": [{"ID": 28549, "Name": "New", "IsActive": True}],
+    "api/tickets/priorities": [{"ID": 864, "Name": "Medium", "IsActive": True}],
+    "api/tickets/sources": [{"ID": 1648, "Name": "Email", "IsActive": True}],
+}
+
+
+def make_client():
+    client = Mock()
+    client.rate_limit_key = f"types-{id(client)}"
+    client.executor = None
+    client.get.side_effect = lambda endpoint: RESPONSES[endpoint]
+    return client
+
+
+def test_catalog_indexes_types_categories_and_names():
+    manager = TypeCategoryManager(make_client())
+
+    catalog = manager.catalog(122)
+
+    assert catalog.types.id("incident") == 4713
+    assert catalog.categories == {10: "Support", 11: "Old"}
+    assert [t["ID"] for t in catalog.types_in_category("support")] == [4713, 4714]
+    assert catalog.validate({"TypeID": 4715, "StatusID": 1, "PriorityID": 864}) == [
+        "TypeID 4715 (Legacy) is inactive",
+        "StatusID 1 is not a status of application 122",
+    ]
+    assert manager.catalog(122) is catalog
+
+
+def test_snapshot_warm_start_needs_no_calls(tmp_path):
+    path = tmp_path / "catalog.json"
+    TypeCategoryManager(make_client(), snapshot_path=path).catalog(122)
+
+    client = make_client()
+    warm = TypeCategoryManager(client, snapshot_path=path)
+
+    assert warm.peek(122).statuses.id("New") == 28549
+    assert warm.peek(123) is None
+    client.get.assert_not_called()
+
+
+def test_create_validates_against_loaded_catalog():
+    client = TeamDynamix(base_url="https://test.teamdynamix.com", username="u", password="p")
+    client.tdadmin.type_categories = TypeCategoryManager(make_client())
+    client.tdadmin.type_categories.catalog(122)
+    client.post = Mock()
+
+    with pytest.raises(ValueError, match="PriorityID 1 is not a priority"):
+        client.tickets.create(AppID=122, TypeID=4713, Title="t", AccountID=1, StatusID=28549,
+                              PriorityID=1, RequestorUid="u", Description="d")
+    client.post.assert_not_called()
+
+
+def test_create_rechecks_an_old_catalog_before_rejecting():
+    api = make_client()
+    client = TeamDynamix(base_url="https://recheck.teamdynamix.com", username="u", password="p")
+    client.tdadmin.type_categories = TypeCategoryManager(api, recheck_after=0)
+    client.tdadmin.type_categories.catalog(122)
+    client.post = Mock(return_value={"ID": 1, "AppID": 122})
+    statuses = RESPONSES["api/122/tickets/statuses"] + [{"ID": 30000, "Name": "Waiting", "IsActive": True}]
+    api.get.side_effect = lambda endpoint: statuses if endpoint.endswith("statuses") else RESPONSES[endpoint]
+
+    client.tickets.create(AppID=122, TypeID=4713, Title="t", AccountID=1, StatusID=30000,
+                          PriorityID=864, RequestorUid="u", Description="d")
+    client.post.assert_called_once()
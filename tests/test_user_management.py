@@ -0,0 +1,77 @@
+import io
+import zipfile
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import requests
+
+from teamdynamix.exceptions import RequestError
+from teamdynamix.http_client import TeamDynamix
+from teamdynamix.tdadmin.user_management import UserManager
+
+
+CSV = """Username,First Name,Last Name,Primary Email
+jdoe,Jane,Doe,jdoe@example.edu
+,Missing,Username,x@example.edu
+bsmith,Bob,Smith,bsmith@example.edu
+ajones,Ann,Jones,ajones@example.edu
+"""
+
+
+def test_import_people_streams_workbooks_and_reports_bad_rows():
+    client = Mock()
+    manager = UserManager(client)
+
+    report = manager.import_people(io.StringIO(CSV), chunk_size=2, max_workers=1)
+
+    assert report.rows == 4
+    assert report.chunks == 2
+    assert report.calls == 2
+    assert [(e.row, e.message) for e in report.errors] == [
+        (2, "Missing required column(s): Username")
+    ]
+    name, workbook, _ = client.post.call_args_list[0].kwargs["files"]["file"]
+    assert name.endswith(".xlsx")
+    sheet = zipfile.ZipFile(io.BytesIO(workbook)).read("xl/worksheets/sheet1.xml").decode()
+    assert "Primary Email" in sheet and "jdoe@example.edu" in sheet
+
+
+def test_bulk_resumes_from_progress_file(tmp_path):
+    client = Mock()
+    client.post.side_effect = [None, RequestError("HTTP request failed: 500"), None]
+    manager = UserManager(client)
+    progress = tmp_path / "progress.json"
+    uids = ["u1", "u2", "u3", "u4"]
+
+    first = manager.bulk("change_status", uids, chunk_size=2, max_workers=1,
+                         progress=progress, is_active=False)
+    assert [e.key for e in first.errors] == ["u3", "u4"]
+
+    second = manager.bulk("change_status", uids, chunk_size=2, max_workers=1,
+                          progress=progress, is_active=False)
+    assert second.ok
+    assert second.skipped_chunks == 1
+    assert client.post.call_args.kwargs["json"] == ["u3", "u4"]
+    assert client.post.call_args.kwargs["params"] == {"isActive": "false"}
+
+
+def test_upload_import_sends_multipart_content_type():
+    client = TeamDynamix(base_url="https://upload.teamdynamix.com", username="u", password="p",
+                         use_environment=False)
+    client.token = "token"
+    client.token_expiration = datetime.now(timezone.utc) + timedelta(hours=1)
+    prepared = []
+
+    def send(method, url, **kwargs):
+        kwargs.pop("timeout")
+        prepared.append(requests.Request(method, url, **kwargs).prepare())
+        response = Mock(status_code=200, content=b"{}")
+        response.json.return_value = {}
+        return response
+
+    with patch("requests.request", side_effect=send):
+        UserManager(client).upload_import(b"PK\x03\x04workbook")
+
+    content_type = prepared[0].headers["Content-Type"]
+    assert content_type.startswith("multipart/form-data; boundary=")
+    assert content_type.split("boundary=")[1].encode() in prepared[0].body